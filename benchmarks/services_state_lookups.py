@@ -0,0 +1,80 @@
+"""
+ServicesComposeState lookups and equality: indexed vs linear scans.
+
+    PYTHONPATH=. python benchmarks/services_state_lookups.py [containers]
+"""
+import random
+import sys
+import timeit
+
+from maxwelld.core.compose_data_types import ComposeHealth
+from maxwelld.core.compose_data_types import ComposeState
+from maxwelld.core.compose_data_types import ServiceComposeState
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.helpers.labels import Label
+
+SERVICES_PER_ENV = 10
+
+
+def make_services(containers: int) -> list[ServiceComposeState]:
+    return [
+        ServiceComposeState(
+            name=f'service-{i % SERVICES_PER_ENV}-{i // SERVICES_PER_ENV}',
+            state=ComposeState.RUNNING,
+            exit_code=0,
+            health=ComposeHealth.HEALTHY,
+            status='Up 5 minutes (healthy)',
+            labels={
+                Label.ENV_ID: f'env-{i // SERVICES_PER_ENV}',
+                Label.REQUEST_ENV_NAME: f'request-{i // SERVICES_PER_ENV}',
+            },
+        )
+        for i in range(containers)
+    ]
+
+
+def linear_get_any_for(services: list[ServiceComposeState], label: str, value) -> ServiceComposeState | None:
+    for service_state in services:
+        if service_state.check(label, value):
+            return service_state
+    return None
+
+
+def linear_eq(services: list[ServiceComposeState], other: list[ServiceComposeState]) -> bool:
+    return all(state in other for state in services) and all(state in services for state in other)
+
+
+def main(containers: int = 1000, lookups: int = 1000):
+    services = make_services(containers)
+    shuffled = random.sample(services, len(services))
+    env_ids = [f'env-{random.randrange(containers // SERVICES_PER_ENV)}' for _ in range(lookups)]
+
+    def linear_lookups():
+        for env_id in env_ids:
+            linear_get_any_for(services, Label.ENV_ID, env_id)
+
+    def indexed_lookups():
+        state = ServicesComposeState.make_new_from_services(services)
+        for env_id in env_ids:
+            state.get_any_for(Label.ENV_ID, env_id)
+
+    def linear_equality():
+        linear_eq(services, shuffled)
+
+    def indexed_equality():
+        assert (ServicesComposeState.make_new_from_services(services)
+                == ServicesComposeState.make_new_from_services(shuffled))
+
+    print(f'{containers} containers')
+    for name, linear, indexed in [
+        (f'{lookups} get_any_for(env_id)', linear_lookups, indexed_lookups),
+        ('__eq__ of shuffled states', linear_equality, indexed_equality),
+    ]:
+        linear_s = min(timeit.repeat(linear, number=1, repeat=3))
+        indexed_s = min(timeit.repeat(indexed, number=1, repeat=3))
+        print(f'  {name:30} linear {linear_s * 1000:9.2f}ms  indexed {indexed_s * 1000:9.2f}ms  '
+              f'x{linear_s / indexed_s:.0f}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,85 @@
+"""
+Compose ps output parsing: eager labels dict vs raw labels with on-demand single label parsing.
+
+    PYTHONPATH=. python benchmarks/services_state_parsing.py [containers]
+"""
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.compose_data_types import parse_labels
+from maxwelld.helpers.bytes_pickle import base64_encode
+from maxwelld.helpers.labels import Label
+
+SERVICES_PER_ENV = 10
+ENV_CONFIG_SIZE = 16 * 1024
+
+
+def make_compose_ps_output(containers: int) -> str:
+    env_configs = {}
+    lines = []
+    for i in range(containers):
+        env_id = f'env-{i // SERVICES_PER_ENV}'
+        if env_id not in env_configs:
+            env_configs[env_id] = base64_encode(os.urandom(ENV_CONFIG_SIZE))
+        labels = {
+            'com.docker.compose.project': 'maxwelld',
+            'com.docker.compose.service': f'service-{i % SERVICES_PER_ENV}-{env_id}',
+            Label.ENV_ID: env_id,
+            Label.REQUEST_ENV_NAME: f'request-{env_id}',
+            Label.COMPOSE_FILES: 'docker-compose.yml:docker-compose.dev.yml',
+            Label.ENV_CONFIG_TEMPLATE: env_configs[env_id],
+            Label.ENV_CONFIG: env_configs[env_id],
+        }
+        lines.append(json.dumps({
+            'Service': labels['com.docker.compose.service'],
+            'State': 'running',
+            'ExitCode': 0,
+            'Health': 'healthy',
+            'Status': 'Up 5 minutes (healthy)',
+            'Labels': ','.join(f'{k}={v}' for k, v in labels.items()),
+        }))
+    return '\n'.join(lines)
+
+
+def eager_parse(output: str) -> list[tuple[str, dict[str, str]]]:
+    parsed = []
+    for line in output.split('\n'):
+        status = json.loads(line)
+        labels = parse_labels(status['Labels'])
+        parsed.append((status['Service'], labels))
+        labels.get(Label.ENV_ID)
+    return parsed
+
+
+def lazy_parse(output: str) -> ServicesComposeState:
+    state = ServicesComposeState(output)
+    for service_state in state:
+        service_state.get_label(Label.ENV_ID)
+    return state
+
+
+def measure_memory(parse, output: str) -> tuple[int, int]:
+    tracemalloc.start()
+    parsed = parse(output)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return retained, peak
+
+
+def main(containers: int = 1000):
+    output = make_compose_ps_output(containers)
+    print(f'{containers} containers, ps output {len(output) / 1024 / 1024:.1f}MB')
+    for name, parse in [('eager labels dict', eager_parse), ('lazy labels', lazy_parse)]:
+        parse_s = min(timeit.repeat(lambda: parse(output), number=1, repeat=3))
+        retained, peak = measure_memory(parse, output)
+        print(f'  {name:20} {parse_s * 1000:9.2f}ms  '
+              f'retained {retained / 1024 / 1024:7.1f}MB  peak {peak / 1024 / 1024:7.1f}MB')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
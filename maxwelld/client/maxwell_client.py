@@ -1,105 +1,512 @@
+import asyncio
+import json
+import time
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+
 import aiohttp
 from aiohttp import ClientConnectorError
 from rtry import retry
 
+from maxwelld.client.types import ClientTimeouts
+from maxwelld.client.types import EnvState
 from maxwelld.client.types import EnvironmentId
+from maxwelld.client.types import ExecLogs
 from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.readiness import ReadinessResult
+from maxwelld.core.sequence_run_types import EMPTY_ID
+from maxwelld.core.state_diff import ServiceTransition
+from maxwelld.core.up_jobs import UpJobStatus
+from maxwelld.core.utils.compose_logs import ComposeLogLine
+from maxwelld.core.utils.exec_output import ExecExit
+from maxwelld.core.utils.exec_output import ExecOutput
+from maxwelld.core.utils.exec_output import exec_event_from_json
 from maxwelld.errors.up import ServicesUpError
 from maxwelld.env_description.env_types import Environment
+from maxwelld.helpers.bytes_pickle import base64_encode
 from maxwelld.helpers.bytes_pickle import base64_pickled
 from maxwelld.helpers.bytes_pickle import debase64_pickled
+from maxwelld.helpers.exec_record import ExecStatus
+from maxwelld.helpers.wire_format import decode_wire
+from maxwelld.helpers.wire_format import encode_wire
+from maxwelld.helpers.wire_format import environment_as_wire
+from maxwelld.helpers.wire_format import environment_from_wire
+from maxwelld.helpers.wire_format import get_wire_content_types
+from maxwelld.helpers.wire_format import is_wire_content_type
+from maxwelld.helpers.wire_format import service_transition_from_wire
+from maxwelld.helpers.wire_format import services_state_from_wire
 from maxwelld.server.commands import DC_EXEC_PATH
+from maxwelld.server.commands import DC_EXEC_STREAM_PATH
+from maxwelld.server.commands import DC_GET_EXEC_LOGS_PATH
 from maxwelld.server.commands import DC_LOGS_PATH
+from maxwelld.server.commands import DC_LOGS_STREAM_PATH
+from maxwelld.server.commands import DC_UP_JOB_PATH
 from maxwelld.server.commands import DC_UP_PATH
 from maxwelld.server.commands import ENV_PATH
+from maxwelld.server.commands import ENV_STATE_PATH
 from maxwelld.server.commands import HEALTHCHECK_PATH
 from maxwelld.server.commands import STATUS_PATH
+from maxwelld.server.commands import WAIT_PATH
 from maxwelld.server.handlers.dc_exec import DcExecRequestParams
 from maxwelld.server.handlers.dc_exec import DcExecResponseParams
+from maxwelld.server.handlers.dc_exec_logs import DcExecLogsRequestParams
+from maxwelld.server.handlers.dc_exec_stream import DcExecStreamRequestParams
 from maxwelld.server.handlers.dc_logs import DcLogsRequestParams
+from maxwelld.server.handlers.dc_logs_stream import DcLogsStreamRequestParams
+from maxwelld.server.handlers.dc_up import UpJobResponseParams
+from maxwelld.server.handlers.dc_up_job import DcUpJobRequestParams
 from maxwelld.server.handlers.env import EnvRequestParams
 from maxwelld.server.handlers.env import EnvResponseParams
+from maxwelld.server.handlers.env_state import EnvStateRequestParams
+from maxwelld.server.handlers.env_state import EnvStateResponseParams
 from maxwelld.server.handlers.status import StatusResponseParams
 from maxwelld.server.handlers.up import UpRequestParams
 from maxwelld.server.handlers.up import UpResponseParams
+from maxwelld.server.handlers.wait import EVENT_STREAM_CONTENT_TYPE
+from maxwelld.server.handlers.wait import WaitRequestParams
+from maxwelld.server.handlers.wait import WaitResponseParams
+
+# network slack over server side wait timeout
+WAIT_RESPONSE_TIMEOUT_MARGIN = 30
+# server side long-poll of up job progress
+UP_JOB_POLL_TIMEOUT = 30
+UP_JOB_POLL_ERRORS_LIMIT = 10
+
+
+class ClientConnectionsStats:
+    def __init__(self):
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.not_modified = 0
+
+    async def on_request_start(self, session, context, params) -> None:
+        self.requests += 1
+
+    async def on_request_end(self, session, context, params) -> None:
+        if params.response.status == 304:
+            self.not_modified += 1
+
+    async def on_connection_create_end(self, session, context, params) -> None:
+        self.connections_created += 1
+
+    async def on_connection_reuseconn(self, session, context, params) -> None:
+        self.connections_reused += 1
+
+    def make_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self.on_request_start)
+        trace_config.on_request_end.append(self.on_request_end)
+        trace_config.on_connection_create_end.append(self.on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self.on_connection_reuseconn)
+        return trace_config
+
+    def as_json(self) -> dict[str, int]:
+        return {
+            'requests': self.requests,
+            'connections_created': self.connections_created,
+            'connections_reused': self.connections_reused,
+            'not_modified': self.not_modified,
+        }
 
 
 class MaxwellDemonClient:
-    def __init__(self, host, port=80):
+    """
+    Keeps keep-alive connections pool for all calls; use as async context manager or close() when done
+    """
+
+    def __init__(self, host, port=80, connections_limit: int = 10, timeouts: ClientTimeouts = ClientTimeouts()):
         self._server_host = host
         self._server_port = port
         self._server_url = f'{self._server_host}:{self._server_port}'
+        self._connections_limit = connections_limit
+        self._timeouts = timeouts
+        self._session: aiohttp.ClientSession | None = None
+        self.connections_stats = ClientConnectionsStats()
+        self._wire_content_types = get_wire_content_types()
+        # env config by env id, till up returns that id again
+        self._envs_cache: dict[EnvironmentId, Environment] = {}
+        # last received state by ETag: unchanged env state isn't transferred again
+        self._statuses_cache: dict[EnvironmentId, tuple[str, ServicesComposeState]] = {}
+        # known after healthcheck, server without wire format support gets base64 pickles
+        self._server_wire_content_types: list[str] = []
+        self._accept_headers = {'Accept': ', '.join(self._wire_content_types + ['application/json'])}
 
-    async def healthcheck(self):
-        async with aiohttp.ClientSession() as session:
-            url = f'{self._server_url}{HEALTHCHECK_PATH}'
-            async with session.get(url) as response:
-                assert response.status == 200, response
-                state = await response.json()
-                assert 'status' in state, response
-                assert state['status'] == 'ok', response
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._connections_limit),
+                timeout=aiohttp.ClientTimeout(total=self._timeouts.default),
+                trace_configs=[self.connections_stats.make_trace_config()],
+            )
+        return self._session
+
+    @staticmethod
+    def _make_timeout(timeout: float | None, default: float) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(total=timeout if timeout is not None else default)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> 'MaxwellDemonClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def _get_request_wire_content_type(self) -> str | None:
+        for content_type in self._wire_content_types:
+            if content_type in self._server_wire_content_types:
+                return content_type
+        return None
+
+    @staticmethod
+    async def _read_wire_response(response: aiohttp.ClientResponse):
+        """
+        Decoded wire response body, None for legacy json response
+        """
+        if not is_wire_content_type(response.content_type):
+            return None
+        return decode_wire(await response.read(), response.content_type)
+
+    async def healthcheck(self, timeout: float = None):
+        url = f'{self._server_url}{HEALTHCHECK_PATH}'
+        session = self._get_session()
+        async with session.get(url, timeout=self._make_timeout(timeout, self._timeouts.default)) as response:
+            assert response.status == 200, response
+            state = await response.json()
+            assert 'status' in state, response
+            assert state['status'] == 'ok', response
+            self._server_wire_content_types = state.get('wire_content_types', [])
 
     @retry(attempts=10, delay=1, swallow=ClientConnectorError)
     async def up(self, name, config_template: Environment, compose_files: str, isolation=None,
-                 parallelism_limit=None, force_restart: bool = False) -> EnvironmentId:
+                 parallelism_limit=None, force_restart: bool = False, timeout: float = None,
+                 as_job: bool = False, on_progress: Callable[[dict], Awaitable[None]] = None) -> EnvironmentId:
+        """
+        With as_job server starts env in background job (or attaches to the one starting same env) and
+        client follows its progress by short requests, surviving dropped connections
+        """
         url = f'{self._server_url}{DC_UP_PATH}'
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=UpRequestParams(
-                name=name,
-                config_template=base64_pickled(config_template),
-                compose_files=compose_files,
-                isolation=isolation,
-                parallelism_limit=parallelism_limit,
-                force_restart=force_restart,
-            ), timeout=1200) as response:
-                if response.status == 422:
-                    raise ServicesUpError((await response.json())['error'])
-                if response.status == 500:
-                    raise ServicesUpError((await response.json())['error'])
+        params = UpRequestParams(
+            name=name,
+            config_template=base64_pickled(config_template),
+            compose_files=compose_files,
+            isolation=isolation,
+            parallelism_limit=parallelism_limit,
+            force_restart=force_restart,
+        )
+        if as_job:
+            params['async_job'] = True
+        request_body = {'json': params}
+        if wire_content_type := self._get_request_wire_content_type():
+            request_body = {
+                'data': encode_wire(params | {'config_template': environment_as_wire(config_template)},
+                                    wire_content_type),
+                'headers': {'Content-Type': wire_content_type},
+            }
+        session = self._get_session()
+        async with session.post(url, **request_body, timeout=self._make_timeout(timeout, self._timeouts.up)
+                                ) as response:
+            if response.status == 422:
+                raise ServicesUpError((await response.json())['error'])
+            if response.status == 500:
+                raise ServicesUpError((await response.json())['error'])
+            if response.status == 202:
+                job_body = UpJobResponseParams(**await response.json())
+                env_id = await self.wait_up_job(job_body['job_id'], on_progress=on_progress, timeout=timeout)
+            else:
+                # server without up jobs support answers synchronously
                 assert response.status == 200, response
-                response_body = UpResponseParams(**await response.json())
-                return response_body['env_id']
+                env_id = UpResponseParams(**await response.json())['env_id']
+        # env id is reused by other configs (parallelism 1) and after env is downed
+        self._envs_cache.pop(env_id, None)
+        return env_id
+
+    async def get_up_job(self, job_id: str, since_version: int = None, timeout: float = None) -> dict | None:
+        """
+        Up job progress and result, with since_version waits on server till job changes
+        """
+        url = f'{self._server_url}{DC_UP_JOB_PATH}'
+        session = self._get_session()
+        poll_timeout = timeout if timeout is not None else UP_JOB_POLL_TIMEOUT
+        async with session.post(url, json=DcUpJobRequestParams(
+            job_id=job_id,
+            since_version=since_version,
+            timeout=poll_timeout,
+        ), timeout=self._make_timeout(poll_timeout + WAIT_RESPONSE_TIMEOUT_MARGIN, self._timeouts.default)
+        ) as response:
+            if response.status == 404:
+                return None
+            assert response.status == 200, response
+            return await response.json()
+
+    async def wait_up_job(self, job_id: str, on_progress: Callable[[dict], Awaitable[None]] = None,
+                          timeout: float = None) -> EnvironmentId:
+        deadline = time.monotonic() + (timeout if timeout is not None else self._timeouts.up)
+        job, errors = None, 0
+        while time.monotonic() < deadline:
+            try:
+                job = await self.get_up_job(job_id, since_version=job['version'] if job else None)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # job keeps running on server, just ask again
+                errors += 1
+                if errors >= UP_JOB_POLL_ERRORS_LIMIT:
+                    raise
+                await asyncio.sleep(1)
+                continue
+            errors = 0
+
+            if job is None:
+                raise ServicesUpError(f'Up job {job_id} not found on server')
+            if on_progress:
+                await on_progress(job)
+            if job['status'] == UpJobStatus.FAILED:
+                raise ServicesUpError(job['error'])
+            if job['status'] == UpJobStatus.DONE:
+                return job['env_id']
+        raise TimeoutError(f'Up job {job_id} not finished in time')
+
+    def _cache_env(self, env_id: EnvironmentId, environment: Environment | None) -> None:
+        # the same EMPTY_ID is given to every config run without parallelism
+        if environment is not None and env_id != EMPTY_ID:
+            self._envs_cache[env_id] = environment
 
     @retry(attempts=5, delay=1, swallow=Exception)
-    async def env(self, env_id: EnvironmentId) -> Environment:
+    async def env(self, env_id: EnvironmentId, timeout: float = None) -> Environment:
+        if (environment := self._envs_cache.get(env_id)) is not None:
+            return environment
+
         url = f'{self._server_url}{ENV_PATH}'
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, json=EnvRequestParams(id=env_id)) as response:
-                assert response.status == 200, response
-                response_body = EnvResponseParams(**await response.json())
-                return debase64_pickled(response_body['env'])
+        session = self._get_session()
+        async with session.get(url, json=EnvRequestParams(id=env_id), headers=self._accept_headers,
+                               timeout=self._make_timeout(timeout, self._timeouts.env)) as response:
+            assert response.status == 200, response
+            if (wire_body := await self._read_wire_response(response)) is not None:
+                environment = environment_from_wire(wire_body['env']) if wire_body['env'] is not None else None
+            else:
+                environment = debase64_pickled(EnvResponseParams(**await response.json())['env'])
+        self._cache_env(env_id, environment)
+        return environment
+
+    async def env_state(self, env_id: EnvironmentId, services: list[str] = None,
+                        timeout: float = None) -> EnvState | None:
+        """
+        Env config, services state and readiness (of given or all env services) in one request,
+        None for unknown env or when server has no such endpoint
+        """
+        url = f'{self._server_url}{ENV_STATE_PATH}'
+        session = self._get_session()
+        async with session.get(url, json=EnvStateRequestParams(id=env_id, services=services),
+                               headers=self._accept_headers,
+                               timeout=self._make_timeout(timeout, self._timeouts.status)) as response:
+            if response.status == 404:
+                return None
+            assert response.status == 200, response
+            if (wire_body := await self._read_wire_response(response)) is not None:
+                env_state = EnvState(
+                    env=environment_from_wire(wire_body['env']) if wire_body['env'] is not None else None,
+                    status=services_state_from_wire(wire_body['status']),
+                    readiness=ReadinessResult(wire_body['readiness']) if wire_body['readiness'] else None,
+                )
+            else:
+                response_body = EnvStateResponseParams(**await response.json())
+                env_state = EnvState(
+                    env=debase64_pickled(response_body['env']),
+                    status=debase64_pickled(response_body['status']),
+                    readiness=ReadinessResult(response_body['readiness']) if response_body['readiness'] else None,
+                )
+        self._cache_env(env_id, env_state.env)
+        return env_state
 
     @retry(attempts=5, delay=1, swallow=Exception)
-    async def status(self, env_id: EnvironmentId) -> ServicesComposeState:
+    async def status(self, env_id: EnvironmentId, timeout: float = None) -> ServicesComposeState:
         url = f'{self._server_url}{STATUS_PATH}'
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, json=EnvRequestParams(id=env_id)) as response:
-                assert response.status == 200, response
-                response_body = StatusResponseParams(**await response.json())
-                return debase64_pickled(response_body['status'])
+        session = self._get_session()
+        headers = dict(self._accept_headers)
+        if (cached := self._statuses_cache.get(env_id)) is not None:
+            headers['If-None-Match'] = cached[0]
+        async with session.get(url, json=EnvRequestParams(id=env_id), headers=headers,
+                               timeout=self._make_timeout(timeout, self._timeouts.status)) as response:
+            if response.status == 304 and cached is not None:
+                return cached[1]
+            assert response.status == 200, response
+            if (wire_body := await self._read_wire_response(response)) is not None:
+                status = services_state_from_wire(wire_body['status'])
+            else:
+                status = debase64_pickled(StatusResponseParams(**await response.json())['status'])
+            if etag := response.headers.get('ETag'):
+                self._statuses_cache[env_id] = (etag, status)
+            return status
+
+    async def wait(
+        self, env_id: EnvironmentId, services: list[str] = None, timeout: float = 300,
+        on_transition: Callable[[ServiceTransition], Awaitable[None]] = None,
+    ) -> tuple[ReadinessResult, ServicesComposeState] | None:
+        """
+        Blocks on server till services (all env services by default) are ready, failed or timeout passed;
+        with on_transition services changes are streamed as server-sent events.
+        None when server has no wait endpoint, ValueError for unknown env
+        """
+        url = f'{self._server_url}{WAIT_PATH}'
+        session = self._get_session()
+        headers = {'Accept': EVENT_STREAM_CONTENT_TYPE} if on_transition else self._accept_headers
+        async with session.get(url, json=WaitRequestParams(id=env_id, services=services, timeout=timeout),
+                               headers=headers, timeout=self._make_timeout(None, timeout + WAIT_RESPONSE_TIMEOUT_MARGIN)
+                               ) as response:
+            if response.status == 404:
+                # server without wait endpoint answers with plain text
+                if response.content_type == 'application/json':
+                    raise ValueError(f'No such {env_id} environment to wait for')
+                return None
+            assert response.status == 200, response
+            if on_transition:
+                async for event, data in self._read_events(response):
+                    if event == 'transition':
+                        await on_transition(service_transition_from_wire(data))
+                    elif event == 'result':
+                        return ReadinessResult(data['result']), services_state_from_wire(data['status'])
+                raise ConnectionError(f'Wait events stream for {env_id} ended without result')
+            if (wire_body := await self._read_wire_response(response)) is not None:
+                return ReadinessResult(wire_body['result']), services_state_from_wire(wire_body['status'])
+            response_body = WaitResponseParams(**await response.json())
+            return ReadinessResult(response_body['result']), debase64_pickled(response_body['status'])
 
-    async def exec(self, env_id: EnvironmentId, container: str, command: str) -> ServicesComposeState:
+    @staticmethod
+    async def _read_events(response: aiohttp.ClientResponse):
+        event, data_lines = None, []
+        async for line in response.content:
+            line = line.decode().rstrip('\r\n')
+            if line.startswith('event:'):
+                event = line[len('event:'):].strip()
+            elif line.startswith('data:'):
+                data_lines.append(line[len('data:'):].strip())
+            elif not line and data_lines:
+                yield event, json.loads('\n'.join(data_lines))
+                event, data_lines = None, []
+
+    async def exec(self, env_id: EnvironmentId, container: str, command: str, timeout: float = None) -> bytes:
         url = f'{self._server_url}{DC_EXEC_PATH}'
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=DcExecRequestParams(
-                env_id=env_id,
-                container=container,
-                command=command
-            )) as response:
-                assert response.status == 200, response
-                response_body = DcExecResponseParams(**await response.json())
-                return debase64_pickled(response_body['output'])
+        session = self._get_session()
+        async with session.post(url, json=DcExecRequestParams(
+            env_id=env_id,
+            container=container,
+            command=command
+        ), headers=self._accept_headers, timeout=self._make_timeout(timeout, self._timeouts.exec)) as response:
+            assert response.status == 200, response
+            if (wire_body := await self._read_wire_response(response)) is not None:
+                return wire_body['output']
+            response_body = DcExecResponseParams(**await response.json())
+            return debase64_pickled(response_body['output'])
+
+    async def exec_detached(self, env_id: EnvironmentId, container: str, command: str,
+                            timeout: float = None) -> str:
+        """
+        Starts command in background, returns exec uid to poll its output with exec_logs
+        """
+        url = f'{self._server_url}{DC_EXEC_PATH}'
+        session = self._get_session()
+        async with session.post(url, json=DcExecRequestParams(
+            env_id=env_id,
+            container=container,
+            command=command,
+            detached=True,
+        ), timeout=self._make_timeout(timeout, self._timeouts.default)) as response:
+            assert response.status == 200, response
+            return (await response.json())['uid']
+
+    async def exec_logs(self, uid: str, offset: int = 0, timeout: float = None) -> ExecLogs:
+        """
+        Exec output past offset (pass previous next_offset to get only new output) and exec status
+        """
+        url = f'{self._server_url}{DC_GET_EXEC_LOGS_PATH}'
+        session = self._get_session()
+        async with session.post(url, json=DcExecLogsRequestParams(
+            uid=uid,
+            offset=offset,
+        ), headers=self._accept_headers, timeout=self._make_timeout(timeout, self._timeouts.exec)) as response:
+            assert response.status == 200, response
+            if (wire_body := await self._read_wire_response(response)) is None:
+                wire_body = await response.json()
+                wire_body['output'] = debase64_pickled(wire_body['output'])
+            return ExecLogs(
+                output=wire_body['output'],
+                next_offset=wire_body.get('next_offset', offset + len(wire_body['output'])),
+                status=ExecStatus(wire_body['status']) if wire_body.get('status') else None,
+                exit_code=wire_body.get('exit_code'),
+            )
 
-    async def logs(self, env_id: EnvironmentId, services: list[str]) -> dict[str, bytes]:
+    async def exec_stream(self, env_id: EnvironmentId, container: str, command: str, stdin: bytes = None,
+                          timeout: float = None) -> AsyncIterator[ExecOutput | ExecExit]:
+        """
+        Command output chunks as it prints them, last item is its exit (code or timeout).
+        With timeout command is killed on server after it, otherwise default exec timeout bounds request
+        """
+        url = f'{self._server_url}{DC_EXEC_STREAM_PATH}'
+        session = self._get_session()
+        async with session.post(url, json=DcExecStreamRequestParams(
+            env_id=env_id,
+            container=container,
+            command=command,
+            stdin=base64_encode(stdin) if stdin is not None else None,
+            timeout=timeout,
+        ), timeout=self._make_timeout(timeout + WAIT_RESPONSE_TIMEOUT_MARGIN if timeout is not None else None,
+                                      self._timeouts.exec)
+        ) as response:
+            if response.status == 404:
+                raise ValueError(f'No such {env_id} environment to exec in')
+            assert response.status == 200, response
+            async for line in response.content:
+                yield exec_event_from_json(json.loads(line))
+
+    async def exec_till_complete(self, env_id: EnvironmentId, container: str, command: str, stdin: bytes = None,
+                                 timeout: float = None) -> tuple[ExecExit, bytes, bytes]:
+        stdout, stderr = bytearray(), bytearray()
+        async for exec_event in self.exec_stream(env_id, container, command, stdin=stdin, timeout=timeout):
+            if isinstance(exec_event, ExecExit):
+                return exec_event, bytes(stdout), bytes(stderr)
+            (stdout if exec_event.stream == 'stdout' else stderr).extend(exec_event.data)
+        raise ConnectionError(f'Exec stream of {command} in {container} ended without exit')
+
+    async def logs(self, env_id: EnvironmentId, services: list[str], timeout: float = None) -> dict[str, bytes]:
         url = f'{self._server_url}{DC_LOGS_PATH}'
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=DcLogsRequestParams(
-                env_id=env_id,
-                services=services,
-            )) as response:
-                assert response.status == 200, response
-                response_body = DcExecResponseParams(**await response.json())
-                return debase64_pickled(response_body['logs'])
+        session = self._get_session()
+        async with session.post(url, json=DcLogsRequestParams(
+            env_id=env_id,
+            services=services,
+        ), headers=self._accept_headers, timeout=self._make_timeout(timeout, self._timeouts.logs)) as response:
+            assert response.status == 200, response
+            if (wire_body := await self._read_wire_response(response)) is not None:
+                return wire_body['logs']
+            response_body = DcExecResponseParams(**await response.json())
+            return debase64_pickled(response_body['logs'])
+
+    async def logs_stream(self, env_id: EnvironmentId, services: list[str] = None, tail: int = None,
+                          since: str = None, until: str = None, follow: bool = False,
+                          timeout: float = None) -> AsyncIterator[ComposeLogLine]:
+        """
+        Log lines of services (all env services by default) with timestamps as they come; with follow
+        iterates till stopped (no timeout by default)
+        """
+        url = f'{self._server_url}{DC_LOGS_STREAM_PATH}'
+        session = self._get_session()
+        async with session.post(url, json=DcLogsStreamRequestParams(
+            env_id=env_id,
+            services=services or [],
+            tail=tail,
+            since=since,
+            until=until,
+            follow=follow,
+        ), timeout=aiohttp.ClientTimeout(total=timeout) if follow else self._make_timeout(timeout, self._timeouts.logs)
+        ) as response:
+            if response.status == 404:
+                raise ValueError(f'No such {env_id} environment to stream logs of')
+            assert response.status == 200, response
+            async for line in response.content:
+                yield ComposeLogLine(**json.loads(line))
 
     def list_current_in_flight_envs(self, *args, **kwargs):
         raise NotImplementedError()
@@ -1 +1,33 @@
+from typing import NamedTuple
+
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.readiness import ReadinessResult
+from maxwelld.env_description.env_types import Environment
+from maxwelld.helpers.exec_record import ExecStatus
+
 EnvironmentId = str
+
+
+class ClientTimeouts(NamedTuple):
+    """
+    Per call total timeouts, seconds
+    """
+    default: float = 60
+    up: float = 1200
+    env: float = 30
+    status: float = 30
+    exec: float = 600
+    logs: float = 300
+
+
+class EnvState(NamedTuple):
+    env: Environment | None
+    status: ServicesComposeState
+    readiness: ReadinessResult | None  # None while services are starting
+
+
+class ExecLogs(NamedTuple):
+    output: bytes
+    next_offset: int  # offset of the next exec_logs call
+    status: ExecStatus | None  # None for unknown or forgotten exec
+    exit_code: int | None
@@ -1,5 +1,5 @@
 import json
-from dataclasses import dataclass
+import re
 from typing import Callable
 from typing import Iterator
 
@@ -18,14 +18,68 @@ class ComposeHealth:
     HEALTHY = 'healthy'
 
 
-@dataclass
+COMPOSE_SERVICE_LABEL = 'com.docker.compose.service'
+COMPOSE_PROJECT_LABEL = 'com.docker.compose.project'
+
+# docker reports exit code and health only inside human-readable status: "Exited (1) 2 minutes ago", "Up 5s (healthy)"
+EXIT_CODE_IN_STATUS = re.compile(r'^Exited \((?P<exit_code>-?\d+)\)')
+HEALTH_IN_STATUS = re.compile(r'\((?:health: )?(?P<health>healthy|unhealthy|starting)\)')
+
+
+def parse_status_exit_code(status: str) -> int:
+    if match := EXIT_CODE_IN_STATUS.search(status):
+        return int(match.group('exit_code'))
+    return 0
+
+
+def parse_labels(labels: str) -> dict[str, str]:
+    return {
+        (label_split := label.split('=', maxsplit=2))[0]: label_split[1] if len(label_split) == 2 else None
+        for label in labels.split(',')
+    }
+
+
+def find_label(labels: str, label: str) -> str | None:
+    """
+    Single label value of raw "k1=v1,k2=v2" labels string without splitting all labels, same result as
+    parse_labels(labels).get(label)
+    """
+    prefix = f'{label}='
+    if labels.startswith(prefix):
+        start = len(prefix)
+    elif (position := labels.find(f',{prefix}')) != -1:
+        start = position + 1 + len(prefix)
+    else:
+        return None
+
+    end = labels.find(',', start)
+    value = labels[start:] if end == -1 else labels[start:end]
+    return None if '=' in value else value
+
+
+def parse_status_health(status: str) -> str:
+    if match := HEALTH_IN_STATUS.search(status):
+        return match.group('health')
+    return ComposeHealth.EMPTY
+
+
 class ServiceComposeState:
-    name: str
-    state: str
-    exit_code: int
-    health: str
-    status: str  # "Up X seconds"
-    labels: dict[str, str]
+    """
+    Service state with labels kept as raw docker "k1=v1,k2=v2" string: single labels are parsed on first access
+    and cached, full labels dict is built only when requested
+    """
+    __slots__ = ('name', 'state', 'exit_code', 'health', 'status', '_raw_labels', '_labels', '_labels_cache')
+
+    def __init__(self, name: str, state: str, exit_code: int, health: str, status: str,
+                 labels: dict[str, str] = None, raw_labels: str = ''):
+        self.name = name
+        self.state = state
+        self.exit_code = exit_code
+        self.health = health
+        self.status = status  # "Up X seconds"
+        self._raw_labels = raw_labels
+        self._labels: dict[str, str] | None = labels
+        self._labels_cache: dict[str, str | None] = {}
 
     @classmethod
     def from_json(cls, json_status: str) -> 'ServiceComposeState':
@@ -36,19 +90,75 @@ class ServiceComposeState:
             exit_code=status['ExitCode'],
             health=status['Health'],
             status=status['Status'],
-            labels={
-                (label_split := label.split('=', maxsplit=2))[0]: label_split[1] if len(label_split) == 2 else None
-                for label in status['Labels'].split(',')
-                if 'Labels' in status
-            },
+            raw_labels=status.get('Labels', ''),
+        )
+
+    @classmethod
+    def from_docker_ps_json(cls, json_status: str) -> 'ServiceComposeState':
+        """`docker ps --format='{{json .}}'` line"""
+        status = json.loads(json_status)
+        raw_labels = status.get('Labels') or ''
+        return cls(
+            name=find_label(raw_labels, COMPOSE_SERVICE_LABEL) or status['Names'],
+            state=status['State'],
+            exit_code=parse_status_exit_code(status['Status']),
+            health=parse_status_health(status['Status']),
+            status=status['Status'],
+            raw_labels=raw_labels,
+        )
+
+    @classmethod
+    def from_engine_json(cls, container: dict) -> 'ServiceComposeState':
+        """Docker Engine API /containers/json item"""
+        labels = container.get('Labels') or {}
+        return cls(
+            name=labels.get(COMPOSE_SERVICE_LABEL, container['Names'][0].lstrip('/') if container.get('Names') else ''),
+            state=container['State'],
+            exit_code=parse_status_exit_code(container['Status']),
+            health=parse_status_health(container['Status']),
+            status=container['Status'],
+            labels=labels,
         )
 
+    @property
+    def labels(self) -> dict[str, str]:
+        if self._labels is None:
+            self._labels = parse_labels(self._raw_labels) if self._raw_labels else {}
+        return self._labels
+
+    def get_label(self, label: str, default=None) -> str | None:
+        if self._labels is not None:
+            return self._labels.get(label, default)
+        if label not in self._labels_cache:
+            self._labels_cache[label] = find_label(self._raw_labels, label)
+        value = self._labels_cache[label]
+        return default if value is None else value
+
+    def replace(self, **changes) -> 'ServiceComposeState':
+        """
+        Copy with changed state fields, labels (raw, parsed and cached) are shared
+        """
+        new_state = ServiceComposeState(
+            name=changes.pop('name', self.name),
+            state=changes.pop('state', self.state),
+            exit_code=changes.pop('exit_code', self.exit_code),
+            health=changes.pop('health', self.health),
+            status=changes.pop('status', self.status),
+            labels=self._labels,
+            raw_labels=self._raw_labels,
+        )
+        assert not changes, f'Unknown service state fields: {list(changes)}'
+        new_state._labels_cache = self._labels_cache
+        return new_state
+
+    def state_key(self) -> tuple[str, str, str, int]:
+        return self.name, self.state, self.health, self.exit_code
+
     def __eq__(self, other):
-        return (isinstance(other, ServiceComposeState)
-                and self.name == other.name
-                and self.state == other.state
-                and self.health == other.health
-                and self.exit_code == self.exit_code)
+        return isinstance(other, ServiceComposeState) and self.state_key() == other.state_key()
+
+    def __hash__(self):
+        return hash(self.state_key())
 
     def __repr__(self):
         return (f'{type(self).__name__}'
@@ -95,19 +205,62 @@ class ServiceComposeState:
         }
 
     def check(self, label: str, value):
-        return label in self.labels and self.labels[label] == value
+        return value is not None and self.get_label(label) == value
 
 
 class ServicesComposeState:
+    """
+    Services states list with lazily built (on first lookup) indexes by service name, by label value
+    and by services state keys for equality checks
+    """
+
     def __init__(self, compose_status: str):
-        self._services: list[ServiceComposeState] = [
+        self._set_services([
             ServiceComposeState.from_json(state_str)
             for state_str in compose_status.split('\n')
             if state_str
-        ]
+        ])
+
+    def _set_services(self, services: list[ServiceComposeState]) -> None:
+        self._services: list[ServiceComposeState] = services
+        self._by_name: dict[str, ServiceComposeState] | None = None
+        self._by_label: dict[str, dict[str, list[ServiceComposeState]]] = {}
+        self._state_keys: frozenset[tuple[str, str, str, int]] | None = None
+
+    def _get_by_name_index(self) -> dict[str, ServiceComposeState]:
+        if self._by_name is None:
+            self._by_name = {}
+            for service_state in self._services:
+                self._by_name.setdefault(service_state.name, service_state)
+        return self._by_name
+
+    def _get_label_index(self, label: str) -> dict[str, list[ServiceComposeState]]:
+        if label not in self._by_label:
+            label_index = {}
+            for service_state in self._services:
+                if (value := service_state.get_label(label)) is not None:
+                    label_index.setdefault(value, []).append(service_state)
+            self._by_label[label] = label_index
+        return self._by_label[label]
+
+    def _get_state_keys(self) -> frozenset[tuple[str, str, str, int]]:
+        if self._state_keys is None:
+            self._state_keys = frozenset(service_state.state_key() for service_state in self._services)
+        return self._state_keys
+
+    @classmethod
+    def from_docker_ps(cls, docker_ps_status: str) -> 'ServicesComposeState':
+        return cls.make_new_from_services([
+            ServiceComposeState.from_docker_ps_json(state_str)
+            for state_str in docker_ps_status.split('\n')
+            if state_str
+        ])
 
     def __contains__(self, item):
-        return item in self._services
+        return isinstance(item, ServiceComposeState) and item.state_key() in self._get_state_keys()
+
+    def __len__(self) -> int:
+        return len(self._services)
 
     def __iter__(self) -> Iterator[ServiceComposeState]:
         return iter(self._services)
@@ -125,16 +278,13 @@ class ServicesComposeState:
 
     def __eq__(self, other) -> bool:
         if isinstance(other, ServicesComposeState):
-            for service_state in self._services:
-                if service_state not in other:
-                    return False
-            for service_state in other:
-                if service_state not in self:
-                    return False
-            return True
+            return self._get_state_keys() == other._get_state_keys()
 
         return False
 
+    def __hash__(self):
+        return hash(self._get_state_keys())
+
     def __repr__(self):
         return f'{type(self).__name__}(<{self._services}>)'
 
@@ -144,7 +294,7 @@ class ServicesComposeState:
     @classmethod
     def make_new_from_services(cls, services: list[ServiceComposeState]) -> 'ServicesComposeState':
         new_state = ServicesComposeState('')
-        new_state._services = services
+        new_state._set_services(services)
         return new_state
 
     def get_all_for(self, filter: Callable[[ServiceComposeState], bool]) -> 'ServicesComposeState':
@@ -155,9 +305,14 @@ class ServicesComposeState:
 
         return self.make_new_from_services(services=services_states)
 
+    def get_all_for_label(self, label: str, value) -> 'ServicesComposeState':
+        return self.make_new_from_services(services=list(self._get_label_index(label).get(value, [])))
+
     def get_any_for(self, label: str, value) -> ServiceComposeState | None:
-        for service_state in self._services:
-            if service_state.check(label, value):
-                return service_state
+        if services_states := self._get_label_index(label).get(value):
+            return services_states[0]
+
+        return None
 
-        return 
+    def get_by_name(self, name: str) -> ServiceComposeState | None:
+        return self._get_by_name_index().get(name)
@@ -8,8 +8,11 @@ from yaml.parser import ParserError
 from maxwelld.core.compose_instances import ComposeInstances
 from maxwelld.core.compose_interface import ComposeShellInterface
 from maxwelld.core.config import Config
+from maxwelld.core.diagnostics import DiagnosticsCollector
+from maxwelld.core.diagnostics import bytes_tail
 from maxwelld.core.sequence_run_types import ComposeInstanceFiles
 from maxwelld.core.sequence_run_types import EnvInstanceConfig
+from maxwelld.core.up_jobs import UpProgress
 from maxwelld.core.utils.compose_files import get_compose_services
 from maxwelld.core.utils.compose_files import get_compose_services_dependency_tree
 from maxwelld.core.utils.compose_files import make_env_compose_instance_files
@@ -26,6 +29,7 @@ from maxwelld.vedro_plugin.logger import WaitVerbosity
 from maxwelld.vedro_plugin.state_waiting import wait_all_services_up
 
 INFLIGHT = 'inflight'
+DIAGNOSTICS_DIRECTORY = 'diagnostics'
 
 
 class ComposeInstance:
@@ -41,7 +45,8 @@ class ComposeInstance:
                  except_containers: list[str],
                  tmp_envs_path: Path,
                  execution_envs: dict = None,
-                 release_id: str = None):
+                 release_id: str = None,
+                 fingerprint: str = None):
         self.compose_files = compose_files
         self.in_docker_project_root = in_docker_project_root
         self.host_project_root_directory = host_project_root_directory
@@ -59,8 +64,10 @@ class ComposeInstance:
         self.compose_interface = compose_interface
 
         self.release_id: str = release_id
+        self.fingerprint: str = fingerprint
 
         self.compose_instance_files: ComposeInstanceFiles = None
+        self.progress = UpProgress()
         for file in self.compose_files.split(':'):
             assert (file := Path(self.in_docker_project_root / file)).exists(), f'File {file} doesnt exist'
 
@@ -83,6 +90,7 @@ class ComposeInstance:
             compose_files_path=self.in_docker_project_root,
             tmp_env_path=self.tmp_envs_path,
             release_id=self.release_id,
+            fingerprint=self.fingerprint,
         )
         # TODO uneven compose_executor initialization!! but compose_interface compose_files-dependent
         self.compose_executor = self.compose_interface(
@@ -91,6 +99,22 @@ class ComposeInstance:
         )
         return compose_instance_files
 
+    def diagnostics(self) -> DiagnosticsCollector:
+        env_id = self.compose_instance_files.env_config_instance.env_id
+        return DiagnosticsCollector(
+            compose_executor=self.compose_executor,
+            logs_directory=self.compose_instance_files.directory / DIAGNOSTICS_DIRECTORY,
+            host_logs_directory=Config().host_env_tmp_directory / env_id / DIAGNOSTICS_DIRECTORY,
+            tail_lines=Config().diagnostics_logs_tail_lines,
+            tail_bytes=Config().diagnostics_logs_tail_bytes,
+            concurrency_limit=Config().logs_concurrency_limit,
+        )
+
+    @staticmethod
+    def _output_tail(output: bytes) -> bytes:
+        tail, _ = bytes_tail(output, Config().diagnostics_logs_tail_lines, Config().diagnostics_logs_tail_bytes)
+        return tail
+
     async def run_migration(self, stages, services, env_config_instance, migrations):
         for service in env_config_instance.env:
             sys.stdout.flush()
@@ -105,17 +129,17 @@ class ComposeInstance:
                 target_service = env_config_instance.env_services_map[handler.executor or service]
 
                 substituted_cmd = handler.cmd.format(**env_config_instance.env_services_map)
+                self.progress.migration_started(target_service, substituted_cmd)
                 migrate_result, stdout, stderr = await self.compose_executor.dc_exec_till_complete(
                     target_service, substituted_cmd
                 )
+                self.progress.migration_done()
                 if migrate_result != JobResult.GOOD:
-                    services_status = await self.compose_executor.dc_state()
+                    report = await self.diagnostics().collect([target_service], only_failing=False)
                     raise ServicesUpError(f"Can't migrate service {target_service}, with {substituted_cmd}"
-                                          f"\n{stdout=}\n{stderr=}"
-                                          # TODO fix too verbose to file output?
-                                          # f"\nUp logs:\n {await self.logs(self.except_containers)}"
-                                          f"\nServices logs:\n {await self.logs(services)}"
-                                          f"\nServices status:\n {services_status.as_rich_text()}") from None
+                                          f"\nstdout={self._output_tail(stdout)}"
+                                          f"\nstderr={self._output_tail(stderr)}"
+                                          f"\n{report}") from None
 
     async def run_services_pack(self, services: list[str], migrations):
 
@@ -135,8 +159,8 @@ class ComposeInstance:
         )
 
         up_result = await self.compose_executor.dc_up(services)
-        assert up_result == JobResult.GOOD, (f"Can't up services {services}\nServices logs:\n "
-                                             f"{await self.logs()}")
+        assert up_result == JobResult.GOOD, (f"Can't up services {services}\n"
+                                             f"{await self.diagnostics().collect(services)}")
         services_status = await self.compose_executor.dc_state()
 
         # !!!!!! up process asynchronous
@@ -159,13 +183,10 @@ class ComposeInstance:
             verbose=WaitVerbosity.COMPACT
         )
         if check_up_result != JobResult.GOOD:
-            services_status = await self.compose_executor.dc_state()
+            report = await self.diagnostics().collect(services)
             raise ServicesUpError(f"Can't up services {services} for "
                                   f"{Config().service_up_check_attempts*Config().service_up_check_delay}s"
-                                  # TODO fix too verbose to file output?
-                                  # f"\nUp logs:\n {await self.logs(self.except_containers)}"
-                                  f"\nServices logs:\n {await self.logs(services)}"
-                                  f"\nServices status:\n {services_status.as_rich_text()}") from None
+                                  f"\n{report}") from None
 
         await self.run_migration(
             [EventStage.AFTER_SERVICE_HEALTHY],
@@ -177,7 +198,9 @@ class ComposeInstance:
     async def cleanup(self):
         ...
 
-    async def run(self):
+    async def run(self, progress: UpProgress = None):
+        if progress is not None:
+            self.progress = progress
         self.compose_instance_files = await self.generate_config_files()
 
         services_tiers = get_compose_services_dependency_tree(self.compose_instance_files.compose_files)
@@ -206,8 +229,11 @@ class ComposeInstance:
             migrations
         )
 
+        self.progress.tiers_planned(len(services_tiers))
         for service_tier_pack in services_tiers:
+            self.progress.tier_started(service_tier_pack)
             await self.run_services_pack(service_tier_pack, migrations)
+            self.progress.tier_done()
 
         await self.run_migration(
             [EventStage.AFTER_ALL],
@@ -237,7 +263,8 @@ class ComposeInstanceProvider:
         self.host_project_root_directory = host_project_root_directory
         self.tmp_envs_path = tmp_envs_path
 
-    def make(self, new_env_id: str, name: str, compose_files: str | None, config_template: Environment, release_id: str = None):
+    def make(self, new_env_id: str, name: str, compose_files: str | None, config_template: Environment,
+             release_id: str = None, fingerprint: str = None):
         return ComposeInstance(
             project=self.project,
             name=name,
@@ -250,6 +277,7 @@ class ComposeInstanceProvider:
             except_containers=self.except_containers,
             tmp_envs_path=self.tmp_envs_path,
             release_id=release_id,
+            fingerprint=fingerprint,
         )
 
     def make_system(self, compose_files: str | None = None) -> ComposeInstances:
@@ -65,9 +65,9 @@ class ComposeInstances:
         )
         return compose_instance_files
 
-    async def get_active_services_state(self) -> ServicesComposeState:
+    async def get_active_services_state(self, labels: dict[str, str] = None) -> ServicesComposeState:
         self.compose_instance_files = await self.generate_config_files()
-        state = await self.compose_executor.dc_state()
+        state = await self.compose_executor.dc_state(labels=labels)
         return state
 
     async def down(self, services: list[str]):
@@ -2,21 +2,62 @@ import asyncio
 import os
 import pprint
 import shlex
+import signal
 import sys
 from asyncio import subprocess
+from contextlib import nullcontext
 from pathlib import Path
+from typing import AsyncIterator
 
 from rich.text import Text
-from rtry import retry
 
+from maxwelld.core.compose_data_types import COMPOSE_PROJECT_LABEL
 from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.compose_retry import FailureKind
+from maxwelld.core.compose_retry import RetryPolicy
+from maxwelld.core.compose_retry import classify_failure
+from maxwelld.core.compose_scheduler import CommandPriority
+from maxwelld.core.compose_scheduler import get_compose_commands_scheduler
 from maxwelld.core.config import Config
-from maxwelld.core.utils.process_command_output import process_output_till_done
+from maxwelld.core.utils.process_command_output import FullCapture
+from maxwelld.core.utils.process_command_output import OutputCapture
+from maxwelld.core.utils.process_command_output import OutputCaptureFactory
+from maxwelld.core.utils.compose_logs import ComposeLogLine
+from maxwelld.core.utils.compose_logs import parse_compose_log_line
+from maxwelld.core.utils.exec_output import ExecExit
+from maxwelld.core.utils.exec_output import ExecOutput
+from maxwelld.core.utils.process_command_output import RingBufferCapture
+from maxwelld.core.utils.process_command_output import SpillToDiskCapture
+from maxwelld.core.utils.process_command_output import capture_output_till_done
+from maxwelld.core.utils.process_command_output import iter_process_output
 from maxwelld.helpers.jobs_result import JobResult
 from maxwelld.helpers.jobs_result import OperationError
+from maxwelld.helpers.labels import escape_label_value
 from maxwelld.output.console import CONSOLE
 from maxwelld.output.styles import Style
 
+# exec output is streamed in raw chunks, not lines (binary and long lines safe); base64 encoded chunk
+# has to fit client stream reader line limit
+EXEC_OUTPUT_CHUNK_SIZE = 16 * 1024
+
+
+async def _write_stdin(process: asyncio.subprocess.Process, stdin: bytes) -> None:
+    try:
+        process.stdin.write(stdin)
+        await process.stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # command exited without reading all input
+        ...
+    finally:
+        process.stdin.close()
+
+
+def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        ...
+
 
 class ComposeShellInterface:
     def __init__(self, compose_files, in_docker_project_root, execution_envs: dict = None):
@@ -33,9 +74,101 @@ class ComposeShellInterface:
         self.debug_docker_compose_commands = Config().debug_docker_compose_commands
         self.verbose_docker_compose_ps_commands = Config().verbose_docker_compose_ps_commands
         self.extra_exec_params = Config().docker_compose_extra_exec_params
+        self.logs_capture_limit = Config().compose_logs_capture_limit
+        self._scheduler = get_compose_commands_scheduler()
+        self.retry_policy = RetryPolicy(
+            attempts=Config().compose_retry_attempts,
+            base_delay_s=Config().compose_retry_base_delay,
+            max_delay_s=Config().compose_retry_max_delay,
+        )
+        self.state_retry_policy = self.retry_policy._replace(attempts=Config().compose_state_retry_attempts)
+        # executed command's own stderr can't be told from compose failure: migrations and detached execs
+        # must not run twice
+        self.exec_retry_policy = self.retry_policy._replace(attempts=1)
+
+    async def _run_process_captured(self, cmd: str, env: dict, root: Path | str, priority: CommandPriority,
+                                    verbose: bool, retry_policy: RetryPolicy = None,
+                                    capture_factory: OutputCaptureFactory = FullCapture
+                                    ) -> tuple[int, OutputCapture, OutputCapture]:
+        """
+        Runs command, repeating it only on transient (daemon/network) failures.
+        Captures of the last attempt output are returned open, caller closes them
+        """
+        if retry_policy is None:
+            retry_policy = self.retry_policy
+
+        for attempt in range(1, retry_policy.attempts + 1):
+            async with self._scheduler.slot(priority, env_key=self.compose_files):
+                process = await asyncio.create_subprocess_shell(
+                    cmd,
+                    env=env,
+                    cwd=root,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+                stdout_capture, stderr_capture = capture_factory(), capture_factory()
+                try:
+                    await capture_output_till_done(process, verbose, stdout_capture, stderr_capture)
+                except BaseException:
+                    stdout_capture.close()
+                    stderr_capture.close()
+                    raise
+
+            if process.returncode == 0:
+                break
+            if classify_failure(process.returncode, stderr_capture.getvalue()) == FailureKind.PERMANENT:
+                break
+            if attempt < retry_policy.attempts:
+                stdout_capture.close()
+                stderr_capture.close()
+                delay = retry_policy.delay(attempt)
+                CONSOLE.print(Text(
+                    f'Transient failure ({process.returncode}), retry {attempt}/{retry_policy.attempts - 1} '
+                    f'in {delay:.1f}s',
+                    style=Style.suspicious
+                ))
+                await asyncio.sleep(delay)
+
+        return process.returncode, stdout_capture, stderr_capture
+
+    async def _run_process(self, cmd: str, env: dict, root: Path | str, priority: CommandPriority, verbose: bool,
+                           retry_policy: RetryPolicy = None,
+                           capture_factory: OutputCaptureFactory = FullCapture) -> tuple[int, bytes, bytes]:
+        """
+        Runs command, repeating it only on transient (daemon/network) failures.
+        capture_factory - how much of each output stream is kept in daemon memory
+        """
+        returncode, stdout_capture, stderr_capture = await self._run_process_captured(
+            cmd, env, root, priority, verbose, retry_policy, capture_factory
+        )
+        try:
+            return returncode, stdout_capture.getvalue(), stderr_capture.getvalue()
+        finally:
+            stdout_capture.close()
+            stderr_capture.close()
+
+    async def _make_operation_error(self, stdout: bytes, stderr: bytes) -> OperationError:
+        # state collected once, after all attempts
+        state_result = await self.dc_state()
+        if isinstance(state_result, ServicesComposeState):
+            return OperationError(
+                f'Stdout:\n{stdout}\n\nStderr:\n{stderr}\n\nComposeState:\n{state_result.as_rich_text()}'
+            )
+        return OperationError(f'Stdout:\n{stdout}\n\nStderr:\n{stderr}\n\nComposeState:\n{state_result}')
+
+    def _make_filtered_ps_cmd(self, project: str | None, labels: dict[str, str]) -> str:
+        labels_filter = {COMPOSE_PROJECT_LABEL: project} if project else {}
+        labels_filter |= {label: escape_label_value(value) for label, value in labels.items()}
+        filters = ' '.join(
+            f'--filter {shlex.quote(f"label={label}={value}")}' for label, value in labels_filter.items()
+        )
+        return f"/usr/local/bin/docker ps -a --no-trunc {filters}" + " --format='{{json .}}'"
 
-    @retry(attempts=10, delay=1, until=lambda x: x == JobResult.BAD)
-    async def dc_state(self, env: dict = None, root: Path | str = None) -> ServicesComposeState | OperationError:
+    async def dc_state(self, env: dict = None, root: Path | str = None, labels: dict[str, str] = None
+                       ) -> ServicesComposeState | OperationError:
+        """
+        labels - only containers matching all labels, filtered by docker itself instead of whole project listing
+        """
         sys.stdout.flush()
 
         if env is None:
@@ -45,27 +178,29 @@ class ComposeShellInterface:
         if root is None:
             root = self.in_docker_project_root
 
-        process = await asyncio.create_subprocess_shell(
-            cmd := f"/usr/local/bin/docker-compose --project-directory {root}" + " ps -a --format='{{json .}}'",
-            env=env,
-            cwd=root,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        if labels:
+            cmd = self._make_filtered_ps_cmd(env.get('COMPOSE_PROJECT_NAME'), labels)
+        else:
+            cmd = f"/usr/local/bin/docker-compose --project-directory {root}" + " ps -a --format='{{json .}}'"
+
         CONSOLE.print(Text(
             f'{cmd}',
             style=Style.context
         ))
-        stdout, stderr = await process_output_till_done(process, self.verbose_docker_compose_ps_commands)
+        returncode, stdout, stderr = await self._run_process(
+            cmd, env, root, CommandPriority.STATE, self.verbose_docker_compose_ps_commands, self.state_retry_policy
+        )
 
-        if process.returncode != 0:
+        if returncode != 0:
             print(f"Can't get container's status {stdout} {stderr}")
             return OperationError(f'Stdout:\n{stdout}\n\nStderr:\n{stderr}')
 
+        if labels:
+            return ServicesComposeState.from_docker_ps(stdout.decode('utf-8'))
+
         state_result = ServicesComposeState(stdout.decode('utf-8'))
         return state_result
 
-    @retry(attempts=3, delay=1, until=lambda x: x == JobResult.BAD)
     async def dc_up(self, services: list[str], env: dict = None, root: Path | str = None) -> JobResult | OperationError:
         sys.stdout.flush()
 
@@ -76,14 +211,8 @@ class ComposeShellInterface:
         if root is None:
             root = self.in_docker_project_root
 
-        process = await asyncio.create_subprocess_shell(
-            cmd := f'/usr/local/bin/docker-compose --project-directory {root} up --timestamps --no-deps --pull missing '
-                   '--timeout 300 -d ' + ' '.join(services),
-            env=env,
-            cwd=root,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        cmd = (f'/usr/local/bin/docker-compose --project-directory {root} up --timestamps --no-deps --pull missing '
+               '--timeout 300 -d ' + ' '.join(services))
         debug = f'; in {root}; with {pprint.pformat(env)}' if self.debug_docker_compose_commands else ''
         CONSOLE.print(Text(
             f'{cmd}',
@@ -92,20 +221,16 @@ class ComposeShellInterface:
             f'{debug}',
             style=Style.regular
         ))
-        stdout, stderr = await process_output_till_done(process, self.verbose_docker_compose_commands)
+        returncode, stdout, stderr = await self._run_process(
+            cmd, env, root, CommandPriority.UP_DOWN, self.verbose_docker_compose_commands
+        )
 
-        if process.returncode != 0:
+        if returncode != 0:
             print("Can't up environment")
-            state_result = await self.dc_state()
-            if state_result == JobResult.GOOD:
-                return OperationError(
-                    f'Stdout:\n{stdout}\n\nStderr:\n{stderr}\n\nComposeState:\n{state_result.as_rich_text()}'
-                )
-            return OperationError(f'Stdout:\n{stdout}\n\nStderr:\n{stderr}\n\nComposeState:\n{state_result}')
+            return await self._make_operation_error(stdout, stderr)
 
         return JobResult.GOOD
 
-    @retry(attempts=3, delay=1, until=lambda x: x == JobResult.BAD)
     async def dc_logs(self, services: list[str], env: dict = None, root: Path | str = None, logs_param='--no-log-prefix'
                       ) -> tuple[JobResult, bytes] | tuple[OperationError, None]:
         sys.stdout.flush()
@@ -121,34 +246,29 @@ class ComposeShellInterface:
             services = []
         services = ' '.join(services)
 
-        process = await asyncio.create_subprocess_shell(
-            cmd := f'/usr/local/bin/docker-compose --project-directory {root} logs {logs_param} {services}',
-            env=env,
-            cwd=root,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        cmd = f'/usr/local/bin/docker-compose --project-directory {root} logs {logs_param} {services}'
         CONSOLE.print(Text(
             f'{cmd}',
             style=Style.context
         ))
-        stdout, stderr = await process_output_till_done(process, False)
+        returncode, stdout, stderr = await self._run_process(
+            cmd, env, root, CommandPriority.LOGS, False,
+            capture_factory=lambda: RingBufferCapture(self.logs_capture_limit),
+        )
 
-        if process.returncode != 0:
+        if returncode != 0:
             print(f"Can't get {services} logs")
-            state_result = await self.dc_state()
-            if state_result == JobResult.GOOD:
-                return OperationError(
-                    f'Stdout:\n{stdout}\n\nStderr:\n{stderr}\n\nComposeState:\n{state_result.as_rich_text()}'
-                ), None
-            return OperationError(f'Stdout:\n{stdout}\n\nStderr:\n{stderr}\n\nComposeState:\n{state_result}'), None
+            return await self._make_operation_error(stdout, stderr), None
 
         return JobResult.GOOD, stdout
 
-    @retry(attempts=3, delay=1, until=lambda x: x == JobResult.BAD)
-    async def dc_exec(self, container: str, cmd: str, env: dict = None, root: Path | str = None
-                      ) -> tuple[JobResult, bytes, bytes] | tuple[OperationError, bytes, bytes]:
-        print(f'Executing {cmd} in {container} container')
+    async def dc_logs_to_file(self, services: list[str], path: Path, tail_bytes: int, env: dict = None,
+                              root: Path | str = None, logs_param='--no-log-prefix'
+                              ) -> tuple[JobResult, bytes] | tuple[OperationError, None]:
+        """
+        Whole services logs written to path: kept in memory up to logs capture limit, spilled to disk above it
+        instead of being dropped. Only their last tail_bytes are returned
+        """
         sys.stdout.flush()
 
         if env is None:
@@ -158,41 +278,33 @@ class ComposeShellInterface:
         if root is None:
             root = self.in_docker_project_root
 
-        process = await asyncio.create_subprocess_shell(
-            cmd := f'/usr/local/bin/docker-compose --project-directory {root} exec {self.extra_exec_params} {container} {cmd}',
-            env=env,
-            cwd=root,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        debug = f'; in {root}; with {env}' if self.debug_docker_compose_commands else ''
+        cmd = f'/usr/local/bin/docker-compose --project-directory {root} logs {logs_param} {" ".join(services)}'
         CONSOLE.print(Text(
             f'{cmd}',
             style=Style.context
-        ) + ' ' + Text(
-            f'{debug}',
-            style=Style.regular
         ))
-        stdout, stderr = await process_output_till_done(process, self.verbose_docker_compose_commands)
-
-        if process.returncode != 0:
-            print(f"Can't execute {cmd} in {container} successfully:\n{stdout=}, {stderr=}")
-            state_result = await self.dc_state()
-            if state_result == JobResult.GOOD:
-                return OperationError(
-                    f'Stdout:\n{stdout}\n\nStderr:\n{stderr}\n\nComposeState:\n{state_result.as_rich_text()}'
-                ), stdout, stderr
-            return OperationError(
-                f'Stdout:\n{stdout}\n\nStderr:\n{stderr}\n\nComposeState:\n{state_result}'
-            ), stdout, stderr
-
-        return JobResult.GOOD, stdout, stderr
-
-    async def dc_exec_process_pids(self, container: str,
-                                   cmd: str,
-                                   env: dict = None,
-                                   root: Path | str = None,
-                                   ) -> tuple[JobResult, bytes, bytes] | list[int] | tuple[OperationError, bytes, bytes]:
+        returncode, stdout_capture, stderr_capture = await self._run_process_captured(
+            cmd, env, root, CommandPriority.LOGS, False,
+            capture_factory=lambda: SpillToDiskCapture(self.logs_capture_limit, directory=path.parent),
+        )
+        try:
+            if returncode != 0:
+                print(f"Can't get {services} logs")
+                return await self._make_operation_error(stdout_capture.getvalue(), stderr_capture.getvalue()), None
+
+            await asyncio.to_thread(stdout_capture.copy_to_file, path)
+            return JobResult.GOOD, stdout_capture.tail(tail_bytes)
+        finally:
+            stdout_capture.close()
+            stderr_capture.close()
+
+    async def dc_logs_stream(self, services: list[str], tail: int = None, since: str = None, until: str = None,
+                             follow: bool = False, env: dict = None, root: Path | str = None
+                             ) -> AsyncIterator[ComposeLogLine]:
+        """
+        Services log lines with timestamps as compose prints them, interleaved. Without follow takes
+        compose commands slot to start; followed logs don't, they are long-lived. Process is killed when iteration stops
+        """
         if env is None:
             env = {}
         env = self.execution_envs | env
@@ -200,42 +312,48 @@ class ComposeShellInterface:
         if root is None:
             root = self.in_docker_project_root
 
-        def process_command(command: str) -> str:
-            parts = shlex.split(command)
-            if parts[0] == 'sh':
-                return process_command(parts[2])
-
-            return parts[0]
+        logs_params = ['--no-color', '--timestamps']
+        if tail is not None:
+            logs_params.append(f'--tail {int(tail)}')
+        if since:
+            logs_params.append(f'--since {shlex.quote(since)}')
+        if until:
+            logs_params.append(f'--until {shlex.quote(until)}')
+        if follow:
+            logs_params.append('--follow')
+
+        cmd = (f'/usr/local/bin/docker-compose --project-directory {root} logs {" ".join(logs_params)} '
+               f'{" ".join(shlex.quote(service) for service in services or [])}')
+        CONSOLE.print(Text(
+            f'{cmd}',
+            style=Style.context
+        ))
+        # slot is held for process start only: a slow consumer must not block other env compose commands
+        slot = nullcontext() if follow else self._scheduler.slot(CommandPriority.LOGS, env_key=self.compose_files)
+        async with slot:
+            process = await asyncio.create_subprocess_shell(
+                cmd,
+                env=env,
+                cwd=root,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                # killed as a group, like execs: followed `logs -f` must not outlive disconnected client
+                start_new_session=True,
+            )
+        try:
+            async for output_line in iter_process_output(process):
+                if output_line.stream == 'stdout':
+                    yield parse_compose_log_line(output_line.line)
+        finally:
+            if process.returncode is None:
+                _kill_process_group(process)
+                await process.wait()
 
-        cmd = process_command(cmd)
-        process_state = await asyncio.create_subprocess_shell(
-            check_cmd := f'/usr/local/bin/docker-compose --project-directory {root} exec {self.extra_exec_params} {container} pidof {cmd}',
-            env=env,
-            cwd=root,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process_state.communicate()
-        check_output = stdout.decode('utf-8')
-
-        if check_output != '':
-            try:
-                pids = [int(pid) for pid in check_output.split(' ')]
-                CONSOLE.print(f'Process still running: {cmd} in {container} with:\n  {pids}')
-                await self._dc_exec_print_processes(container, env, root)
-                return pids
-            except ValueError:
-                ...
-            CONSOLE.print(f'Somthing wrong:\n  {check_output}')
-            return [-1]
-        else:
-            CONSOLE.print(f'Process done: {cmd} in {container}')
-            return []
+    async def dc_exec(self, container: str, cmd: str, env: dict = None, root: Path | str = None
+                      ) -> tuple[JobResult, bytes, bytes] | tuple[OperationError, bytes, bytes]:
+        print(f'Executing {cmd} in {container} container')
+        sys.stdout.flush()
 
-    async def _dc_exec_print_processes(self, container: str,
-                                       env: dict = None,
-                                       root: Path | str = None,
-                                       ) -> None:
         if env is None:
             env = {}
         env = self.execution_envs | env
@@ -243,37 +361,96 @@ class ComposeShellInterface:
         if root is None:
             root = self.in_docker_project_root
 
-        processes_state = await asyncio.create_subprocess_shell(
-            get_cmd := f'/usr/local/bin/docker-compose --project-directory {root} exec {self.extra_exec_params} {container} ps -a',
-            env=env,
-            cwd=root,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        cmd = f'/usr/local/bin/docker-compose --project-directory {root} exec {self.extra_exec_params} {container} {cmd}'
+        debug = f'; in {root}; with {env}' if self.debug_docker_compose_commands else ''
+        CONSOLE.print(Text(
+            f'{cmd}',
+            style=Style.context
+        ) + ' ' + Text(
+            f'{debug}',
+            style=Style.regular
+        ))
+        returncode, stdout, stderr = await self._run_process(
+            cmd, env, root, CommandPriority.EXEC, self.verbose_docker_compose_commands, self.exec_retry_policy
         )
-        stdout, stderr = await processes_state.communicate()
-        CONSOLE.print('Processes state:')
-        CONSOLE.print(stdout.decode('utf-8'))
-        CONSOLE.print(stderr.decode('utf-8'))
+
+        if returncode != 0:
+            print(f"Can't execute {cmd} in {container} successfully:\n{stdout=}, {stderr=}")
+            return await self._make_operation_error(stdout, stderr), stdout, stderr
+
+        return JobResult.GOOD, stdout, stderr
 
     async def dc_exec_till_complete(self, container: str,
                                     cmd: str,
                                     env: dict = None,
                                     root: Path | str = None
                                     ) -> tuple[JobResult, bytes, bytes] | tuple[OperationError, bytes, bytes]:
-        result = await self.dc_exec(container, cmd, env, root)
+        """
+        Foreground `docker-compose exec` lasts exactly as long as executed command and exits with its exit code,
+        so completion and result are known as soon as exec process is done - no extra in-container checks needed
+        """
+        result, stdout, stderr = await self.dc_exec(container, cmd, env, root)
+        CONSOLE.print(f'Process done: {cmd} in {container}')
+        return result, stdout, stderr
+
+    async def dc_exec_stream(self, container: str, command: str, stdin: bytes = None, timeout: float = None,
+                             env: dict = None, root: Path | str = None
+                             ) -> AsyncIterator[ExecOutput | ExecExit]:
+        """
+        Shell command output chunks as they come, then its exit. One `docker-compose exec` process, no in-container
+        output files; process is killed on timeout or when iteration stops
+        """
+        if env is None:
+            env = {}
+        env = self.execution_envs | env
 
-        processes = await retry(attempts=30, delay=1, until=lambda pids: pids != [] and pids != [-1])(
-            self.dc_exec_process_pids
-        )(container, cmd)
-        if processes:
-            if processes == [-1]:
-                CONSOLE.print('  Process was not checked for completion')
-            else:
-                CONSOLE.print('  !!! WARN !!! - Process was not completed')
+        if root is None:
+            root = self.in_docker_project_root
 
-        return result
+        cmd = (f'/usr/local/bin/docker-compose --project-directory {root} exec {self.extra_exec_params} '
+               f'{container} sh -c {shlex.quote(command)}')
+        CONSOLE.print(Text(
+            f'{cmd}',
+            style=Style.context
+        ))
+        deadline = asyncio.get_running_loop().time() + timeout if timeout is not None else None
+        # slot is held for process start only: streamed command lasts as long as its consumer reads it
+        async with self._scheduler.slot(CommandPriority.EXEC, env_key=self.compose_files):
+            process = await asyncio.create_subprocess_shell(
+                cmd,
+                env=env,
+                cwd=root,
+                stdin=subprocess.PIPE if stdin is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                # whole group is killed: shell wrapping compose could leave it running with output pipes open
+                start_new_session=True,
+            )
+        stdin_writer = asyncio.ensure_future(_write_stdin(process, stdin)) if stdin is not None else None
+        output = iter_process_output(process, chunk_size=EXEC_OUTPUT_CHUNK_SIZE)
+        try:
+            while True:
+                remaining = deadline - asyncio.get_running_loop().time() if deadline is not None else None
+                try:
+                    output_chunk = await asyncio.wait_for(anext(output), remaining)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    CONSOLE.print(Text(f'Exec timed out after {timeout}s: {command} in {container}',
+                                       style=Style.suspicious))
+                    yield ExecExit(exit_code=None, timed_out=True)
+                    return
+                yield ExecOutput(output_chunk.stream, output_chunk.line)
+            yield ExecExit(exit_code=process.returncode)
+        finally:
+            await output.aclose()
+            if stdin_writer is not None:
+                stdin_writer.cancel()
+                await asyncio.gather(stdin_writer, return_exceptions=True)
+            if process.returncode is None:
+                _kill_process_group(process)
+                await process.wait()
 
-    @retry(attempts=3, delay=1, until=lambda x: x == JobResult.BAD)
     async def dc_down(self, services: list[str], env: dict = None,
                       root: Path | str = None) -> JobResult | OperationError:
         print(f'Downing {services} containers')
@@ -286,13 +463,7 @@ class ComposeShellInterface:
         if root is None:
             root = self.in_docker_project_root
 
-        process = await asyncio.create_subprocess_shell(
-            cmd := f'/usr/local/bin/docker-compose --project-directory {root} down ' + ' '.join(services),
-            env=env,
-            cwd=root,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        cmd = f'/usr/local/bin/docker-compose --project-directory {root} down ' + ' '.join(services)
         debug = f'; in {root}; with {env}' if self.debug_docker_compose_commands else ''
         CONSOLE.print(Text(
             f'{cmd}',
@@ -301,16 +472,13 @@ class ComposeShellInterface:
             f'{debug}',
             style=Style.regular
         ))
-        stdout, stderr = await process_output_till_done(process, self.verbose_docker_compose_commands)
+        returncode, stdout, stderr = await self._run_process(
+            cmd, env, root, CommandPriority.UP_DOWN, self.verbose_docker_compose_commands
+        )
 
-        if process.returncode != 0:
+        if returncode != 0:
             # TODO swap print to CONSOLE
             print(f"Can't down {services} successfully")
-            state_result = await self.dc_state()
-            if state_result == JobResult.GOOD:
-                return OperationError(
-                    f'Stdout:\n{stdout}\n\nStderr:\n{stderr}\n\nComposeState:\n{state_result.as_rich_text()}'
-                )
-            return OperationError(f'Stdout:\n{stdout}\n\nStderr:\n{stderr}\n\nComposeState:\n{state_result}')
+            return await self._make_operation_error(stdout, stderr)
 
         return JobResult.GOOD
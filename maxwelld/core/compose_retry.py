@@ -0,0 +1,54 @@
+import random
+from enum import Enum
+from enum import auto
+from typing import NamedTuple
+
+
+class FailureKind(Enum):
+    TRANSIENT = auto()
+    PERMANENT = auto()
+
+
+# docker daemon / registry / network hiccups: same command could succeed on next attempt
+TRANSIENT_FAILURE_MARKERS = (
+    b'cannot connect to the docker daemon',
+    b'connection refused',
+    b'connection reset',
+    b'broken pipe',
+    b'i/o timeout',
+    b'tls handshake timeout',
+    b'context deadline exceeded',
+    b'client.timeout exceeded',
+    b'timed out',
+    b'temporary failure in name resolution',
+    b'toomanyrequests',
+    b'too many requests',
+    b'502 bad gateway',
+    b'503 service unavailable',
+    b'504 gateway timeout',
+    b'unexpected eof',
+)
+
+
+def classify_failure(returncode: int, stderr: bytes) -> FailureKind:
+    if returncode < 0:
+        # killed by signal, not by command itself
+        return FailureKind.TRANSIENT
+
+    lowered_stderr = stderr.lower()
+    if any(marker in lowered_stderr for marker in TRANSIENT_FAILURE_MARKERS):
+        return FailureKind.TRANSIENT
+    return FailureKind.PERMANENT
+
+
+class RetryPolicy(NamedTuple):
+    attempts: int
+    base_delay_s: float
+    max_delay_s: float
+
+    def delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with equal jitter for attempt number starting from 1
+        """
+        backoff = min(self.max_delay_s, self.base_delay_s * 2 ** (attempt - 1))
+        return backoff / 2 + random.uniform(0, backoff / 2)
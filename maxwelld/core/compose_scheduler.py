@@ -0,0 +1,137 @@
+import asyncio
+import bisect
+import itertools
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator
+from typing import NamedTuple
+
+from maxwelld.core.config import Config
+
+
+class CommandPriority(IntEnum):
+    """
+    Lower value runs first when compose commands slots are exhausted
+    """
+    STATE = 0
+    UP_DOWN = 1
+    EXEC = 2
+    LOGS = 3
+
+
+class QueuedCommand(NamedTuple):
+    priority: CommandPriority
+    seq: int
+    env_key: str
+    slot: asyncio.Future
+
+
+class CommandsWaitStats:
+    def __init__(self):
+        self.count = 0
+        self.total_wait_s = 0.0
+        self.max_wait_s = 0.0
+
+    def record(self, wait_s: float):
+        self.count += 1
+        self.total_wait_s += wait_s
+        self.max_wait_s = max(self.max_wait_s, wait_s)
+
+    def as_json(self) -> dict:
+        return {
+            'count': self.count,
+            'avg_wait_s': self.total_wait_s / self.count if self.count else 0.0,
+            'max_wait_s': self.max_wait_s,
+        }
+
+
+class ComposeCommandsScheduler:
+    """
+    Bounds simultaneously running compose processes: globally and per env (compose files set).
+    Waiting commands are started by priority, then by arrival order.
+    """
+
+    def __init__(self, concurrency_limit: int, per_env_concurrency_limit: int):
+        self._concurrency_limit = concurrency_limit
+        self._per_env_concurrency_limit = per_env_concurrency_limit
+        self._running = 0
+        self._running_by_env: Counter[str] = Counter()
+        self._queue: list[QueuedCommand] = []
+        self._seq = itertools.count()
+        self._wait_stats = {priority: CommandsWaitStats() for priority in CommandPriority}
+
+    def _has_slot(self, env_key: str) -> bool:
+        return (self._running < self._concurrency_limit
+                and self._running_by_env[env_key] < self._per_env_concurrency_limit)
+
+    def _occupy(self, env_key: str) -> None:
+        self._running += 1
+        self._running_by_env[env_key] += 1
+
+    def _release(self, env_key: str) -> None:
+        self._running -= 1
+        self._running_by_env[env_key] -= 1
+        if not self._running_by_env[env_key]:
+            del self._running_by_env[env_key]
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        for command in list(self._queue):
+            if self._running >= self._concurrency_limit:
+                return
+            if not self._has_slot(command.env_key):
+                continue
+            self._queue.remove(command)
+            self._occupy(command.env_key)
+            command.slot.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, priority: CommandPriority, env_key: str) -> AsyncIterator[None]:
+        queued_at = time.monotonic()
+        if self._has_slot(env_key):
+            self._occupy(env_key)
+        else:
+            command = QueuedCommand(priority, next(self._seq), env_key, asyncio.get_running_loop().create_future())
+            bisect.insort(self._queue, command, key=lambda queued: (queued.priority, queued.seq))
+            try:
+                await command.slot
+            except asyncio.CancelledError:
+                if command.slot.done() and not command.slot.cancelled():
+                    self._release(env_key)
+                else:
+                    self._queue.remove(command)
+                raise
+        self._wait_stats[priority].record(time.monotonic() - queued_at)
+
+        try:
+            yield
+        finally:
+            self._release(env_key)
+
+    def stats(self) -> dict:
+        return {
+            'running': self._running,
+            'queue_depth': {
+                priority.name.lower(): sum(1 for command in self._queue if command.priority == priority)
+                for priority in CommandPriority
+            },
+            'wait': {
+                priority.name.lower(): self._wait_stats[priority].as_json()
+                for priority in CommandPriority
+            },
+        }
+
+
+_compose_commands_scheduler: ComposeCommandsScheduler | None = None
+
+
+def get_compose_commands_scheduler() -> ComposeCommandsScheduler:
+    global _compose_commands_scheduler
+    if _compose_commands_scheduler is None:
+        _compose_commands_scheduler = ComposeCommandsScheduler(
+            concurrency_limit=Config().compose_commands_concurrency_limit,
+            per_env_concurrency_limit=Config().compose_commands_per_env_concurrency_limit,
+        )
+    return _compose_commands_scheduler
@@ -2,6 +2,11 @@ import os
 from pathlib import Path
 
 
+class StateBackendType:
+    COMPOSE = 'compose'
+    DOCKER_API = 'docker_api'
+
+
 class Config:
     def __init__(self):
         self.project: str = os.environ.get('COMPOSE_PROJECT_NAME')
@@ -26,3 +31,43 @@ class Config:
         self.service_up_check_attempts = int(os.environ.get('PRE_MIGRATIONS_CHECK_SERVICE_UP_ATTEMPTS', 100))
         self.service_up_check_delay = int(os.environ.get('PRE_MIGRATIONS_CHECK_SERVICE_UP_CHECK_DELAY', 3))
         self.docker_compose_extra_exec_params = os.environ.get('DOCKER_COMPOSE_EXTRA_EXEC_PARAMS', '-T')
+        # compose - `docker-compose ps` subprocess; docker_api - Docker Engine API over DOCKER_HOST
+        self.state_backend = os.environ.get('STATE_BACKEND', StateBackendType.COMPOSE)
+        self.docker_api_connections_limit = int(os.environ.get('DOCKER_API_CONNECTIONS_LIMIT', 10))
+        self.docker_api_timeout = float(os.environ.get('DOCKER_API_TIMEOUT', 30))
+        # services state shared between handlers; 0 - only concurrent requests coalescing
+        self.state_cache_ttl = float(os.environ.get('STATE_CACHE_TTL', 1))
+        # in-memory services state index fed by docker events stream
+        self.state_events_enabled = bool(os.environ.get('STATE_EVENTS_ENABLED', False))
+        self.state_events_reconnect_delay = float(os.environ.get('STATE_EVENTS_RECONNECT_DELAY', 1))
+        # simultaneously running compose processes: overall and per env
+        self.compose_commands_concurrency_limit = int(os.environ.get('COMPOSE_COMMANDS_CONCURRENCY_LIMIT', 16))
+        self.compose_commands_per_env_concurrency_limit = int(
+            os.environ.get('COMPOSE_COMMANDS_PER_ENV_CONCURRENCY_LIMIT', 4)
+        )
+        # compose commands retried only on transient (docker daemon, network) failures with exponential backoff
+        self.compose_retry_attempts = int(os.environ.get('COMPOSE_RETRY_ATTEMPTS', 3))
+        self.compose_state_retry_attempts = int(os.environ.get('COMPOSE_STATE_RETRY_ATTEMPTS', 10))
+        self.compose_retry_base_delay = float(os.environ.get('COMPOSE_RETRY_BASE_DELAY', 0.5))
+        self.compose_retry_max_delay = float(os.environ.get('COMPOSE_RETRY_MAX_DELAY', 10))
+        # `docker-compose logs` output kept in daemon memory: only last bytes of each stream
+        self.compose_logs_capture_limit = int(os.environ.get('COMPOSE_LOGS_CAPTURE_LIMIT', 16 * 1024 * 1024))
+        # pickled env configs by digest, containers labels carry only digests
+        self.env_config_store_path: Path = self.tmp_envs_path / os.environ.get('ENV_CONFIG_STORE_DIRECTORY',
+                                                                               '.env-configs')
+        self.env_config_store_lru_size = int(os.environ.get('ENV_CONFIG_STORE_LRU_SIZE', 128))
+        # stored configs no container refers to are removed at start and after downs, unless stored recently
+        self.env_config_store_gc_min_age = float(os.environ.get('ENV_CONFIG_STORE_GC_MIN_AGE', 3600))
+        # server side services readiness wait: state re-check interval without containers events, max wait
+        self.wait_poll_interval = float(os.environ.get('WAIT_POLL_INTERVAL', 1))
+        self.wait_max_timeout = float(os.environ.get('WAIT_MAX_TIMEOUT', 600))
+        # finished up jobs kept with their timings and results
+        self.up_jobs_history_size = int(os.environ.get('UP_JOBS_HISTORY_SIZE', 100))
+        # services logs fetched concurrently for one request (also bounded by per env compose commands limit)
+        self.logs_concurrency_limit = int(os.environ.get('LOGS_CONCURRENCY_LIMIT', 8))
+        # up failure reports carry only services logs tails, full logs are written to env tmp directory
+        self.diagnostics_logs_tail_lines = int(os.environ.get('DIAGNOSTICS_LOGS_TAIL_LINES', 100))
+        self.diagnostics_logs_tail_bytes = int(os.environ.get('DIAGNOSTICS_LOGS_TAIL_BYTES', 16 * 1024))
+        # exec records (output polled by uid): forgotten when not accessed for ttl or least recently used over size
+        self.execs_registry_size = int(os.environ.get('EXECS_REGISTRY_SIZE', 1000))
+        self.execs_registry_ttl = float(os.environ.get('EXECS_REGISTRY_TTL', 3600))
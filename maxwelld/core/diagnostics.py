@@ -0,0 +1,108 @@
+import asyncio
+from pathlib import Path
+from typing import NamedTuple
+
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.compose_interface import ComposeShellInterface
+from maxwelld.core.services_logs import gather_services_logs
+from maxwelld.core.state_diff import is_service_ready
+from maxwelld.helpers.jobs_result import JobResult
+from maxwelld.helpers.jobs_result import OperationError
+
+
+def bytes_tail(data: bytes, max_lines: int, max_bytes: int) -> tuple[bytes, bool]:
+    """
+    Last max_lines lines of data, at most max_bytes of them; and whether anything was cut
+    """
+    # trailing newline ends the last line, it doesn't start one more
+    body, newline = (data[:-1], b'\n') if data.endswith(b'\n') else (data, b'')
+    tail = b'\n'.join(body.rsplit(b'\n', max_lines)[-max_lines:]) + newline
+    if len(tail) > max_bytes:
+        tail = tail[-max_bytes:]
+    return tail, len(tail) < len(data)
+
+
+class DiagnosticsReport(NamedTuple):
+    services_state: ServicesComposeState | None
+    logs_tails: dict[str, bytes | None]
+    truncated: set[str]
+    logs_directory: Path | None  # full logs, as seen from host
+
+    def __str__(self):
+        report = []
+        if self.services_state is not None:
+            report.append(f'Services status:\n {self.services_state.as_rich_text()}')
+        if self.logs_tails:
+            full_logs_hint = f'; full logs in {self.logs_directory}' if self.logs_directory and self.truncated else ''
+            report.append(f'Services logs tails{full_logs_hint}:')
+            for service, log_tail in self.logs_tails.items():
+                report.append(f'--- {service}{" (truncated)" if service in self.truncated else ""} ---')
+                report.append(log_tail.decode('utf-8', errors='replace') if log_tail is not None
+                              else "Can't get logs")
+        return '\n'.join(report)
+
+
+class DiagnosticsCollector:
+    """
+    Compact env failure report: services state and tails of (by default only not ready) services logs,
+    fetched in parallel. Full logs are written to env tmp directory instead of error message
+    """
+
+    def __init__(self, compose_executor: ComposeShellInterface, logs_directory: Path | None,
+                 host_logs_directory: Path | None, tail_lines: int, tail_bytes: int, concurrency_limit: int):
+        self._compose_executor = compose_executor
+        self._logs_directory = logs_directory
+        self._host_logs_directory = host_logs_directory
+        self._tail_lines = tail_lines
+        self._tail_bytes = tail_bytes
+        self._concurrency_limit = concurrency_limit
+
+    @staticmethod
+    def _select_services(services_state: ServicesComposeState | None, services: list[str]) -> list[str]:
+        if services_state is None:
+            return services
+        failing_services = [
+            service for service in services
+            if (service_state := services_state.get_by_name(service)) is None or not is_service_ready(service_state)
+        ]
+        # everything is up, e.g. migration failed: report all
+        return failing_services or services
+
+    async def _get_logs(self, service: str) -> tuple[JobResult, bytes] | tuple[OperationError, None]:
+        return await self._compose_executor.dc_logs([service])
+
+    async def _get_logs_to_file(self, service: str) -> tuple[JobResult, bytes] | tuple[OperationError, None]:
+        # whole logs go to file, only their tail (a byte over to tell if it is cut) is kept in memory
+        return await self._compose_executor.dc_logs_to_file(
+            [service], self._logs_directory / f'{service}.log', tail_bytes=self._tail_bytes + 1,
+        )
+
+    async def collect(self, services: list[str], only_failing: bool = True) -> DiagnosticsReport:
+        services_state = await self._compose_executor.dc_state()
+        if not isinstance(services_state, ServicesComposeState):
+            services_state = None
+
+        if only_failing:
+            services = self._select_services(services_state, services)
+
+        get_logs = self._get_logs
+        if self._logs_directory is not None:
+            await asyncio.to_thread(self._logs_directory.mkdir, parents=True, exist_ok=True)
+            get_logs = self._get_logs_to_file
+        logs = await gather_services_logs(get_logs, services, concurrency_limit=self._concurrency_limit)
+
+        logs_tails, truncated = {}, set()
+        for service, log in logs.items():
+            if log is None:
+                logs_tails[service] = None
+                continue
+            logs_tails[service], is_truncated = bytes_tail(log, self._tail_lines, self._tail_bytes)
+            if is_truncated:
+                truncated.add(service)
+
+        return DiagnosticsReport(
+            services_state=services_state,
+            logs_tails=logs_tails,
+            truncated=truncated,
+            logs_directory=self._host_logs_directory if self._logs_directory is not None else None,
+        )
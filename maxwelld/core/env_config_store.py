@@ -0,0 +1,101 @@
+import hashlib
+import os
+import pickle
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from maxwelld.core.config import Config
+
+
+class EnvConfigStore:
+    """
+    Content-addressed pickled env configs: files `<directory>/<digest>.pickle` shared between daemon restarts
+    and in-memory LRU of recently used configs. Containers carry only digests in labels.
+    """
+
+    def __init__(self, directory: Path, lru_size: int = 128):
+        self._directory = directory
+        self._lru_size = lru_size
+        self._lru: OrderedDict[str, Any] = OrderedDict()
+
+    @staticmethod
+    def digest_of(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()[:32]
+
+    @classmethod
+    def digest(cls, obj: Any) -> str:
+        return cls.digest_of(pickle.dumps(obj))
+
+    def _path(self, digest: str) -> Path:
+        return self._directory / f'{digest}.pickle'
+
+    def _remember(self, digest: str, obj: Any) -> None:
+        self._lru[digest] = obj
+        self._lru.move_to_end(digest)
+        while len(self._lru) > self._lru_size:
+            self._lru.popitem(last=False)
+
+    def put(self, obj: Any) -> str:
+        data = pickle.dumps(obj)
+        digest = self.digest_of(data)
+        if (path := self._path(digest)).exists():
+            # stored again for new env: not garbage till its containers are created
+            path.touch()
+            self._remember(digest, obj)
+            return digest
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        self._remember(digest, obj)
+        return digest
+
+    def get(self, digest: str) -> Any | None:
+        if digest in self._lru:
+            self._lru.move_to_end(digest)
+            return self._lru[digest]
+
+        try:
+            obj = pickle.loads(self._path(digest).read_bytes())
+        except FileNotFoundError:
+            return None
+        self._remember(digest, obj)
+        return obj
+
+    def collect_garbage(self, referenced: set[str], min_age_s: float) -> list[str]:
+        """
+        Removes configs with digests not in referenced, except ones stored within min_age_s: configs of starting
+        envs are stored before their containers exist. Returns removed digests
+        """
+        if not self._directory.exists():
+            return []
+        stored_before = time.time() - min_age_s
+        removed = []
+        for path in self._directory.glob('*.pickle'):
+            if (digest := path.stem) in referenced:
+                continue
+            try:
+                if path.stat().st_mtime > stored_before:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            self._lru.pop(digest, None)
+            removed.append(digest)
+        return removed
+
+
+_env_config_store: EnvConfigStore | None = None
+
+
+def get_env_config_store() -> EnvConfigStore:
+    global _env_config_store
+    if _env_config_store is None:
+        _env_config_store = EnvConfigStore(
+            directory=Config().env_config_store_path,
+            lru_size=Config().env_config_store_lru_size,
+        )
+    return _env_config_store
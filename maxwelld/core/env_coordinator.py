@@ -0,0 +1,85 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Hashable
+from typing import TypeVar
+
+from maxwelld.core.compose_scheduler import CommandsWaitStats
+
+T = TypeVar('T')
+
+
+class KeyLock:
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class EnvCoordinator:
+    """
+    Single-flight env startups: concurrent requests of the same env (name and fingerprint) join one in-flight
+    startup and share its result or error, different envs start in parallel.
+    Per key locks guard shared env resources (e.g. env tmp files directory).
+    """
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._locks: dict[Hashable, KeyLock] = {}
+        self._started = 0
+        self._joined_wait_stats = CommandsWaitStats()
+        self._lock_wait_stats = CommandsWaitStats()
+
+    async def join_or_start(self, key: Hashable, start: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """
+        Result of in-flight startup for key or of new `start()`, and whether startup was joined.
+        Startup runs in its own task: it isn't cancelled with the request that started it
+        """
+        if (task := self._in_flight.get(key)) is not None:
+            started_at = time.monotonic()
+            try:
+                return await asyncio.shield(task), True
+            finally:
+                self._joined_wait_stats.record(time.monotonic() - started_at)
+
+        task = asyncio.create_task(start())
+        self._in_flight[key] = task
+        self._started += 1
+        task.add_done_callback(lambda done_task: self._forget(key, done_task))
+        return await asyncio.shield(task), False
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved by awaiting requests, if any are left
+
+    @asynccontextmanager
+    async def locked(self, key: Hashable) -> AsyncIterator[None]:
+        key_lock = self._locks.setdefault(key, KeyLock())
+        key_lock.users += 1
+        started_at = time.monotonic()
+        try:
+            async with key_lock.lock:
+                self._lock_wait_stats.record(time.monotonic() - started_at)
+                yield
+        finally:
+            key_lock.users -= 1
+            if not key_lock.users:
+                del self._locks[key]
+
+    async def close(self) -> None:
+        tasks = list(self._in_flight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            'in_flight': len(self._in_flight),
+            'started': self._started,
+            'joined': self._joined_wait_stats.as_json(),
+            'locks': self._lock_wait_stats.as_json(),
+        }
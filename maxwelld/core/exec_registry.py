@@ -0,0 +1,53 @@
+import time
+from collections import OrderedDict
+
+from maxwelld.helpers.exec_record import ExecRecord
+
+
+def parse_exit_code(output: bytes) -> int | None:
+    """
+    Exit code from exec exit code file contents (its last line), None while command is running
+    """
+    lines = output.strip().splitlines()
+    if not lines or not lines[-1].strip().isdigit():
+        return None
+    return int(lines[-1])
+
+
+class ExecRegistry:
+    """
+    Exec records by uid, least recently used first: records not accessed for ttl are forgotten,
+    over limit least recently used ones are
+    """
+
+    def __init__(self, limit: int = 1000, ttl_s: float = 3600):
+        self._limit = limit
+        self._ttl_s = ttl_s
+        self._records: OrderedDict[str, tuple[ExecRecord, float]] = OrderedDict()
+
+    def _evict(self) -> None:
+        expired_at = time.monotonic() - self._ttl_s
+        while self._records:
+            uid, (_, accessed_at) = next(iter(self._records.items()))
+            if accessed_at >= expired_at and len(self._records) <= self._limit:
+                break
+            del self._records[uid]
+
+    def add(self, record: ExecRecord) -> None:
+        self._records[record.uid] = (record, time.monotonic())
+        self._evict()
+
+    def get(self, uid: str) -> ExecRecord | None:
+        self._evict()
+        if uid not in self._records:
+            return None
+        record, _ = self._records.pop(uid)
+        self._records[uid] = (record, time.monotonic())
+        return record
+
+    def list(self) -> list[ExecRecord]:
+        self._evict()
+        return [record for record, _ in self._records.values()]
+
+    def __len__(self) -> int:
+        return len(self._records)
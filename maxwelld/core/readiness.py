@@ -0,0 +1,46 @@
+from enum import Enum
+
+from maxwelld.core.compose_data_types import ComposeState
+from maxwelld.core.compose_data_types import ServiceComposeState
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.state_diff import is_service_ready
+from maxwelld.helpers.labels import Label
+
+
+class ReadinessResult(str, Enum):
+    READY = 'ready'
+    FAILED = 'failed'
+    TIMEOUT = 'timeout'
+
+
+def get_waited_service_name(service_state: ServiceComposeState, services: list[str]) -> str | None:
+    """
+    Which of waited services the container is: services are given by container names or by env template names,
+    containers of isolated envs are named with env id suffix (web-a1b2) and labeled with template name (web)
+    """
+    if service_state.name in services:
+        return service_state.name
+    if (template_name := service_state.get_label(Label.SERVICE_TEMPLATE_NAME)) in services:
+        return template_name
+    return None
+
+
+def evaluate_readiness(services_state: ServicesComposeState, services: list[str]) -> ReadinessResult | None:
+    """
+    READY when all listed services are running/healthy or exited successfully (same as client side
+    wait_all_services_up), FAILED when any of them exited with error, None while still starting
+    or some of them have no container (not created yet or removed)
+    """
+    waited_services = [
+        (service_state, waited_name)
+        for service_state in services_state
+        if (waited_name := get_waited_service_name(service_state, services)) is not None
+    ]
+    if any(service_state.state == ComposeState.EXITED and service_state.exit_code != 0
+           for service_state, _ in waited_services):
+        return ReadinessResult.FAILED
+    if {waited_name for _, waited_name in waited_services} != set(services):
+        return None
+    if all(is_service_ready(service_state) for service_state, _ in waited_services):
+        return ReadinessResult.READY
+    return None
@@ -1,9 +1,13 @@
+import asyncio
 import os
 import shlex
 import sys
 import warnings
 from itertools import groupby
 from pathlib import Path
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
 from uuid import uuid4
 
 from maxwelld.core.utils.compose_instance_cfg import get_absolute_compose_files
@@ -11,7 +15,6 @@ from maxwelld.core.utils.compose_instance_cfg import made_up_instance_compose_fi
 
 from maxwelld.core.utils.compose_instance_cfg import get_service_map
 
-from maxwelld.helpers.bytes_pickle import base64_pickled
 
 from maxwelld.env_description.env_types import Service
 
@@ -23,15 +26,38 @@ from rich.text import Text
 from maxwelld.client.types import EnvironmentId
 from maxwelld.core.compose_data_types import ServicesComposeState
 from maxwelld.core.compose_instance import ComposeInstanceProvider
+from maxwelld.core.compose_scheduler import get_compose_commands_scheduler
 from maxwelld.core.compose_interface import ComposeShellInterface
 from maxwelld.core.config import Config
+from maxwelld.core.env_config_store import get_env_config_store
+from maxwelld.core.env_coordinator import EnvCoordinator
+from maxwelld.core.exec_registry import ExecRegistry
+from maxwelld.core.exec_registry import parse_exit_code
+from maxwelld.core.readiness import ReadinessResult
+from maxwelld.core.readiness import evaluate_readiness
 from maxwelld.core.sequence_run_types import EMPTY_ID
+from maxwelld.core.services_logs import gather_services_logs
+from maxwelld.core.state_backends import ServicesStateBackend
+from maxwelld.core.state_backends import make_state_backend
+from maxwelld.core.state_cache import ServicesStateCache
+from maxwelld.core.state_diff import ServiceTransition
+from maxwelld.core.state_diff import diff_services_states
+from maxwelld.core.state_events import ContainersStateIndex
+from maxwelld.core.state_events import ContainersStateWatcher
+from maxwelld.core.state_events import make_events_source
+from maxwelld.core.state_versions import EnvStateVersions
+from maxwelld.core.up_jobs import UpJob
+from maxwelld.core.up_jobs import UpJobsRegistry
+from maxwelld.core.up_jobs import UpProgress
 from maxwelld.core.utils.compose_files import scan_for_compose_files
 from maxwelld.core.utils.compose_instance_cfg import get_new_env_id
+from maxwelld.core.utils.compose_logs import ComposeLogLine
+from maxwelld.core.utils.exec_output import ExecExit
+from maxwelld.core.utils.exec_output import ExecOutput
 from maxwelld.core.utils.env_files import make_debug_bash_env
+from maxwelld.core.utils.env_fingerprint import make_env_fingerprint
 from maxwelld.env_description.env_types import Environment
 from maxwelld.helpers.exec_record import ExecRecord
-from maxwelld.helpers.jobs_result import JobResult
 from maxwelld.helpers.labels import Label
 from maxwelld.output.console import CONSOLE
 from maxwelld.output.styles import Style
@@ -43,7 +69,8 @@ class MaxwellDemonService:
     def __init__(self,
                  config=Config,
                  compose_interface: type[ComposeShellInterface] = None,
-                 compose_instance_maker: type[ComposeInstanceProvider] = None):
+                 compose_instance_maker: type[ComposeInstanceProvider] = None,
+                 state_backend: ServicesStateBackend = None):
         # assert shutil.which("docker"), 'Docker not installed'
         # assert shutil.which("docker-compose"), 'Docker-compose not installed'
 
@@ -65,7 +92,14 @@ class MaxwellDemonService:
         self.host_project_root_directory = cfg.host_project_root_directory
         self.env_tmp_directory = cfg.env_tmp_directory
         self.host_env_tmp_directory = cfg.host_env_tmp_directory
-        self.execs: dict[str, ExecRecord] = {}
+        self.execs = ExecRegistry(limit=cfg.execs_registry_size, ttl_s=cfg.execs_registry_ttl)
+        self._wait_poll_interval = cfg.wait_poll_interval
+        self._wait_max_timeout = cfg.wait_max_timeout
+        self.up_jobs = UpJobsRegistry(finished_jobs_limit=cfg.up_jobs_history_size)
+        self._env_coordinator = EnvCoordinator()
+        self.state_versions = EnvStateVersions()
+        self._logs_concurrency_limit = cfg.logs_concurrency_limit
+        self._env_config_store_gc_min_age = cfg.env_config_store_gc_min_age
 
         self._compose_interface = ComposeShellInterface
         if compose_interface is not None:
@@ -83,6 +117,87 @@ class MaxwellDemonService:
             tmp_envs_path=self.tmp_envs_path,
         )
 
+        self._state_backend = state_backend
+        if state_backend is None:
+            self._state_backend = make_state_backend(cfg, self._compose_instance_manager)
+        self._state_cache = ServicesStateCache(self._state_backend, ttl=cfg.state_cache_ttl)
+
+        self._state_watcher: ContainersStateWatcher | None = None
+        if cfg.state_events_enabled:
+            self._state_watcher = ContainersStateWatcher(
+                index=ContainersStateIndex(),
+                state_backend=self._state_backend,
+                events_source=make_events_source(cfg, self._state_backend),
+                reconnect_delay_s=cfg.state_events_reconnect_delay,
+            )
+
+    async def close(self):
+        await self.up_jobs.close()
+        await self._env_coordinator.close()
+        if self._state_watcher is not None:
+            await self._state_watcher.close()
+        await self._state_cache.close()
+
+    def stats(self) -> dict:
+        return {
+            'state_cache': self._state_cache.stats(),
+            'compose_commands': get_compose_commands_scheduler().stats(),
+            'env_startups': self._env_coordinator.stats(),
+            'execs': len(self.execs),
+            'state_index': {
+                'synced': self._state_watcher.index.is_synced(),
+                'version': self._state_watcher.index.version,
+            } if self._state_watcher else None,
+        }
+
+    def _get_synced_state_index(self) -> ContainersStateIndex | None:
+        if self._state_watcher is None:
+            return None
+        self._state_watcher.start()
+        if not self._state_watcher.index.is_synced():
+            return None
+        return self._state_watcher.index
+
+    async def wait_services(
+        self, env_id: str, services: list[str] | None, timeout: float | None,
+        on_transitions: Callable[[list[ServiceTransition]], Awaitable[None]] = None,
+    ) -> tuple[ReadinessResult, ServicesComposeState]:
+        """
+        Waits till env services are ready or failed: woken by containers events when state index is synced,
+        otherwise re-checks (cached, shared by all waiters) state every wait_poll_interval.
+        Timeout is capped by wait_max_timeout
+        """
+        timeout = min(timeout or self._wait_max_timeout, self._wait_max_timeout)
+        if services is None:
+            if (environment := await self.env(env_id)) is None:
+                return ReadinessResult.FAILED, await self.status(env_id)
+            services = list(environment.get_services())
+
+        deadline = asyncio.get_running_loop().time() + timeout
+        previous_state, previous_version = None, None
+        while True:
+            state_index = self._get_synced_state_index()
+            index_version = state_index.version if state_index else None
+
+            services_state, state_version = await self.versioned_status(env_id)
+            if state_version != previous_version:
+                if on_transitions and (transitions := diff_services_states(previous_state, services_state)):
+                    await on_transitions(transitions)
+                previous_state, previous_version = services_state, state_version
+
+                if (result := evaluate_readiness(services_state, services)) is not None:
+                    return result, services_state
+
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                return ReadinessResult.TIMEOUT, services_state
+
+            if state_index and state_index.is_synced():
+                if state_index.version == index_version:
+                    await state_index.wait_changed(min(remaining, self._wait_poll_interval * 10))
+            else:
+                await asyncio.sleep(min(remaining, self._wait_poll_interval))
+
     def _unpack_services_env_template_params(self, env: Environment):
         return {service: env[service].env for service in env}
 
@@ -93,21 +208,18 @@ class MaxwellDemonService:
             name, config_template, compose_files, isolation, parallelism_limit, verbose, force_restart
         )
 
-    async def _get_existing(self, name: str, config_template: Environment | None, compose_files: str | None):
-        services_state = await self._compose_instance_manager.make_system().get_active_services_state()
-        services_states = services_state.get_all_for(
-            lambda service_state: (
-                service_state.check(Label.REQUEST_ENV_NAME, str(name))
-                and service_state.check(Label.ENV_CONFIG_TEMPLATE, base64_pickled(config_template))
-                and service_state.check(Label.COMPOSE_FILES, compose_files)
-            )
-        )
+    async def _get_existing(self, name: str, config_template: Environment, compose_files: str, fingerprint: str):
+        services_states = await self._state_cache.get_services_state(labels={
+            Label.REQUEST_ENV_NAME: str(name),
+            Label.COMPOSE_FILES: compose_files,
+            Label.ENV_FINGERPRINT: fingerprint,
+        })
 
-        if not services_states.as_json():
+        if not services_states:
             return None
 
         resul_service = services_states.get_any_for(Label.REQUEST_ENV_NAME, name)
-        env_id = resul_service.labels.get(Label.ENV_ID, None)
+        env_id = resul_service.get_label(Label.ENV_ID)
 
         # check all up or ok-exited
         map_service = get_service_map(config_template, env_id)
@@ -125,14 +237,8 @@ class MaxwellDemonService:
                       f'source ./env-tmp/{env_id}/.env')
         return env_id
 
-    async def up_or_get_existing(
-        self, name: str, config_template: Environment | None, compose_files: str | None, isolation=None,
-        parallelism_limit=None,
-        verbose=False,
-        force_restart: bool = False,
-        release_id: str = None,
-    ) -> tuple[EnvironmentId, bool]:
-
+    def _resolve_up_request(self, compose_files: str | None,
+                            config_template: Environment | None) -> tuple[str, Environment]:
         if not compose_files:
             # default docker compose files
             compose_files = ':'.join(
@@ -148,8 +254,61 @@ class MaxwellDemonService:
                     get_absolute_compose_files(compose_files, self.in_docker_project_root_path),
                 )]
             )
+        return compose_files, config_template
+
+    def start_up_job(
+        self, name: str, config_template: Environment | None, compose_files: str | None, isolation=None,
+        parallelism_limit=None,
+        verbose=False,
+        force_restart: bool = False,
+        release_id: str = None,
+    ) -> tuple[UpJob, bool]:
+        """
+        up_or_get_existing as background job with progress; attaches to running job of the same env
+        (name and fingerprint) and force_restart. Returns (job, attached)
+        """
+        compose_files, config_template = self._resolve_up_request(compose_files, config_template)
+        fingerprint = make_env_fingerprint(config_template, compose_files, self.in_docker_project_root_path)
+        return self.up_jobs.start(
+            key=(name, fingerprint, force_restart),
+            name=name,
+            run=lambda progress: self.up_or_get_existing(
+                name, config_template, compose_files, isolation, parallelism_limit, verbose, force_restart,
+                release_id, progress=progress,
+            ),
+        )
 
-        existing_inflight_env_id = await self._get_existing(name, config_template, compose_files)
+    async def up_or_get_existing(
+        self, name: str, config_template: Environment | None, compose_files: str | None, isolation=None,
+        parallelism_limit=None,
+        verbose=False,
+        force_restart: bool = False,
+        release_id: str = None,
+        progress: UpProgress = None,
+    ) -> tuple[EnvironmentId, bool]:
+
+        compose_files, config_template = self._resolve_up_request(compose_files, config_template)
+        fingerprint = make_env_fingerprint(config_template, compose_files, self.in_docker_project_root_path)
+        # force restart doesn't join startup of not restarted env
+        (env_id, is_new), joined = await self._env_coordinator.join_or_start(
+            (name, fingerprint, force_restart),
+            lambda: self._up_or_get_existing(
+                name, config_template, compose_files, fingerprint, parallelism_limit, verbose, force_restart,
+                release_id, progress,
+            ),
+        )
+        if joined:
+            CONSOLE.print(
+                Text('Joined in-flight startup of: ', style=Style.info)
+                .append(Text(name, style=Style.mark))
+            )
+        return env_id, is_new
+
+    async def _up_or_get_existing(
+        self, name: str, config_template: Environment, compose_files: str, fingerprint: str, parallelism_limit,
+        verbose: bool, force_restart: bool, release_id: str | None, progress: UpProgress | None,
+    ) -> tuple[EnvironmentId, bool]:
+        existing_inflight_env_id = await self._get_existing(name, config_template, compose_files, fingerprint)
         # TODO check all services up (makes now on client side)
         if existing_inflight_env_id and not force_restart:
             CONSOLE.print(
@@ -177,31 +336,38 @@ class MaxwellDemonService:
             compose_files=compose_files or ':'.join(scan_for_compose_files(self.in_docker_project_root_path)),
             config_template=config_template,
             release_id=release_id,
+            fingerprint=fingerprint,
         )
 
-        system_instance_manager = self._compose_instance_manager.make_system()
-        if parallelism_limit == 1:
-            # check if limit 1 - existing already not fit - down all current inflight
-            instances_to_down = await system_instance_manager.get_active_services_state()
-            env_ids = filter(
-                lambda x: x,
-                [
-                    instance_to_down.as_json()['labels'].get(Label.SERVICE_TEMPLATE_NAME, None)
-                    for instance_to_down in instances_to_down
-                ]
-            )
-            await self._compose_instance_manager.make_system().down(env_ids)
-            # TODO check if > 1
-            #          check current {name} is runnig?
-            #              runnig -> current {name} to down list
-            #              check curren - 1 > limit
-            #                   grab to down some of limit - (current - 1)
-
-        await target_compose_instance.cleanup()
-        await target_compose_instance.run()
-        target_compose_instance_files = target_compose_instance.compose_instance_files
-
-        make_debug_bash_env(target_compose_instance_files, self.host_env_tmp_directory)
+        # env tmp files directory is shared by all envs started with default service names
+        async with self._env_coordinator.locked(new_env_id):
+            if parallelism_limit == 1:
+                # check if limit 1 - existing already not fit - down all current inflight
+                instances_to_down = await self._state_cache.get_services_state()
+                env_ids = filter(
+                    lambda x: x,
+                    [
+                        instance_to_down.as_json()['labels'].get(Label.SERVICE_TEMPLATE_NAME, None)
+                        for instance_to_down in instances_to_down
+                    ]
+                )
+                await self._compose_instance_manager.make_system().down(env_ids)
+                self._state_cache.invalidate()
+                await self.collect_env_configs_garbage()
+                # TODO check if > 1
+                #          check current {name} is runnig?
+                #              runnig -> current {name} to down list
+                #              check curren - 1 > limit
+                #                   grab to down some of limit - (current - 1)
+
+            await target_compose_instance.cleanup()
+            try:
+                await target_compose_instance.run(progress)
+            finally:
+                self._state_cache.invalidate()
+            target_compose_instance_files = target_compose_instance.compose_instance_files
+
+            make_debug_bash_env(target_compose_instance_files, self.host_env_tmp_directory)
         CONSOLE.print(f'Docker-compose access: > cd {self.host_project_root_directory} && '
                       f'source ./env-tmp/{new_env_id}/.env')
 
@@ -221,8 +387,7 @@ class MaxwellDemonService:
         return new_env_id, True
 
     async def env(self, env_id: str) -> Environment | None:
-        system_instance_manager = self._compose_instance_manager.make_system()
-        services = await system_instance_manager.get_active_services_state()
+        services = await self._state_cache.get_services_state(labels={Label.ENV_ID: env_id})
         CONSOLE.print(f'get_env {env_id}:')
 
         CONSOLE.print(services.as_json())
@@ -230,91 +395,154 @@ class MaxwellDemonService:
 
         # CONSOLE.print(service_state.as_json())
         if service_state:
-            env_config = service_state.labels.get(Label.ENV_CONFIG, None)
-            return debase64_pickled(env_config)
+            if env_config_digest := service_state.get_label(Label.ENV_CONFIG_DIGEST):
+                return get_env_config_store().get(env_config_digest)
+            if legacy_env_config := service_state.get_label(Label.ENV_CONFIG):
+                return debase64_pickled(legacy_env_config)
 
         return None
 
-    async def status(self, env_id: str) -> ServicesComposeState:
-        system_instance_manager = self._compose_instance_manager.make_system()
-        services = await system_instance_manager.get_active_services_state()
-        services_status = services.get_all_for(lambda service_state: service_state.check(Label.ENV_ID, env_id))
+    async def collect_env_configs_garbage(self) -> None:
+        """
+        Removes stored env configs which no container refers to by its config digests labels
+        """
+        try:
+            services_state = await self._state_cache.get_services_state()
+        except Exception as e:
+            CONSOLE.print(Text(f"Can't get containers to collect env configs garbage: {e}", style=Style.suspicious))
+            return
+        referenced = {
+            digest
+            for service_state in services_state
+            for label in (Label.ENV_CONFIG_TEMPLATE_DIGEST, Label.ENV_CONFIG_DIGEST)
+            if (digest := service_state.get_label(label))
+        }
+        if removed := get_env_config_store().collect_garbage(referenced, self._env_config_store_gc_min_age):
+            CONSOLE.print(f'Removed {len(removed)} unused env configs')
 
-        assert isinstance(services_status, ServicesComposeState), "Can't execute docker-compose ps"
+    async def status(self, env_id: str) -> ServicesComposeState:
+        services_status, _ = await self.versioned_status(env_id)
         return services_status
 
-    async def exec(self, env_id: str, container: str, command: str, detached: bool = False):
-        uid = str(uuid4())
-        log_file = f'{uid}.log'
-        self.execs = {uid: ExecRecord(env_id, container, log_file)}
-
-        system_instance_manager = self._compose_instance_manager.make_system()
-        services = await system_instance_manager.get_active_services_state()
-        service_status = services.get_any_for(Label.ENV_ID, env_id)
-
-        env_compose_files = service_status.labels.get(Label.COMPOSE_FILES)
-
-        compose_interface = self._compose_interface(
-            compose_files=env_compose_files,
-            in_docker_project_root=self.in_docker_project_root_path
-        )
-
-        detached_str = ' &' if detached else ''
-        cmd = f'sh -c \'{shlex.quote(command)[1:-1]} > /tmp/{log_file} 2>&1 {detached_str}\''
-        await compose_interface.dc_exec(container, cmd)
-
-        job_result, stdout, stderr = await compose_interface.dc_exec(container, f'cat /tmp/{log_file}')
-        if job_result != JobResult.GOOD:
-            ...
-
-        return uid, stdout
-
-    async def get_exec_logs(self, uid: str):
-        if uid not in self.execs:
-            return b''
-
-        exec_record = self.execs[uid]
-
-        system_instance_manager = self._compose_instance_manager.make_system()
-        services = await system_instance_manager.get_active_services_state()
-        service_status = services.get_any_for(Label.ENV_ID, exec_record.env_id)
+    async def versioned_status(self, env_id: str) -> tuple[ServicesComposeState, int]:
+        """
+        Env services state and its version, changed only when services states changed
+        """
+        if state_index := self._get_synced_state_index():
+            services_status = state_index.get_env_state(env_id)
+        else:
+            services_status = await self._state_cache.get_services_state(labels={Label.ENV_ID: env_id})
+            assert isinstance(services_status, ServicesComposeState), "Can't execute docker-compose ps"
+
+        return services_status, self.state_versions.observe(env_id, services_status)
+
+    async def env_state(
+        self, env_id: str, services: list[str] = None,
+    ) -> tuple[Environment | None, ServicesComposeState, ReadinessResult | None]:
+        """
+        Env config, its services state and readiness verdict (None while starting) at once, both from the same
+        cached state query
+        """
+        environment, services_state = await asyncio.gather(self.env(env_id), self.status(env_id))
+        if environment is None:
+            return None, services_state, None
+        if services is None:
+            services = list(environment.get_services())
+        return environment, services_state, evaluate_readiness(services_state, services)
+
+    async def exec(self, env_id: str, container: str, command: str, detached: bool = False) -> tuple[str, bytes]:
+        """
+        Foreground exec output (stdout and stderr as they interleave) is streamed right from compose.
+        Detached exec returns at once: its output and exit code are kept in container tmp files
+        and polled with get_exec_logs
+        """
+        exec_record = ExecRecord(str(uuid4()), env_id, container, command, detached)
+        self.execs.add(exec_record)
+        compose_interface = await self._get_env_compose_interface(env_id)
+
+        if detached:
+            script = (f'({command}) > {exec_record.log_file} 2>&1; '
+                      f'echo $? > {exec_record.exit_code_file}')
+            await compose_interface.dc_exec(container, f'sh -c {shlex.quote(f"({script}) &")}')
+            return exec_record.uid, b''
+
+        output = bytearray()
+        async for exec_event in compose_interface.dc_exec_stream(container, command):
+            if isinstance(exec_event, ExecExit):
+                if exec_event.exit_code is not None:
+                    exec_record.exited(exec_event.exit_code, len(output))
+            else:
+                output.extend(exec_event.data)
+        return exec_record.uid, bytes(output)
+
+    async def get_exec_logs(self, uid: str, offset: int = 0) -> tuple[bytes, ExecRecord | None]:
+        """
+        Exec output from offset byte and exec record (None for unknown or forgotten exec).
+        Exited exec output isn't re-read past its end
+        """
+        exec_record = self.execs.get(uid)
+        if exec_record is None:
+            return b'', None
+        if not exec_record.detached:
+            # foreground exec output was returned by exec itself, nothing is kept
+            return b'', exec_record
+        if exec_record.output_size is not None and offset >= exec_record.output_size:
+            return b'', exec_record
+
+        compose_interface = await self._get_env_compose_interface(exec_record.env_id)
+        # exit code is read first: if command exited by then, output read after it is complete
+        output, exit_code_output = bytearray(), bytearray()
+        async for exec_event in compose_interface.dc_exec_stream(
+            exec_record.container,
+            f'cat {exec_record.exit_code_file} >&2 2>/dev/null; tail -c +{offset + 1} {exec_record.log_file}'
+        ):
+            if isinstance(exec_event, ExecExit):
+                continue
+            (output if exec_event.stream == 'stdout' else exit_code_output).extend(exec_event.data)
+
+        if exec_record.exit_code is None and (exit_code := parse_exit_code(bytes(exit_code_output))) is not None:
+            exec_record.exited(exit_code, offset + len(output))
+        return bytes(output), exec_record
+
+    async def _get_env_compose_interface(self, env_id: str) -> ComposeShellInterface | None:
+        services_state = await self._state_cache.get_services_state(labels={Label.ENV_ID: env_id})
+        service_status = services_state.get_any_for(Label.ENV_ID, env_id)
+        if service_status is None:
+            return None
 
-        env_compose_files = service_status.labels.get(Label.COMPOSE_FILES)
+        env_compose_files = service_status.get_label(Label.COMPOSE_FILES)
 
-        compose_interface = self._compose_interface(
+        return self._compose_interface(
             compose_files=env_compose_files,
             in_docker_project_root=self.in_docker_project_root_path
         )
 
-        job_result, stdout, stderr = await compose_interface.dc_exec(
-            exec_record.container,
-            f'cat /tmp/{exec_record.log_file}'
-        )
-        if job_result != JobResult.GOOD:
-            ...
-
-        return stdout
-
     async def logs(self, env_id: str, services: list[str]) -> dict[str, bytes]:
-        system_instance_manager = self._compose_instance_manager.make_system()
-        services_state = await system_instance_manager.get_active_services_state()
-        service_status = services_state.get_any_for(Label.ENV_ID, env_id)
+        compose_interface = await self._get_env_compose_interface(env_id)
 
-        env_compose_files = service_status.labels.get(Label.COMPOSE_FILES)
-
-        compose_interface = self._compose_interface(
-            compose_files=env_compose_files,
-            in_docker_project_root=self.in_docker_project_root_path
+        return await gather_services_logs(
+            lambda service: compose_interface.dc_logs([service]),
+            services,
+            concurrency_limit=self._logs_concurrency_limit,
         )
 
-        logs = {}
-        for service in services:
-            job_result, log = await compose_interface.dc_logs([service])
-            logs[service] = log
-            if job_result != JobResult.GOOD:
-                ...
-
-        return logs
+    async def logs_stream(self, env_id: str, services: list[str], tail: int = None, since: str = None,
+                          until: str = None, follow: bool = False) -> AsyncIterator[ComposeLogLine] | None:
+        """
+        None for unknown env: env is resolved before streaming, so it is answered with error, not a broken stream
+        """
+        if (compose_interface := await self._get_env_compose_interface(env_id)) is None:
+            return None
+        return compose_interface.dc_logs_stream(services, tail=tail, since=since, until=until, follow=follow)
+
+    async def exec_stream(self, env_id: str, container: str, command: str, stdin: bytes = None,
+                          timeout: float = None) -> AsyncIterator[ExecOutput | ExecExit] | None:
+        """
+        None for unknown env, like logs_stream
+        """
+        if (compose_interface := await self._get_env_compose_interface(env_id)) is None:
+            return None
+        return compose_interface.dc_exec_stream(container, command, stdin=stdin, timeout=timeout)
 
 
 class MaxwellDemonServiceManager:
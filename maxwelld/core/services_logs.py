@@ -0,0 +1,25 @@
+import asyncio
+from typing import Awaitable
+from typing import Callable
+
+from maxwelld.helpers.jobs_result import JobResult
+from maxwelld.helpers.jobs_result import OperationError
+
+ServiceLogsGetter = Callable[[str], Awaitable[tuple[JobResult, bytes] | tuple[OperationError, None]]]
+
+
+async def gather_services_logs(get_logs: ServiceLogsGetter, services: list[str],
+                               concurrency_limit: int) -> dict[str, bytes | None]:
+    """
+    Logs of each service fetched concurrently, at most concurrency_limit at once (compose commands scheduler
+    limits per env on top of it); total time approaches the slowest service one. None for failed service
+    """
+    semaphore = asyncio.Semaphore(concurrency_limit)
+
+    async def get_service_logs(service: str) -> bytes | None:
+        async with semaphore:
+            job_result, log = await get_logs(service)
+        return log if job_result == JobResult.GOOD else None
+
+    logs = await asyncio.gather(*(get_service_logs(service) for service in services))
+    return dict(zip(services, logs))
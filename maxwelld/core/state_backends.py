@@ -0,0 +1,124 @@
+import json
+from typing import Protocol
+from urllib.parse import urlparse
+
+import aiohttp
+from rich.text import Text
+
+from maxwelld.core.compose_data_types import COMPOSE_PROJECT_LABEL
+from maxwelld.core.compose_data_types import ServiceComposeState
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.compose_instance import ComposeInstanceProvider
+from maxwelld.core.config import Config
+from maxwelld.core.config import StateBackendType
+from maxwelld.helpers.jobs_result import OperationError
+from maxwelld.helpers.labels import escape_label_value
+from maxwelld.output.console import CONSOLE
+from maxwelld.output.styles import Style
+
+
+class ServicesStateBackend(Protocol):
+    async def get_services_state(self, labels: dict[str, str] = None) -> ServicesComposeState | OperationError:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class ComposeStateBackend:
+    """
+    Services state via `docker-compose ps` of system instance (all scanned compose files)
+    """
+
+    def __init__(self, compose_instance_maker: ComposeInstanceProvider):
+        self._compose_instance_maker = compose_instance_maker
+
+    async def get_services_state(self, labels: dict[str, str] = None) -> ServicesComposeState | OperationError:
+        return await self._compose_instance_maker.make_system().get_active_services_state(labels)
+
+    async def close(self) -> None:
+        ...
+
+
+class DockerEngineStateBackend:
+    """
+    Services state via Docker Engine API (/containers/json) over DOCKER_HOST with pooled keep-alive connection
+    """
+
+    def __init__(self, docker_host: str, project: str | None, connections_limit: int = 10, timeout: float = 30):
+        self._docker_host = docker_host
+        self._project = project
+        self._connections_limit = connections_limit
+        self._timeout = timeout
+        self._session: aiohttp.ClientSession | None = None
+
+        docker_url = urlparse(docker_host)
+        if docker_url.scheme == 'unix':
+            self._socket_path = docker_url.path
+            self._base_url = 'http://docker'
+        else:
+            self._socket_path = None
+            scheme = 'https' if docker_url.scheme == 'https' else 'http'
+            self._base_url = f'{scheme}://{docker_url.netloc}'
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self._get_session()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            if self._socket_path:
+                connector = aiohttp.UnixConnector(path=self._socket_path, limit=self._connections_limit)
+            else:
+                connector = aiohttp.TCPConnector(limit=self._connections_limit)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+            )
+        return self._session
+
+    def _make_filters(self, labels: dict[str, str] = None) -> dict[str, list[str]]:
+        labels_filter = []
+        if self._project:
+            labels_filter += [f'{COMPOSE_PROJECT_LABEL}={self._project}']
+        if labels:
+            labels_filter += [f'{label}={escape_label_value(value)}' for label, value in labels.items()]
+        return {'label': labels_filter} if labels_filter else {}
+
+    async def get_services_state(self, labels: dict[str, str] = None) -> ServicesComposeState | OperationError:
+        url = f'{self._base_url}/containers/json'
+        params = {'all': '1', 'filters': json.dumps(self._make_filters(labels))}
+        CONSOLE.print(Text(f'GET {url} {params}', style=Style.context))
+        try:
+            async with self._get_session().get(url, params=params) as response:
+                if response.status != 200:
+                    return OperationError(f'Docker API responded {response.status}:\n{await response.text()}')
+                containers = await response.json()
+        except aiohttp.ClientError as e:
+            return OperationError(f"Can't get container's status from {self._docker_host}: {e!r}")
+
+        return ServicesComposeState.make_new_from_services(sorted(
+            [ServiceComposeState.from_engine_json(container) for container in containers],
+            key=lambda service_state: service_state.name,
+        ))
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def make_state_backend(config: Config, compose_instance_maker: ComposeInstanceProvider) -> ServicesStateBackend:
+    if config.state_backend == StateBackendType.DOCKER_API:
+        return DockerEngineStateBackend(
+            docker_host=config.docker_host,
+            project=config.compose_project_name,
+            connections_limit=config.docker_api_connections_limit,
+            timeout=config.docker_api_timeout,
+        )
+    assert config.state_backend == StateBackendType.COMPOSE, f'Unknown state backend: {config.state_backend}'
+    return ComposeStateBackend(compose_instance_maker)
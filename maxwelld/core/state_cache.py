@@ -0,0 +1,85 @@
+import asyncio
+import time
+from typing import NamedTuple
+
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.state_backends import ServicesStateBackend
+from maxwelld.helpers.jobs_result import OperationError
+
+StateCacheKey = tuple[tuple[str, str], ...]
+
+
+class CachedState(NamedTuple):
+    created_at: float
+    state: ServicesComposeState
+
+
+class ServicesStateCache:
+    """
+    Services state backend wrapper shared by all handlers:
+     - state cached for `ttl` seconds per labels query
+     - concurrent callers of same query await one in-flight backend request (single-flight)
+     - invalidate() drops cached states and results of queries started before invalidation
+    """
+
+    def __init__(self, state_backend: ServicesStateBackend, ttl: float):
+        self._state_backend = state_backend
+        self._ttl = ttl
+        self._cache: dict[StateCacheKey, CachedState] = {}
+        self._inflight: dict[StateCacheKey, asyncio.Future] = {}
+        self._generation = 0
+
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+
+    @staticmethod
+    def _make_key(labels: dict[str, str] | None) -> StateCacheKey:
+        return tuple(sorted(labels.items())) if labels else ()
+
+    async def _query(self, key: StateCacheKey, labels: dict[str, str] | None, generation: int
+                     ) -> ServicesComposeState | OperationError:
+        state = await self._state_backend.get_services_state(labels=labels)
+        if generation == self._generation and isinstance(state, ServicesComposeState):
+            self._cache[key] = CachedState(time.monotonic(), state)
+        return state
+
+    def _forget_inflight(self, key: StateCacheKey, query: asyncio.Future) -> None:
+        if self._inflight.get(key) is query:
+            del self._inflight[key]
+
+    async def get_services_state(self, labels: dict[str, str] = None) -> ServicesComposeState | OperationError:
+        key = self._make_key(labels)
+
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached.created_at < self._ttl:
+            self.hits += 1
+            return cached.state
+
+        query = self._inflight.get(key)
+        if query is None:
+            self.misses += 1
+            query = asyncio.ensure_future(self._query(key, labels, self._generation))
+            self._inflight[key] = query
+            query.add_done_callback(lambda _: self._forget_inflight(key, query))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(query)
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._cache.clear()
+        self._inflight.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'coalesced': self.coalesced,
+            'misses': self.misses,
+            'cached_queries': len(self._cache),
+            'inflight_queries': len(self._inflight),
+        }
+
+    async def close(self) -> None:
+        await self._state_backend.close()
@@ -0,0 +1,84 @@
+from enum import Enum
+from enum import auto
+from typing import NamedTuple
+
+from rich.text import Text
+
+from maxwelld.core.compose_data_types import ComposeHealth
+from maxwelld.core.compose_data_types import ComposeState
+from maxwelld.core.compose_data_types import ServiceComposeState
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.output.styles import Style
+
+
+class TransitionKind(Enum):
+    APPEARED = auto()
+    CHANGED = auto()
+    DISAPPEARED = auto()
+
+
+def is_service_ready(service_state: ServiceComposeState) -> bool:
+    return ((service_state.state == ComposeState.RUNNING
+             or (service_state.state == ComposeState.EXITED and service_state.exit_code == 0))
+            and service_state.health in (ComposeHealth.EMPTY, ComposeHealth.HEALTHY))
+
+
+def describe_service_condition(service_state: ServiceComposeState | None) -> str:
+    """
+    "running", "running(healthy)", "exited(1)", "-" for absent service
+    """
+    if service_state is None:
+        return '-'
+    if service_state.state == ComposeState.EXITED:
+        return f'{service_state.state}({service_state.exit_code})'
+    if service_state.health:
+        return f'{service_state.state}({service_state.health})'
+    return service_state.state
+
+
+class ServiceTransition(NamedTuple):
+    name: str
+    before: ServiceComposeState | None
+    after: ServiceComposeState | None
+
+    @property
+    def kind(self) -> TransitionKind:
+        if self.before is None:
+            return TransitionKind.APPEARED
+        if self.after is None:
+            return TransitionKind.DISAPPEARED
+        return TransitionKind.CHANGED
+
+    def __str__(self):
+        return f'{self.name}: {describe_service_condition(self.before)} → {describe_service_condition(self.after)}'
+
+    def as_rich_text(self, style: Style = Style()) -> Text:
+        transition_string = Text('     ')
+        transition_string.append(Text(f"{self.name:{30}}", style=style.regular))
+        transition_string.append(Text(f'{describe_service_condition(self.before)} → ', style=style.regular))
+        transition_string.append(Text(
+            describe_service_condition(self.after),
+            style=style.good if self.after is not None and is_service_ready(self.after) else style.bad
+        ))
+        return transition_string
+
+
+def diff_services_states(before: ServicesComposeState | None,
+                         after: ServicesComposeState) -> list[ServiceTransition]:
+    """
+    Per service changes of state, exit code or health between consecutive snapshots, in `after` services order
+    """
+    if before is None:
+        return [ServiceTransition(service_state.name, None, service_state) for service_state in after]
+
+    transitions = []
+    for service_state in after:
+        previous_state = before.get_by_name(service_state.name)
+        if previous_state is None or previous_state.state_key() != service_state.state_key():
+            transitions.append(ServiceTransition(service_state.name, previous_state, service_state))
+
+    for service_state in before:
+        if after.get_by_name(service_state.name) is None:
+            transitions.append(ServiceTransition(service_state.name, service_state, None))
+
+    return transitions
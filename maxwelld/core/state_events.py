@@ -0,0 +1,248 @@
+import asyncio
+import json
+import shlex
+from typing import AsyncIterator
+from typing import Protocol
+
+import aiohttp
+from rich.text import Text
+
+from maxwelld.core.compose_data_types import COMPOSE_PROJECT_LABEL
+from maxwelld.core.compose_data_types import COMPOSE_SERVICE_LABEL
+from maxwelld.core.compose_data_types import ComposeState
+from maxwelld.core.compose_data_types import ServiceComposeState
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.config import Config
+from maxwelld.core.config import StateBackendType
+from maxwelld.core.state_backends import DockerEngineStateBackend
+from maxwelld.core.state_backends import ServicesStateBackend
+from maxwelld.helpers.labels import Label
+from maxwelld.output.console import CONSOLE
+from maxwelld.output.styles import Style
+
+
+class ContainerEventsSource(Protocol):
+    def events(self) -> AsyncIterator[dict]:
+        """
+        Docker container events (`docker events --format '{{json .}}'` / Engine API /events items) of
+        maxwelld-managed containers; iteration ends when stream is broken
+        """
+        ...
+
+
+def _make_events_labels_filter(project: str | None) -> list[str]:
+    labels_filter = [Label.ENV_ID]
+    if project:
+        labels_filter += [f'{COMPOSE_PROJECT_LABEL}={project}']
+    return labels_filter
+
+
+class DockerCliEventsSource:
+    def __init__(self, project: str | None, execution_envs: dict = None):
+        self._project = project
+        self._execution_envs = execution_envs
+
+    async def events(self) -> AsyncIterator[dict]:
+        filters = ' '.join(
+            f'--filter {shlex.quote(f"label={label}")}' for label in _make_events_labels_filter(self._project)
+        )
+        process = await asyncio.create_subprocess_shell(
+            cmd := f"/usr/local/bin/docker events --filter type=container {filters}" + " --format='{{json .}}'",
+            env=self._execution_envs,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        CONSOLE.print(Text(f'{cmd}', style=Style.context))
+        try:
+            while line := await process.stdout.readline():
+                yield json.loads(line)
+        finally:
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+
+
+class DockerEngineEventsSource:
+    def __init__(self, state_backend: DockerEngineStateBackend, project: str | None):
+        self._state_backend = state_backend
+        self._project = project
+
+    async def events(self) -> AsyncIterator[dict]:
+        url = f'{self._state_backend.base_url}/events'
+        params = {'filters': json.dumps({
+            'type': ['container'],
+            'label': _make_events_labels_filter(self._project),
+        })}
+        CONSOLE.print(Text(f'GET {url} {params}', style=Style.context))
+        async with self._state_backend.session.get(
+            url, params=params, timeout=aiohttp.ClientTimeout(total=None, sock_read=None)
+        ) as response:
+            while line := await response.content.readline():
+                yield json.loads(line)
+
+
+class ContainersStateIndex:
+    """
+    In-memory services state by env_id and service name, fed by full resyncs and container events
+    """
+
+    def __init__(self):
+        self._envs: dict[str, dict[str, ServiceComposeState]] = {}
+        self._synced = False
+        self._changed = asyncio.Condition()
+        self.version = 0
+
+    def is_synced(self) -> bool:
+        return self._synced
+
+    def unsync(self) -> None:
+        self._synced = False
+
+    async def _notify(self) -> None:
+        self.version += 1
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def wait_changed(self, timeout: float) -> bool:
+        async with self._changed:
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                return False
+        return True
+
+    async def resync(self, services_state: ServicesComposeState) -> None:
+        self._envs = {}
+        for service_state in services_state:
+            self._put(service_state)
+        self._synced = True
+        await self._notify()
+
+    async def resync_env(self, env_id: str, services_state: ServicesComposeState) -> None:
+        self._envs.pop(env_id, None)
+        for service_state in services_state:
+            self._put(service_state)
+        await self._notify()
+
+    def _put(self, service_state: ServiceComposeState) -> None:
+        env_id = service_state.get_label(Label.ENV_ID)
+        if env_id is not None:
+            self._envs.setdefault(env_id, {})[service_state.name] = service_state
+
+    def get_env_state(self, env_id: str) -> ServicesComposeState:
+        env_services = self._envs.get(env_id, {})
+        return ServicesComposeState.make_new_from_services([
+            env_services[name] for name in sorted(env_services)
+        ])
+
+    async def apply_event(self, event: dict) -> str | None:
+        """
+        Applies in-place known state transitions; returns env_id when env should be resynced
+        """
+        attributes = event.get('Actor', {}).get('Attributes', {})
+        env_id = attributes.get(Label.ENV_ID)
+        service = attributes.get(COMPOSE_SERVICE_LABEL)
+        action = event.get('Action', event.get('status', ''))
+        if env_id is None or service is None:
+            return None
+
+        service_state = self._envs.get(env_id, {}).get(service)
+
+        if action == 'destroy':
+            self._envs.get(env_id, {}).pop(service, None)
+        elif service_state is None or action in ('create', 'start', 'restart'):
+            # health and status after (re)start known only from full container state
+            return env_id
+        elif action == 'die':
+            exit_code = int(attributes.get('exitCode', 0))
+            self._envs[env_id][service] = service_state.replace(
+                state=ComposeState.EXITED, exit_code=exit_code, status=f'Exited ({exit_code})'
+            )
+        elif action.startswith('health_status'):
+            self._envs[env_id][service] = service_state.replace(health=action.split(':', 1)[1].strip())
+        elif action == 'pause':
+            self._envs[env_id][service] = service_state.replace(state='paused')
+        elif action == 'unpause':
+            self._envs[env_id][service] = service_state.replace(state=ComposeState.RUNNING)
+        else:
+            return None
+
+        await self._notify()
+        return None
+
+
+class ContainersStateWatcher:
+    """
+    Keeps ContainersStateIndex up to date: full resync on start and after events stream reconnect
+    """
+
+    def __init__(self,
+                 index: ContainersStateIndex,
+                 state_backend: ServicesStateBackend,
+                 events_source: ContainerEventsSource,
+                 reconnect_delay_s: float = 1):
+        self.index = index
+        self._state_backend = state_backend
+        self._events_source = events_source
+        self._reconnect_delay_s = reconnect_delay_s
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._watch())
+
+    async def _resync(self, labels: dict[str, str] = None) -> ServicesComposeState | None:
+        services_state = await self._state_backend.get_services_state(labels=labels)
+        if not isinstance(services_state, ServicesComposeState):
+            CONSOLE.print(Text(f"Can't resync containers state: {services_state}", style=Style.bad))
+            return None
+        return services_state
+
+    async def _watch_stream(self) -> None:
+        events = self._events_source.events()
+        # subscribe before resync: transitions between resync and first event are not lost
+        first_event = asyncio.ensure_future(anext(events, None))
+        try:
+            services_state = await self._resync()
+            if services_state is None:
+                return
+            await self.index.resync(services_state)
+
+            event = await first_event
+            while event is not None:
+                if (env_id := await self.index.apply_event(event)) is not None:
+                    if (env_state := await self._resync({Label.ENV_ID: env_id})) is not None:
+                        await self.index.resync_env(env_id, env_state)
+                event = await anext(events, None)
+        finally:
+            if not first_event.done():
+                first_event.cancel()
+                await asyncio.gather(first_event, return_exceptions=True)
+            await events.aclose()
+
+    async def _watch(self) -> None:
+        while True:
+            try:
+                await self._watch_stream()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                CONSOLE.print(Text(f'Containers events stream failed: {e!r}', style=Style.bad))
+            self.index.unsync()
+            await asyncio.sleep(self._reconnect_delay_s)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                ...
+            self._task = None
+
+
+def make_events_source(config: Config, state_backend: ServicesStateBackend) -> ContainerEventsSource:
+    if config.state_backend == StateBackendType.DOCKER_API:
+        assert isinstance(state_backend, DockerEngineStateBackend), 'Engine API events need Engine API backend'
+        return DockerEngineEventsSource(state_backend, project=config.compose_project_name)
+    return DockerCliEventsSource(project=config.compose_project_name)
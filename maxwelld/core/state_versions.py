@@ -0,0 +1,28 @@
+from uuid import uuid4
+
+from maxwelld.core.compose_data_types import ServicesComposeState
+
+
+class EnvStateVersions:
+    """
+    Monotonic per env state versions: bumped when observed services state (names, states, health, exit codes)
+    differs from the previous one. Versions are counted from daemon start, ETags carry daemon instance id
+    so they never match after restart
+    """
+
+    def __init__(self):
+        self.instance_id = uuid4().hex[:8]
+        self._versions: dict[str, tuple[int, ServicesComposeState]] = {}
+
+    def observe(self, env_id: str, services_state: ServicesComposeState) -> int:
+        version, last_state = self._versions.get(env_id, (0, None))
+        if last_state is None or last_state != services_state:
+            version += 1
+            self._versions[env_id] = (version, services_state)
+        return version
+
+    def get(self, env_id: str) -> int:
+        return self._versions.get(env_id, (0, None))[0]
+
+    def etag(self, env_id: str, version: int) -> str:
+        return f'"{self.instance_id}-{env_id}-{version}"'
@@ -0,0 +1,198 @@
+import asyncio
+import time
+import traceback
+from collections import OrderedDict
+from enum import Enum
+from typing import Awaitable
+from typing import Callable
+from typing import Hashable
+from uuid import uuid4
+
+from maxwelld.client.types import EnvironmentId
+from maxwelld.errors.up import ServicesUpError
+
+
+class UpJobStatus(str, Enum):
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+
+class UpProgress:
+    """
+    Env startup progress reported by ComposeInstance.run: current services tier and migration
+    """
+
+    def __init__(self, on_change: Callable[[], None] = None):
+        self._on_change = on_change
+        self.tiers_total = 0
+        self.tiers_done = 0
+        self.tier_services: list[str] = []
+        self.migration: str | None = None
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
+
+    def tiers_planned(self, tiers_total: int) -> None:
+        self.tiers_total = tiers_total
+        self._changed()
+
+    def tier_started(self, services: list[str]) -> None:
+        self.tier_services = list(services)
+        self._changed()
+
+    def tier_done(self) -> None:
+        self.tiers_done += 1
+        self.tier_services = []
+        self._changed()
+
+    def migration_started(self, service: str, cmd: str) -> None:
+        self.migration = f'{service}: {cmd}'
+        self._changed()
+
+    def migration_done(self) -> None:
+        self.migration = None
+        self._changed()
+
+    @property
+    def percent(self) -> int:
+        if not self.tiers_total:
+            return 0
+        return self.tiers_done * 100 // self.tiers_total
+
+    def as_json(self) -> dict:
+        return {
+            'tier': self.tiers_done + 1 if self.tier_services else self.tiers_done,
+            'tiers_total': self.tiers_total,
+            'tier_services': self.tier_services,
+            'migration': self.migration,
+            'percent': self.percent,
+        }
+
+
+def describe_up_error(error: BaseException) -> str:
+    if isinstance(error, ServicesUpError):
+        return error.message
+    if isinstance(error, AssertionError):
+        return f'Somthing went wrong:\n{str(error)}'
+    return f'Somthing went terribly wrong:\n{str(error)}\n\n{"".join(traceback.format_exception(error))}'
+
+
+class UpJob:
+    def __init__(self, name: str):
+        self.job_id = str(uuid4())
+        self.name = name
+        self.status = UpJobStatus.RUNNING
+        self.progress = UpProgress(on_change=self._notify)
+        self.env_id: EnvironmentId | None = None
+        self.is_new: bool | None = None
+        self.error: str | None = None
+        self.attached = 0
+        self.started_at = time.time()
+        self.finished_at: float | None = None
+        self.version = 0
+        self._changed = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    def _notify(self) -> None:
+        self.version += 1
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def is_finished(self) -> bool:
+        return self.status != UpJobStatus.RUNNING
+
+    def finish(self, env_id: EnvironmentId = None, is_new: bool = None, error: str = None) -> None:
+        self.env_id, self.is_new, self.error = env_id, is_new, error
+        self.status = UpJobStatus.FAILED if error is not None else UpJobStatus.DONE
+        self.finished_at = time.time()
+        self._notify()
+
+    async def wait_changed(self, since_version: int, timeout: float) -> bool:
+        """
+        Long-poll: returns as soon as job version is newer than since_version or timeout passed
+        """
+        if self.version > since_version:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def as_json(self) -> dict:
+        return {
+            'job_id': self.job_id,
+            'name': self.name,
+            'status': self.status.value,
+            'version': self.version,
+            'progress': self.progress.as_json(),
+            'env_id': self.env_id,
+            'is_new': self.is_new,
+            'error': self.error,
+            'attached': self.attached,
+            'timings': {
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+                'duration_s': (self.finished_at or time.time()) - self.started_at,
+            },
+        }
+
+
+class UpJobsRegistry:
+    """
+    Running up jobs by env key (requests for the same env attach to running job) and
+    limited history of finished jobs with their timings
+    """
+
+    def __init__(self, finished_jobs_limit: int = 100):
+        self._finished_jobs_limit = finished_jobs_limit
+        self._jobs: OrderedDict[str, UpJob] = OrderedDict()
+        self._running: dict[Hashable, UpJob] = {}
+
+    def start(self, key: Hashable, name: str,
+              run: Callable[[UpProgress], Awaitable[tuple[EnvironmentId, bool]]]) -> tuple[UpJob, bool]:
+        """
+        Starts `run` as background job or attaches to running one with the same key, returns (job, attached)
+        """
+        if (job := self._running.get(key)) is not None:
+            job.attached += 1
+            return job, True
+
+        job = UpJob(name)
+        self._jobs[job.job_id] = job
+        self._running[key] = job
+        job.task = asyncio.create_task(self._run(key, job, run))
+        return job, False
+
+    async def _run(self, key: Hashable, job: UpJob,
+                   run: Callable[[UpProgress], Awaitable[tuple[EnvironmentId, bool]]]) -> None:
+        try:
+            env_id, is_new = await run(job.progress)
+        except asyncio.CancelledError:
+            job.finish(error='Up job cancelled')
+            raise
+        except BaseException as e:
+            job.finish(error=describe_up_error(e))
+        else:
+            job.finish(env_id=env_id, is_new=is_new)
+        finally:
+            self._running.pop(key, None)
+            self._forget_finished()
+
+    def _forget_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished()]
+        for job_id in finished[:max(len(finished) - self._finished_jobs_limit, 0)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> UpJob | None:
+        return self._jobs.get(job_id)
+
+    def list(self) -> list[UpJob]:
+        return list(self._jobs.values())
+
+    async def close(self) -> None:
+        for job in list(self._running.values()):
+            job.task.cancel()
+        await asyncio.gather(*(job.task for job in self._jobs.values() if job.task), return_exceptions=True)
@@ -7,6 +7,7 @@ from pathlib import Path
 
 import yaml
 
+from maxwelld.core.env_config_store import get_env_config_store
 from maxwelld.core.sequence_run_types import ComposeInstanceFiles
 from maxwelld.core.sequence_run_types import EnvInstanceConfig
 from maxwelld.core.utils.compose_instance_cfg import made_up_instance_compose_files
@@ -14,8 +15,8 @@ from maxwelld.env_description.env_types import Environment
 from maxwelld.env_description.env_types import EventStage
 from maxwelld.env_description.env_types import Handler
 from maxwelld.errors.migrations import ServicesMigrationsError
-from maxwelld.helpers.bytes_pickle import base64_pickled
 from maxwelld.helpers.labels import Label
+from maxwelld.helpers.labels import escape_label_value
 
 
 class QuotedString(str):
@@ -170,7 +171,7 @@ def patch_services_names(dc_cfg: dict, services_map: dict[str, str]) -> dict:
 def patch_labels(dc_cfg: dict, labels: dict[str, str]):
     def escape(labels):
         return {
-            k: v.replace(',', ';') if isinstance(v, str) else v
+            k: escape_label_value(v)
             for k, v in labels.items()
         }
 
@@ -324,6 +325,7 @@ def make_env_compose_instance_files(env_config_instance: EnvInstanceConfig,
                                     compose_files_path: Path,
                                     tmp_env_path: Path,
                                     release_id: str = None,
+                                    fingerprint: str = None,
                                     ) -> ComposeInstanceFiles:
     dst = tmp_env_path / env_config_instance.env_id
 
@@ -341,8 +343,9 @@ def make_env_compose_instance_files(env_config_instance: EnvInstanceConfig,
         Label.RELEASE_ID: release_id,
         Label.COMPOSE_FILES: compose_files,
         Label.COMPOSE_FILES_INSTANCE: new_compose_files_list,
-        Label.ENV_CONFIG_TEMPLATE: base64_pickled(env_config_instance.env_source),
-        Label.ENV_CONFIG: base64_pickled(env_config_instance.env),
+        Label.ENV_CONFIG_TEMPLATE_DIGEST: get_env_config_store().put(env_config_instance.env_source),
+        Label.ENV_CONFIG_DIGEST: get_env_config_store().put(env_config_instance.env),
+        Label.ENV_FINGERPRINT: fingerprint,
     }
 
     for file in compose_files.split(':'):
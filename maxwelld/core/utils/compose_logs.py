@@ -0,0 +1,31 @@
+import re
+from typing import NamedTuple
+
+# `docker-compose logs --no-color --timestamps` line: "<container>  | <timestamp> <line>"
+_PREFIXED_LOG_LINE = re.compile(r'^(?P<container>\S+)\s+\| ?(?P<rest>.*)$', re.DOTALL)
+_TIMESTAMP = re.compile(r'^(?P<timestamp>\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:\.\d+)?(?:Z|[+-]\d\d:\d\d)) ?')
+_CONTAINER_INDEX = re.compile(r'[-_]\d+$')
+
+
+class ComposeLogLine(NamedTuple):
+    service: str
+    timestamp: str | None
+    line: str
+
+    def as_json(self) -> dict:
+        return self._asdict()
+
+
+def parse_compose_log_line(raw: bytes) -> ComposeLogLine:
+    """
+    Service (container name without replica index), timestamp and message of compose logs line
+    """
+    text = raw.decode('utf-8', errors='replace').rstrip('\r\n')
+    if (prefixed := _PREFIXED_LOG_LINE.match(text)) is None:
+        return ComposeLogLine('', None, text)
+
+    service = _CONTAINER_INDEX.sub('', prefixed['container'])
+    rest = prefixed['rest']
+    if (timestamp := _TIMESTAMP.match(rest)) is None:
+        return ComposeLogLine(service, None, rest)
+    return ComposeLogLine(service, timestamp['timestamp'], rest[timestamp.end():])
@@ -0,0 +1,77 @@
+import hashlib
+import json
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from maxwelld.env_description.env_types import AsIs
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Handler
+from maxwelld.env_description.env_types import Service
+
+
+def _canonical_value(value: Any) -> Any:
+    match value:
+        case AsIs():
+            return {'as_is': _canonical_value(value.value)}
+        case Enum():
+            return value.name
+        case bool() | int() | float() | str() | None:
+            return value
+        case dict():
+            return {str(key): _canonical_value(item) for key, item in value.items()}
+        case list() | tuple():
+            return [_canonical_value(item) for item in value]
+        case _:
+            # repr of arbitrary objects may hold memory addresses, fingerprint would differ between processes
+            raise TypeError(f'Unsupported env value type for fingerprint: {type(value)}')
+
+
+def _canonical_handler(handler: Handler) -> dict:
+    return {
+        'stage': handler.stage.value.compose_name,
+        'cmd': handler.cmd,
+        'executor': handler.executor,
+    }
+
+
+def _canonical_service(service: Service) -> dict:
+    return {
+        'name': service.name,
+        'env': _canonical_value(dict(service.env)),
+        # handlers order is execution order
+        'events_handlers': [_canonical_handler(handler) for handler in service.events_handlers],
+        'mode': service.mode.name,
+    }
+
+
+@lru_cache(maxsize=256)
+def _file_digest(path: Path, mtime_ns: int, size: int) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def compose_file_digest(path: Path) -> str:
+    stat = path.stat()
+    return _file_digest(path, stat.st_mtime_ns, stat.st_size)
+
+
+def make_env_fingerprint(config_template: Environment, compose_files: str, compose_files_path: Path) -> str:
+    """
+    Deterministic digest of env template (services sorted by name, their env, handlers, modes) and compose files
+    contents: same for equal configs independently of dict order, pickle protocol and python or maxwelld version
+    """
+    canonical = {
+        'name': str(config_template),
+        'services': [
+            _canonical_service(service)
+            for service in sorted(config_template.get_services().values(), key=lambda service: service.name)
+        ],
+        'compose_files': [
+            [compose_file, compose_file_digest(compose_files_path / compose_file)]
+            for compose_file in compose_files.split(':')
+        ],
+    }
+    return hashlib.sha256(
+        json.dumps(canonical, sort_keys=True, separators=(',', ':')).encode()
+    ).hexdigest()[:32]
@@ -0,0 +1,29 @@
+from typing import NamedTuple
+
+from maxwelld.helpers.bytes_pickle import base64_decode
+from maxwelld.helpers.bytes_pickle import base64_encode
+
+
+class ExecOutput(NamedTuple):
+    stream: str  # 'stdout' | 'stderr'
+    data: bytes
+
+    def as_json(self) -> dict:
+        return {'stream': self.stream, 'data': base64_encode(self.data)}
+
+
+class ExecExit(NamedTuple):
+    exit_code: int | None  # None when command was killed by timeout
+    timed_out: bool = False
+
+    def as_json(self) -> dict:
+        return self._asdict()
+
+
+def exec_event_from_json(data: dict) -> ExecOutput | ExecExit:
+    """
+    Exec stream item: output chunk or exit, which is always the last one
+    """
+    if 'exit_code' in data:
+        return ExecExit(**data)
+    return ExecOutput(data['stream'], base64_decode(data['data']))
@@ -1,30 +1,235 @@
 import asyncio
 import sys
+import tempfile
+from collections import deque
+from pathlib import Path
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterator
+from typing import NamedTuple
+from typing import Protocol
 
 
-async def process_output_till_done(process: asyncio.subprocess.Process, verbose) -> tuple[bytes, bytes]:
-    stdout_lines = []
-    stderr_lines = []
+class OutputCapture(Protocol):
+    def write(self, chunk: bytes) -> None:
+        ...
 
-    async def read_stream(stream, callback, output_list):
-        while True:
-            line = await stream.readline()
-            if line:
-                if verbose:
-                    callback(line)
-                output_list.append(line)
-            else:
-                break
+    def getvalue(self) -> bytes:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class FullCapture:
+    """
+    Whole output in memory
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, chunk: bytes) -> None:
+        self._chunks.append(chunk)
+
+    def getvalue(self) -> bytes:
+        return b''.join(self._chunks)
+
+    def close(self) -> None:
+        self._chunks = []
+
+
+class RingBufferCapture:
+    """
+    Last `max_bytes` of output; older lines are dropped and counted in `dropped_bytes`.
+    Truncated output starts with a marker line telling how much was dropped
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.dropped_bytes = 0
+        self._chunks: deque[bytes] = deque()
+        self._size = 0
+
+    @property
+    def truncated(self) -> bool:
+        return self.dropped_bytes > 0
+
+    def write(self, chunk: bytes) -> None:
+        if len(chunk) > self.max_bytes:
+            self.dropped_bytes += len(chunk) - self.max_bytes
+            chunk = chunk[-self.max_bytes:]
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        while self._size > self.max_bytes:
+            dropped = self._chunks.popleft()
+            self._size -= len(dropped)
+            self.dropped_bytes += len(dropped)
+
+    def getvalue(self) -> bytes:
+        marker = f'[... {self.dropped_bytes} bytes of output dropped ...]\n'.encode() if self.truncated else b''
+        return marker + b''.join(self._chunks)
+
+    def close(self) -> None:
+        self._chunks.clear()
+        self._size = 0
+
+
+class SpillToDiskCapture:
+    """
+    Output kept in memory up to `threshold_bytes`, above it moved to temporary file in `directory`;
+    file is removed on close()
+    """
+
+    def __init__(self, threshold_bytes: int, directory: str | Path = None):
+        self.threshold_bytes = threshold_bytes
+        self._file = tempfile.SpooledTemporaryFile(max_size=threshold_bytes, dir=directory)
+        self.size = 0
+
+    @property
+    def spilled(self) -> bool:
+        # spooled file is rolled over to disk once written past its max_size
+        return self.size > self.threshold_bytes
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def iter_chunks(self, start: int = 0, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        self._file.seek(start)
+        while chunk := self._file.read(chunk_size):
+            yield chunk
+        self._file.seek(0, 2)
+
+    def copy_to_file(self, path: Path) -> None:
+        with path.open('wb') as target:
+            for chunk in self.iter_chunks():
+                target.write(chunk)
+
+    def tail(self, max_bytes: int) -> bytes:
+        return b''.join(self.iter_chunks(start=max(0, self.size - max_bytes)))
+
+    def getvalue(self) -> bytes:
+        return b''.join(self.iter_chunks())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+OutputCaptureFactory = Callable[[], OutputCapture]
+
+# streams are read in chunks and split to lines here: StreamReader.readline fails on lines over its limit
+READ_CHUNK_SIZE = 64 * 1024
+# longer lines come in parts, output isn't buffered without bound waiting for newline
+MAX_LINE_SIZE = 1024 * 1024
+
+
+async def iter_stream_lines(stream: asyncio.StreamReader, max_line_size: int = MAX_LINE_SIZE
+                            ) -> AsyncIterator[bytes]:
+    pending = b''
+    while chunk := await stream.read(READ_CHUNK_SIZE):
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        for line in lines:
+            line += b'\n'
+            while len(line) > max_line_size:
+                yield line[:max_line_size]
+                line = line[max_line_size:]
+            yield line
+        while len(pending) >= max_line_size:
+            yield pending[:max_line_size]
+            pending = pending[max_line_size:]
+    if pending:
+        yield pending
+
+
+async def capture_output_till_done(process: asyncio.subprocess.Process, verbose,
+                                   stdout_capture: OutputCapture, stderr_capture: OutputCapture) -> None:
+    """
+    Process output written to captures till process is done, captured values are left to caller
+    """
+    async def read_stream(stream, callback, capture: OutputCapture):
+        async for line in iter_stream_lines(stream):
+            if verbose:
+                callback(line)
+            capture.write(line)
 
     tasks = [
-        read_stream(process.stdout, lambda line: sys.stdout.buffer.write(b' > ' + line), stdout_lines),
-        read_stream(process.stderr, lambda line: sys.stderr.buffer.write(b' > ' + line), stderr_lines)
+        read_stream(process.stdout, lambda line: sys.stdout.buffer.write(b' > ' + line), stdout_capture),
+        read_stream(process.stderr, lambda line: sys.stderr.buffer.write(b' > ' + line), stderr_capture)
     ]
 
-    await asyncio.gather(*tasks)
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # not drained process could block on full pipe forever
+        if process.returncode is None:
+            process.kill()
+        raise
     await process.wait()
 
     sys.stdout.flush()
     sys.stderr.flush()
 
-    return b''.join(stdout_lines), b''.join(stderr_lines)
+
+async def process_output_till_done(process: asyncio.subprocess.Process,
+                                   verbose,
+                                   stdout_capture: OutputCapture = None,
+                                   stderr_capture: OutputCapture = None) -> tuple[bytes, bytes]:
+    if stdout_capture is None:
+        stdout_capture = FullCapture()
+    if stderr_capture is None:
+        stderr_capture = FullCapture()
+
+    await capture_output_till_done(process, verbose, stdout_capture, stderr_capture)
+    return stdout_capture.getvalue(), stderr_capture.getvalue()
+
+
+class OutputLine(NamedTuple):
+    stream: str  # 'stdout' | 'stderr'
+    line: bytes
+
+
+async def iter_process_output(process: asyncio.subprocess.Process, queue_size: int = 1024,
+                              chunk_size: int = None) -> AsyncIterator[OutputLine]:
+    """
+    Process stdout/stderr lines (or raw chunks up to chunk_size bytes) as they come; bounded queue makes
+    slow consumer pause process output reading. Process is awaited when both streams are exhausted.
+    Stream read error is raised to consumer, who is responsible for killing the process
+    """
+    queue: asyncio.Queue[OutputLine | BaseException | None] = asyncio.Queue(maxsize=queue_size)
+
+    async def iter_chunks(stream: asyncio.StreamReader) -> AsyncIterator[bytes]:
+        while chunk := await stream.read(chunk_size):
+            yield chunk
+
+    async def read_stream(stream: asyncio.StreamReader, name: str):
+        try:
+            async for line in (iter_chunks(stream) if chunk_size else iter_stream_lines(stream)):
+                await queue.put(OutputLine(name, line))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+
+    readers = [
+        asyncio.ensure_future(read_stream(process.stdout, 'stdout')),
+        asyncio.ensure_future(read_stream(process.stderr, 'stderr')),
+    ]
+    try:
+        streams_left = len(readers)
+        while streams_left:
+            item = await queue.get()
+            if item is None:
+                streams_left -= 1
+                continue
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+        await process.wait()
+    finally:
+        for reader in readers:
+            reader.cancel()
+        await asyncio.gather(*readers, return_exceptions=True)
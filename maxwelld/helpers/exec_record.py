@@ -1,7 +1,46 @@
-from typing import NamedTuple
+import time
+from enum import Enum
 
 
-class ExecRecord(NamedTuple):
-    env_id: str
-    container: str
-    log_file: str
+class ExecStatus(str, Enum):
+    RUNNING = 'running'
+    DONE = 'done'
+
+
+class ExecRecord:
+    """
+    Exec in env container; detached exec output and exit code are kept in container tmp files
+    """
+
+    def __init__(self, uid: str, env_id: str, container: str, command: str, detached: bool):
+        self.uid = uid
+        self.env_id = env_id
+        self.container = container
+        self.command = command
+        self.detached = detached
+        self.log_file = f'/tmp/{uid}.log'
+        self.exit_code_file = f'/tmp/{uid}.exit'
+        self.started_at = time.time()
+        self.exit_code: int | None = None
+        # whole output size, known once exited
+        self.output_size: int | None = None
+
+    @property
+    def status(self) -> ExecStatus:
+        return ExecStatus.RUNNING if self.exit_code is None else ExecStatus.DONE
+
+    def exited(self, exit_code: int, output_size: int) -> None:
+        self.exit_code = exit_code
+        self.output_size = output_size
+
+    def as_json(self) -> dict:
+        return {
+            'uid': self.uid,
+            'env_id': self.env_id,
+            'container': self.container,
+            'command': self.command,
+            'detached': self.detached,
+            'status': self.status.value,
+            'exit_code': self.exit_code,
+            'started_at': self.started_at,
+        }
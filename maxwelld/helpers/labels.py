@@ -6,8 +6,17 @@ class Label:
     COMPOSE_FILES_INSTANCE = 'com.maxwelld.env_instance_compose_files'
     CLIENT_ENV_NAME = 'com.maxwelld.client_env_name'
     REQUEST_ENV_NAME = 'com.maxwelld.request_env_name'
+    ENV_CONFIG_TEMPLATE_DIGEST = 'com.maxwelld.env_config_template_digest'
+    ENV_CONFIG_DIGEST = 'com.maxwelld.env_config_digest'
+    ENV_FINGERPRINT = 'com.maxwelld.env_fingerprint'
+    # legacy: whole base64 pickled configs, only read for containers started by previous versions
     ENV_CONFIG_TEMPLATE = 'com.maxwelld.env_config_template'
     ENV_CONFIG = 'com.maxwelld.env_config'
 
     SERVICE_TEMPLATE_NAME = 'com.maxwelld.service_template_name'
     # 'com.maxwelld.env_service_map'
+
+
+def escape_label_value(value):
+    # docker joins labels with "," in ps output
+    return value.replace(',', ';') if isinstance(value, str) else value
@@ -1,8 +1,11 @@
-from copy import deepcopy
 from enum import Enum
 from enum import auto
 from typing import TypeVar
 
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.state_diff import ServiceTransition
+from maxwelld.core.state_diff import diff_services_states
+
 T = TypeVar('T')
 
 
@@ -12,8 +15,12 @@ class ServicesState(Enum):
 
 
 class StateKeeper:
+    """
+    Keeps last seen state by reference: services states are never mutated, new snapshot is made on every query
+    """
+
     def __init__(self, state: T | ServicesState = ServicesState.FIRST_STATE):
-        self._state: T | ServicesState = deepcopy(state)
+        self._state: T | ServicesState = state
 
     def in_state(self, new_state: T | ServicesState):
         return self._state == new_state
@@ -22,4 +29,11 @@ class StateKeeper:
         return self._state != new_state
 
     def update_state(self, new_state: T | ServicesState):
-        self._state = deepcopy(new_state)
+        self._state = new_state
+
+    def services_transitions(self, new_state: ServicesComposeState) -> list[ServiceTransition]:
+        """
+        Services changes since last kept services state, all services for first one
+        """
+        previous_state = self._state if isinstance(self._state, ServicesComposeState) else None
+        return diff_services_states(previous_state, new_state)
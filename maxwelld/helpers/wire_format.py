@@ -0,0 +1,175 @@
+"""
+Versioned client-server payloads: schema-defined dicts of Environment/Service/Handler/ServicesComposeState
+serialized as JSON or msgpack (when installed) and chosen by content negotiation (Accept / Content-Type).
+Base64 pickles remain for peers without wire format support.
+"""
+import base64
+import json
+from typing import Any
+
+from maxwelld.core.compose_data_types import ServiceComposeState
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.state_diff import ServiceTransition
+from maxwelld.env_description.env_types import AsIs
+from maxwelld.env_description.env_types import Env
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import EventStage
+from maxwelld.env_description.env_types import Handler
+from maxwelld.env_description.env_types import Service
+from maxwelld.env_description.env_types import ServiceMode
+
+try:
+    import msgpack
+except ImportError:  # binary format is optional
+    msgpack = None
+
+WIRE_FORMAT_VERSION = 1
+JSON_WIRE_CONTENT_TYPE = f'application/vnd.maxwelld.v{WIRE_FORMAT_VERSION}+json'
+MSGPACK_WIRE_CONTENT_TYPE = f'application/vnd.maxwelld.v{WIRE_FORMAT_VERSION}+msgpack'
+
+JSON_BYTES_KEY = '__bytes__'
+
+
+def get_wire_content_types() -> list[str]:
+    """
+    Supported wire content types, preferred first
+    """
+    if msgpack is not None:
+        return [MSGPACK_WIRE_CONTENT_TYPE, JSON_WIRE_CONTENT_TYPE]
+    return [JSON_WIRE_CONTENT_TYPE]
+
+
+def negotiate_wire_content_type(accept: str | None) -> str | None:
+    """
+    First supported wire content type of Accept header, None when peer accepts only legacy payloads
+    """
+    if not accept:
+        return None
+    supported = get_wire_content_types()
+    for accepted in accept.split(','):
+        content_type = accepted.split(';', 1)[0].strip()
+        if content_type in supported:
+            return content_type
+    return None
+
+
+def is_wire_content_type(content_type: str | None) -> bool:
+    return content_type in get_wire_content_types()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return {JSON_BYTES_KEY: base64.b64encode(value).decode()}
+    raise TypeError(f'Unsupported wire value type: {type(value)}')
+
+
+def _json_object_hook(value: dict) -> Any:
+    if len(value) == 1 and JSON_BYTES_KEY in value:
+        return base64.b64decode(value[JSON_BYTES_KEY])
+    return value
+
+
+def encode_wire(payload: Any, content_type: str) -> bytes:
+    if content_type == MSGPACK_WIRE_CONTENT_TYPE:
+        return msgpack.packb(payload, use_bin_type=True)
+    assert content_type == JSON_WIRE_CONTENT_TYPE, f'Unsupported wire content type: {content_type}'
+    return json.dumps(payload, default=_json_default, separators=(',', ':')).encode()
+
+
+def decode_wire(body: bytes, content_type: str) -> Any:
+    if content_type == MSGPACK_WIRE_CONTENT_TYPE:
+        return msgpack.unpackb(body, raw=False)
+    assert content_type == JSON_WIRE_CONTENT_TYPE, f'Unsupported wire content type: {content_type}'
+    return json.loads(body, object_hook=_json_object_hook)
+
+
+def _env_value_as_wire(value: Any) -> Any:
+    if isinstance(value, AsIs):
+        return {'as_is': value.value}
+    return value
+
+
+def _env_value_from_wire(value: Any) -> Any:
+    if isinstance(value, dict) and set(value) == {'as_is'}:
+        return AsIs(value['as_is'])
+    return value
+
+
+def handler_as_wire(handler: Handler) -> dict:
+    return {
+        'stage': handler.stage.value.compose_name,
+        'cmd': handler.cmd,
+        'executor': handler.executor,
+    }
+
+
+def handler_from_wire(data: dict) -> Handler:
+    return Handler(
+        stage=EventStage.get_compose_stage(data['stage']),
+        cmd=data['cmd'],
+        executor=data.get('executor'),
+    )
+
+
+def service_as_wire(service: Service) -> dict:
+    return {
+        'name': service.name,
+        'env': {key: _env_value_as_wire(value) for key, value in service.env.items()},
+        'events_handlers': [handler_as_wire(handler) for handler in service.events_handlers],
+        'mode': service.mode.name,
+    }
+
+
+def service_from_wire(data: dict) -> Service:
+    return Service(
+        name=data['name'],
+        env=Env({key: _env_value_from_wire(value) for key, value in data.get('env', {}).items()}),
+        events_handlers=[handler_from_wire(handler) for handler in data.get('events_handlers', [])],
+        mode=ServiceMode[data.get('mode', ServiceMode.ON.name)],
+    )
+
+
+def environment_as_wire(environment: Environment) -> dict:
+    return {
+        'name': str(environment),
+        'services': [service_as_wire(service) for service in environment.get_services().values()],
+    }
+
+
+def environment_from_wire(data: dict) -> Environment:
+    return Environment(data['name'], *[service_from_wire(service) for service in data['services']])
+
+
+def services_state_as_wire(services_state: ServicesComposeState) -> list[dict]:
+    return services_state.as_json()
+
+
+def service_state_from_wire(data: dict) -> ServiceComposeState:
+    return ServiceComposeState(
+        name=data['name'],
+        state=data['state'],
+        exit_code=data['exit_code'],
+        health=data['health'],
+        status=data['status'],
+        labels=data['labels'],
+    )
+
+
+def services_state_from_wire(data: list[dict]) -> ServicesComposeState:
+    return ServicesComposeState.make_new_from_services([service_state_from_wire(service) for service in data])
+
+
+def service_transition_as_wire(transition: ServiceTransition) -> dict:
+    return {
+        'name': transition.name,
+        'before': transition.before.as_json() if transition.before is not None else None,
+        'after': transition.after.as_json() if transition.after is not None else None,
+    }
+
+
+def service_transition_from_wire(data: dict) -> ServiceTransition:
+    return ServiceTransition(
+        name=data['name'],
+        before=service_state_from_wire(data['before']) if data['before'] is not None else None,
+        after=service_state_from_wire(data['after']) if data['after'] is not None else None,
+    )
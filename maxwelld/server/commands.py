@@ -2,8 +2,16 @@ HEALTHCHECK_PATH = "/v0/healthcheck"
 UP_PATH = '/v0/up'
 STATUS_PATH = '/v0/status'
 ENV_PATH = '/v0/env'
+ENV_STATE_PATH = '/v0/env_state'
+STATS_PATH = '/v0/stats'
+WAIT_PATH = '/v0/wait'
 
 DC_UP_PATH = '/dc/up'
+DC_UP_JOB_PATH = '/dc/up/job'
+DC_UP_JOBS_PATH = '/dc/up/jobs'
 DC_EXEC_PATH = '/dc/exec'
 DC_GET_EXEC_LOGS_PATH = '/dc/get_exec_logs'
+DC_EXEC_STREAM_PATH = '/dc/exec/stream'
+DC_EXECS_PATH = '/dc/execs'
 DC_LOGS_PATH = '/dc/logs'
+DC_LOGS_STREAM_PATH = '/dc/logs/stream'
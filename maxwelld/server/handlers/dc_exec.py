@@ -6,6 +6,8 @@ from aiohttp.web_request import Request
 from maxwelld.client.types import EnvironmentId
 from maxwelld.core.service import MaxwellDemonServiceManager
 from maxwelld.helpers.bytes_pickle import base64_pickled
+from maxwelld.server.wire import get_response_wire_content_type
+from maxwelld.server.wire import wire_response
 
 
 class DcExecRequestParams(TypedDict):
@@ -29,5 +31,7 @@ async def dc_exec(request: Request) -> web.Response:
         command=params['command'],
         detached=params.get('detached', False),
     )
-    
+
+    if wire_content_type := get_response_wire_content_type(request):
+        return wire_response({'uid': uid, 'output': output}, wire_content_type)
     return web.json_response(DcExecResponseParams(uid=uid, output=base64_pickled(output)), status=200)
@@ -6,21 +6,52 @@ from aiohttp.web_request import Request
 from maxwelld.client.types import EnvironmentId
 from maxwelld.core.service import MaxwellDemonServiceManager
 from maxwelld.helpers.bytes_pickle import base64_pickled
+from maxwelld.server.wire import get_response_wire_content_type
+from maxwelld.server.wire import wire_response
 
 
 class DcExecLogsRequestParams(TypedDict):
     uid: str
+    offset: int | None  # output bytes already read
 
 
 class DcExecLogsResponseParams(TypedDict):
     output: str
 
 
+class DcExecLogsOffsetResponseParams(DcExecLogsResponseParams):
+    next_offset: int
+    status: str | None  # running | done, None for unknown exec
+    exit_code: int | None
+
+
 async def dc_exec_logs(request: Request) -> web.Response:
+    """
+    Whole exec output; with offset in request only output past it, along with exec status
+    """
     params: DcExecLogsRequestParams = await request.json()
+    offset = params.get('offset') or 0
 
-    output = await MaxwellDemonServiceManager().get().get_exec_logs(
+    output, exec_record = await MaxwellDemonServiceManager().get().get_exec_logs(
         uid=params['uid'],
+        offset=offset,
     )
-    
+    status_params = {}
+    if 'offset' in params:
+        status_params = {
+            'next_offset': offset + len(output),
+            'status': exec_record.status.value if exec_record is not None else None,
+            'exit_code': exec_record.exit_code if exec_record is not None else None,
+        }
+
+    if wire_content_type := get_response_wire_content_type(request):
+        return wire_response({'output': output} | status_params, wire_content_type)
+    if status_params:
+        return web.json_response(
+            DcExecLogsOffsetResponseParams(output=base64_pickled(output), **status_params), status=200
+        )
     return web.json_response(DcExecLogsResponseParams(output=base64_pickled(output)), status=200)
+
+
+async def dc_execs(request: Request) -> web.Response:
+    return web.json_response([exec_record.as_json() for exec_record in MaxwellDemonServiceManager().get().execs.list()])
@@ -0,0 +1,48 @@
+import json
+from typing import TypedDict
+
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from maxwelld.client.types import EnvironmentId
+from maxwelld.core.service import MaxwellDemonServiceManager
+from maxwelld.helpers.bytes_pickle import base64_decode
+from maxwelld.server.handlers.dc_logs_stream import NDJSON_CONTENT_TYPE
+from maxwelld.server.streaming import iterate_while_connected
+
+
+class DcExecStreamRequestParams(TypedDict):
+    env_id: EnvironmentId
+    container: str
+    command: str  # run with `sh -c`
+    stdin: str | None  # base64 encoded, command stdin is closed when omitted
+    timeout: float | None  # command is killed after it
+
+
+async def dc_exec_stream(request: Request) -> web.StreamResponse:
+    """
+    Newline delimited json: {"stream", "data"} per output chunk (data base64 encoded) as command prints it,
+    last line is {"exit_code", "timed_out"}
+    """
+    params: DcExecStreamRequestParams = await request.json()
+    try:
+        stdin = base64_decode(params['stdin']) if params.get('stdin') is not None else None
+    except ValueError as e:
+        return web.json_response({'error': f'Bad base64 stdin: {e}'}, status=400)
+
+    exec_events = await MaxwellDemonServiceManager().get().exec_stream(
+        env_id=params['env_id'],
+        container=params['container'],
+        command=params['command'],
+        stdin=stdin,
+        timeout=params.get('timeout'),
+    )
+    if exec_events is None:
+        return web.json_response({'error': f'No such env {params["env_id"]}'}, status=404)
+
+    response = web.StreamResponse(headers={'Content-Type': NDJSON_CONTENT_TYPE})
+    await response.prepare(request)
+    async for exec_event in iterate_while_connected(request, exec_events):
+        await response.write(json.dumps(exec_event.as_json()).encode() + b'\n')
+    await response.write_eof()
+    return response
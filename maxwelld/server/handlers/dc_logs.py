@@ -6,6 +6,8 @@ from aiohttp.web_request import Request
 from maxwelld.client.types import EnvironmentId
 from maxwelld.core.service import MaxwellDemonServiceManager
 from maxwelld.helpers.bytes_pickle import base64_pickled
+from maxwelld.server.wire import get_response_wire_content_type
+from maxwelld.server.wire import wire_response
 
 
 class DcLogsRequestParams(TypedDict):
@@ -25,4 +27,7 @@ async def dc_logs(request: Request) -> web.Response:
         services=params['services'],
     )
 
+    if wire_content_type := get_response_wire_content_type(request):
+        # raw bytes for msgpack
+        return wire_response({'logs': logs}, wire_content_type)
     return web.json_response(DcLogsResponseParams(logs=base64_pickled(logs)), status=200)
@@ -0,0 +1,45 @@
+import json
+from typing import TypedDict
+
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from maxwelld.client.types import EnvironmentId
+from maxwelld.core.service import MaxwellDemonServiceManager
+from maxwelld.server.streaming import iterate_while_connected
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+
+class DcLogsStreamRequestParams(TypedDict):
+    env_id: EnvironmentId
+    services: list[str]  # all env services when empty
+    tail: int | None  # last lines per service
+    since: str | None  # docker logs time: timestamp or relative (e.g. 10m)
+    until: str | None
+    follow: bool | None
+
+
+async def dc_logs_stream(request: Request) -> web.StreamResponse:
+    """
+    Newline delimited json {"service", "timestamp", "line"} per log line, chunked as lines come
+    """
+    params: DcLogsStreamRequestParams = await request.json()
+
+    log_lines = await MaxwellDemonServiceManager().get().logs_stream(
+        env_id=params['env_id'],
+        services=params.get('services') or [],
+        tail=params.get('tail'),
+        since=params.get('since'),
+        until=params.get('until'),
+        follow=bool(params.get('follow')),
+    )
+    if log_lines is None:
+        return web.json_response({'error': f'No such env {params["env_id"]}'}, status=404)
+
+    response = web.StreamResponse(headers={'Content-Type': NDJSON_CONTENT_TYPE})
+    await response.prepare(request)
+    async for log_line in iterate_while_connected(request, log_lines):
+        await response.write(json.dumps(log_line.as_json()).encode() + b'\n')
+    await response.write_eof()
+    return response
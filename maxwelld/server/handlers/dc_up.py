@@ -1,4 +1,3 @@
-import asyncio
 import traceback
 from typing import TypedDict
 
@@ -7,19 +6,21 @@ from aiohttp.web_request import Request
 
 from maxwelld.client.types import EnvironmentId
 from maxwelld.core.service import MaxwellDemonServiceManager
+from maxwelld.core.up_jobs import describe_up_error
 from maxwelld.errors.up import ServicesUpError
 from maxwelld.helpers.bytes_pickle import debase64_pickled
-
-UP_LOCK = asyncio.Lock()
+from maxwelld.helpers.wire_format import environment_from_wire
+from maxwelld.server.wire import read_wire_request
 
 
 class DcUpRequestParams(TypedDict):
     name: str | None
-    config_template: str | None
+    config_template: str | dict | None  # base64 pickle or wire Environment
     compose_files: str | None
     isolation: bool | None
     parallelism_limit: int | None
     force_restart: bool | None
+    async_job: bool | None  # respond with job id right away, see DC_UP_JOB_PATH
 
 
 DC_UP_DEFAULTS = {
@@ -29,6 +30,7 @@ DC_UP_DEFAULTS = {
     'isolation': False,
     'parallelism_limit': 1,
     'force_restart': False,
+    'async_job': False,
 }
 
 
@@ -40,11 +42,36 @@ class UpErrorResponseParams(TypedDict):
     error: str
 
 
+class UpJobResponseParams(TypedDict):
+    job_id: str
+    attached: bool  # same env is already starting by another request
+
+
 async def dc_up(request: Request) -> web.Response:
-    params: DcUpRequestParams = DC_UP_DEFAULTS | await request.json()
-    config_template = debase64_pickled(params['config_template']) if params['config_template'] else None
+    if (wire_params := await read_wire_request(request)) is not None:
+        params: DcUpRequestParams = DC_UP_DEFAULTS | wire_params
+        config_template = environment_from_wire(params['config_template']) if params['config_template'] else None
+    else:
+        params: DcUpRequestParams = DC_UP_DEFAULTS | await request.json()
+        config_template = debase64_pickled(params['config_template']) if params['config_template'] else None
     release_id = request.headers.get('x-release-id', None)
 
+    if params['async_job']:
+        try:
+            job, attached = MaxwellDemonServiceManager().get().start_up_job(
+                name=params['name'],
+                config_template=config_template,
+                compose_files=params['compose_files'],
+                isolation=params['isolation'],
+                parallelism_limit=params['parallelism_limit'],
+                force_restart=params['force_restart'],
+                release_id=release_id
+            )
+        except BaseException as e:
+            # e.g. no compose files: same error body as synchronous up
+            return web.json_response(UpErrorResponseParams(error=describe_up_error(e)), status=422)
+        return web.json_response(UpJobResponseParams(job_id=job.job_id, attached=attached), status=202)
+
     # TODO move to up_or_get_existing
     # TODO kill existing composes??
     try:
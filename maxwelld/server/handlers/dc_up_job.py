@@ -0,0 +1,31 @@
+from typing import TypedDict
+
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from maxwelld.core.service import MaxwellDemonServiceManager
+
+# long-poll request should outlive neither proxies idle timeouts nor client patience
+UP_JOB_POLL_MAX_TIMEOUT = 60
+
+
+class DcUpJobRequestParams(TypedDict):
+    job_id: str
+    since_version: int | None  # long-poll: respond when job changed after this version
+    timeout: float | None
+
+
+async def dc_up_job(request: Request) -> web.Response:
+    params: DcUpJobRequestParams = await request.json()
+    job = MaxwellDemonServiceManager().get().up_jobs.get(params['job_id'])
+    if job is None:
+        return web.json_response({'error': f'No such up job {params["job_id"]}'}, status=404)
+
+    if (since_version := params.get('since_version')) is not None and not job.is_finished():
+        await job.wait_changed(since_version, min(params.get('timeout') or UP_JOB_POLL_MAX_TIMEOUT,
+                                                  UP_JOB_POLL_MAX_TIMEOUT))
+    return web.json_response(job.as_json(), status=200)
+
+
+async def dc_up_jobs(request: Request) -> web.Response:
+    return web.json_response([job.as_json() for job in MaxwellDemonServiceManager().get().up_jobs.list()])
@@ -1,4 +1,3 @@
-import asyncio
 from typing import TypedDict
 
 from aiohttp import web
@@ -7,8 +6,9 @@ from aiohttp.web_request import Request
 from maxwelld.client.types import EnvironmentId
 from maxwelld.core.service import MaxwellDemonServiceManager
 from maxwelld.helpers.bytes_pickle import base64_pickled
-
-UP_LOCK = asyncio.Lock()
+from maxwelld.helpers.wire_format import environment_as_wire
+from maxwelld.server.wire import get_response_wire_content_type
+from maxwelld.server.wire import wire_response
 
 
 class EnvRequestParams(TypedDict):
@@ -22,4 +22,6 @@ class EnvResponseParams(TypedDict):
 async def http_get_env(request: Request) -> web.Response:
     params: EnvRequestParams = await request.json()
     env = await MaxwellDemonServiceManager().get().env(env_id=params['id'])
+    if wire_content_type := get_response_wire_content_type(request):
+        return wire_response({'env': environment_as_wire(env) if env is not None else None}, wire_content_type)
     return web.json_response(data=EnvResponseParams(env=base64_pickled(env)), status=200)
@@ -0,0 +1,45 @@
+from typing import TypedDict
+
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from maxwelld.client.types import EnvironmentId
+from maxwelld.core.service import MaxwellDemonServiceManager
+from maxwelld.helpers.bytes_pickle import base64_pickled
+from maxwelld.helpers.wire_format import environment_as_wire
+from maxwelld.helpers.wire_format import services_state_as_wire
+from maxwelld.server.wire import get_response_wire_content_type
+from maxwelld.server.wire import wire_response
+
+
+class EnvStateRequestParams(TypedDict):
+    id: EnvironmentId
+    services: list[str] | None  # services readiness is checked for, all env services by default
+
+
+class EnvStateResponseParams(TypedDict):
+    env: str | dict  # base64 pickle or wire Environment
+    status: str | list[dict]  # base64 pickle or wire ServicesComposeState
+    readiness: str | None  # ready | failed, None while services are starting
+
+
+async def http_get_env_state(request: Request) -> web.Response:
+    params: EnvStateRequestParams = await request.json()
+    env, status, readiness = await MaxwellDemonServiceManager().get().env_state(
+        env_id=params['id'],
+        services=params.get('services'),
+    )
+    if env is None:
+        return web.json_response({'error': f'No such env {params["id"]}'}, status=404)
+    readiness = readiness.value if readiness is not None else None
+    if wire_content_type := get_response_wire_content_type(request):
+        return wire_response({
+            'env': environment_as_wire(env),
+            'status': services_state_as_wire(status),
+            'readiness': readiness,
+        }, wire_content_type)
+    return web.json_response(EnvStateResponseParams(
+        env=base64_pickled(env),
+        status=base64_pickled(status),
+        readiness=readiness,
+    ), status=200)
@@ -1,11 +1,13 @@
 from aiohttp import web
 from aiohttp.web_request import Request
 
+from maxwelld.helpers.wire_format import get_wire_content_types
 from maxwelld.version import get_version
 
 
 async def healthcheck(request: Request) -> web.Response:
     return web.json_response({
         'status': 'ok',
-        'version': get_version()
+        'version': get_version(),
+        'wire_content_types': get_wire_content_types(),
     })
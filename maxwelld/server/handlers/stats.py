@@ -0,0 +1,8 @@
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from maxwelld.core.service import MaxwellDemonServiceManager
+
+
+async def http_get_stats(request: Request) -> web.Response:
+    return web.json_response(MaxwellDemonServiceManager().get().stats(), status=200)
@@ -1,4 +1,3 @@
-import asyncio
 from typing import TypedDict
 
 from aiohttp import web
@@ -7,12 +6,17 @@ from aiohttp.web_request import Request
 from maxwelld.client.types import EnvironmentId
 from maxwelld.core.service import MaxwellDemonServiceManager
 from maxwelld.helpers.bytes_pickle import base64_pickled
+from maxwelld.helpers.wire_format import services_state_as_wire
+from maxwelld.server.wire import get_response_wire_content_type
+from maxwelld.server.wire import wire_response
 
-UP_LOCK = asyncio.Lock()
+
+STATE_VERSION_HEADER = 'X-State-Version'
 
 
 class StatusRequestParams(TypedDict):
     id: EnvironmentId
+    since_version: int | None  # 304 Not Modified while env state version is the same
 
 
 class StatusResponseParams(TypedDict):
@@ -21,5 +25,16 @@ class StatusResponseParams(TypedDict):
 
 async def http_get_status(request: Request) -> web.Response:
     params: StatusRequestParams = await request.json()
-    status = await MaxwellDemonServiceManager().get().status(env_id=params['id'])
-    return web.json_response(StatusResponseParams(status=base64_pickled(status)), status=200)
+    service = MaxwellDemonServiceManager().get()
+    status, version = await service.versioned_status(env_id=params['id'])
+
+    headers = {'ETag': service.state_versions.etag(params['id'], version), STATE_VERSION_HEADER: str(version)}
+    if request.headers.get('If-None-Match') == headers['ETag'] or params.get('since_version') == version:
+        return web.Response(status=304, headers=headers)
+
+    if wire_content_type := get_response_wire_content_type(request):
+        response = wire_response({'status': services_state_as_wire(status)}, wire_content_type)
+    else:
+        response = web.json_response(StatusResponseParams(status=base64_pickled(status)), status=200)
+    response.headers.update(headers)
+    return response
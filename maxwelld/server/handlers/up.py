@@ -1,4 +1,3 @@
-import asyncio
 from typing import TypedDict
 
 from aiohttp import web
@@ -8,8 +7,6 @@ from maxwelld.client.types import EnvironmentId
 from maxwelld.core.service import MaxwellDemonServiceManager
 from maxwelld.helpers.bytes_pickle import debase64_pickled
 
-UP_LOCK = asyncio.Lock()
-
 
 class UpRequestParams(TypedDict):
     name: str
@@ -26,13 +23,12 @@ class UpResponseParams(TypedDict):
 
 async def up_compose(request: Request) -> web.Response:
     params: UpRequestParams = await request.json()
-    async with UP_LOCK:
-        env_id, is_new = await MaxwellDemonServiceManager().get().up_compose(
-            name=params['name'],
-            config_template=debase64_pickled(params['config_template']),
-            compose_files=params['compose_files'],
-            isolation=params['isolation'],
-            parallelism_limit=params['parallelism_limit'],
-            force_restart=params['force_restart'],
-        )
+    env_id, is_new = await MaxwellDemonServiceManager().get().up_compose(
+        name=params['name'],
+        config_template=debase64_pickled(params['config_template']),
+        compose_files=params['compose_files'],
+        isolation=params['isolation'],
+        parallelism_limit=params['parallelism_limit'],
+        force_restart=params['force_restart'],
+    )
     return web.json_response(UpResponseParams(env_id=env_id), status=200)
@@ -0,0 +1,63 @@
+import json
+from typing import TypedDict
+
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from maxwelld.client.types import EnvironmentId
+from maxwelld.core.service import MaxwellDemonServiceManager
+from maxwelld.core.state_diff import ServiceTransition
+from maxwelld.helpers.bytes_pickle import base64_pickled
+from maxwelld.helpers.wire_format import service_transition_as_wire
+from maxwelld.helpers.wire_format import services_state_as_wire
+from maxwelld.server.wire import get_response_wire_content_type
+from maxwelld.server.wire import wire_response
+
+EVENT_STREAM_CONTENT_TYPE = 'text/event-stream'
+
+
+class WaitRequestParams(TypedDict):
+    id: EnvironmentId
+    services: list[str] | None  # all env services by default
+    timeout: float | None  # capped by server WAIT_MAX_TIMEOUT
+
+
+class WaitResponseParams(TypedDict):
+    result: str  # ready | failed | timeout
+    status: str | list[dict]  # base64 pickle or wire ServicesComposeState
+
+
+def _format_event(event: str, data: dict) -> bytes:
+    return f'event: {event}\ndata: {json.dumps(data)}\n\n'.encode()
+
+
+async def http_wait(request: Request) -> web.StreamResponse:
+    params: WaitRequestParams = await request.json()
+    service = MaxwellDemonServiceManager().get()
+
+    if (environment := await service.env(params['id'])) is None:
+        return web.json_response({'error': f'No such env {params["id"]}'}, status=404)
+    services = params.get('services') or list(environment.get_services())
+
+    if EVENT_STREAM_CONTENT_TYPE in request.headers.get('Accept', ''):
+        response = web.StreamResponse(headers={'Content-Type': EVENT_STREAM_CONTENT_TYPE, 'Cache-Control': 'no-cache'})
+        await response.prepare(request)
+
+        async def send_transitions(transitions: list[ServiceTransition]) -> None:
+            for transition in transitions:
+                await response.write(_format_event('transition', service_transition_as_wire(transition)))
+
+        result, status = await service.wait_services(
+            params['id'], services, params.get('timeout'), on_transitions=send_transitions
+        )
+        await response.write(_format_event('result', {
+            'result': result.value,
+            'status': services_state_as_wire(status),
+        }))
+        await response.write_eof()
+        return response
+
+    result, status = await service.wait_services(params['id'], services, params.get('timeout'))
+    if wire_content_type := get_response_wire_content_type(request):
+        return wire_response({'result': result.value, 'status': services_state_as_wire(status)}, wire_content_type)
+    return web.json_response(WaitResponseParams(result=result.value, status=base64_pickled(status)), status=200)
@@ -1,39 +1,88 @@
+import asyncio
 import os
 
 from aiohttp import web
 
+from maxwelld.core.service import MaxwellDemonServiceManager
 from maxwelld.server.commands import DC_EXEC_PATH
+from maxwelld.server.commands import DC_EXECS_PATH
+from maxwelld.server.commands import DC_EXEC_STREAM_PATH
 from maxwelld.server.commands import DC_GET_EXEC_LOGS_PATH
 from maxwelld.server.commands import DC_LOGS_PATH
+from maxwelld.server.commands import DC_LOGS_STREAM_PATH
+from maxwelld.server.commands import DC_UP_JOBS_PATH
+from maxwelld.server.commands import DC_UP_JOB_PATH
 from maxwelld.server.commands import DC_UP_PATH
 from maxwelld.server.commands import ENV_PATH
+from maxwelld.server.commands import ENV_STATE_PATH
 from maxwelld.server.commands import HEALTHCHECK_PATH
+from maxwelld.server.commands import STATS_PATH
 from maxwelld.server.commands import STATUS_PATH
 from maxwelld.server.commands import UP_PATH
+from maxwelld.server.commands import WAIT_PATH
 from maxwelld.server.handlers.dc_exec import dc_exec
 from maxwelld.server.handlers.dc_exec_logs import dc_exec_logs
+from maxwelld.server.handlers.dc_exec_logs import dc_execs
+from maxwelld.server.handlers.dc_exec_stream import dc_exec_stream
 from maxwelld.server.handlers.dc_logs import dc_logs
+from maxwelld.server.handlers.dc_logs_stream import dc_logs_stream
 from maxwelld.server.handlers.dc_up import dc_up
+from maxwelld.server.handlers.dc_up_job import dc_up_job
+from maxwelld.server.handlers.dc_up_job import dc_up_jobs
 from maxwelld.server.handlers.env import http_get_env
+from maxwelld.server.handlers.env_state import http_get_env_state
 from maxwelld.server.handlers.healthcheck import healthcheck
+from maxwelld.server.handlers.stats import http_get_stats
 from maxwelld.server.handlers.status import http_get_status
 from maxwelld.server.handlers.up import up_compose
+from maxwelld.server.handlers.wait import http_wait
 
 routes = web.RouteTableDef()
 
-app = web.Application()
-app.add_routes([
-    web.post(DC_UP_PATH, dc_up),
-    web.post(DC_EXEC_PATH, dc_exec),
-    web.post(DC_GET_EXEC_LOGS_PATH, dc_exec_logs),
-    web.post(DC_LOGS_PATH, dc_logs),
-
-    # ============================
-    web.get(HEALTHCHECK_PATH, healthcheck),
-    web.post(UP_PATH, up_compose),
-    web.get(STATUS_PATH, http_get_status),
-    web.get(ENV_PATH, http_get_env),
-])
+ENV_CONFIGS_GC_TASK = web.AppKey('env_configs_gc_task', asyncio.Task)
+
+
+async def start_env_configs_garbage_collection(app: web.Application):
+    # in background: requests are served while containers are listed
+    app[ENV_CONFIGS_GC_TASK] = asyncio.create_task(MaxwellDemonServiceManager().get().collect_env_configs_garbage())
+
+
+async def close_service(app: web.Application):
+    if (env_configs_gc := app.get(ENV_CONFIGS_GC_TASK)) is not None:
+        env_configs_gc.cancel()
+        await asyncio.gather(env_configs_gc, return_exceptions=True)
+    if MaxwellDemonServiceManager.maxwell_demon_service is not None:
+        await MaxwellDemonServiceManager.maxwell_demon_service.close()
+
+
+def make_app() -> web.Application:
+    app = web.Application()
+    app.add_routes([
+        web.post(DC_UP_PATH, dc_up),
+        web.post(DC_UP_JOB_PATH, dc_up_job),
+        web.get(DC_UP_JOBS_PATH, dc_up_jobs),
+        web.post(DC_EXEC_PATH, dc_exec),
+        web.post(DC_GET_EXEC_LOGS_PATH, dc_exec_logs),
+        web.post(DC_EXEC_STREAM_PATH, dc_exec_stream),
+        web.get(DC_EXECS_PATH, dc_execs),
+        web.post(DC_LOGS_PATH, dc_logs),
+        web.post(DC_LOGS_STREAM_PATH, dc_logs_stream),
+
+        # ============================
+        web.get(HEALTHCHECK_PATH, healthcheck),
+        web.post(UP_PATH, up_compose),
+        web.get(STATUS_PATH, http_get_status),
+        web.get(ENV_PATH, http_get_env),
+        web.get(ENV_STATE_PATH, http_get_env_state),
+        web.get(STATS_PATH, http_get_stats),
+        web.get(WAIT_PATH, http_wait),
+    ])
+    app.on_startup.append(start_env_configs_garbage_collection)
+    app.on_cleanup.append(close_service)
+    return app
+
+
+app = make_app()
 
 
 def run_server():
@@ -0,0 +1,40 @@
+import asyncio
+from typing import AsyncIterator
+from typing import TypeVar
+
+from aiohttp.web_request import Request
+
+T = TypeVar('T')
+
+# handlers aren't cancelled on client disconnect, streams check connection while waiting for next item
+DISCONNECT_CHECK_INTERVAL = 1
+
+
+def is_client_disconnected(request: Request) -> bool:
+    return request.transport is None or request.transport.is_closing()
+
+
+async def iterate_while_connected(request: Request, items: AsyncIterator[T],
+                                  check_interval_s: float = DISCONNECT_CHECK_INTERVAL) -> AsyncIterator[T]:
+    """
+    Items of async generator till it ends or client disconnects; generator is closed either way
+    (e.g. followed process killed)
+    """
+    next_item = asyncio.ensure_future(anext(items))
+    try:
+        while True:
+            done, _ = await asyncio.wait({next_item}, timeout=check_interval_s)
+            if not done:
+                if is_client_disconnected(request):
+                    return
+                continue
+            try:
+                item = next_item.result()
+            except StopAsyncIteration:
+                return
+            yield item
+            next_item = asyncio.ensure_future(anext(items))
+    finally:
+        next_item.cancel()
+        await asyncio.gather(next_item, return_exceptions=True)
+        await items.aclose()
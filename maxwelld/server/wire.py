@@ -0,0 +1,29 @@
+from typing import Any
+
+from aiohttp import web
+from aiohttp.web_request import Request
+
+from maxwelld.helpers.wire_format import decode_wire
+from maxwelld.helpers.wire_format import encode_wire
+from maxwelld.helpers.wire_format import is_wire_content_type
+from maxwelld.helpers.wire_format import negotiate_wire_content_type
+
+
+def get_response_wire_content_type(request: Request) -> str | None:
+    """
+    Wire content type accepted by client, None for legacy (base64 pickle in json) clients
+    """
+    return negotiate_wire_content_type(request.headers.get('Accept'))
+
+
+async def read_wire_request(request: Request) -> Any | None:
+    """
+    Decoded wire request body, None for legacy json request body
+    """
+    if not is_wire_content_type(request.content_type):
+        return None
+    return decode_wire(await request.read(), request.content_type)
+
+
+def wire_response(payload: Any, content_type: str, status: int = 200) -> web.Response:
+    return web.Response(body=encode_wire(payload, content_type), status=status, content_type=content_type)
@@ -15,12 +15,14 @@ from vedro.core import Plugin
 from vedro.core import PluginConfig
 from vedro.events import ArgParseEvent
 from vedro.events import ArgParsedEvent
+from vedro.events import CleanupEvent
 from vedro.events import ConfigLoadedEvent
 from vedro.events import ScenarioRunEvent
 from vedro.events import StartupEvent
 
 from maxwelld import Environment
 from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.core.readiness import ReadinessResult
 from maxwelld.core.sequence_run_types import ComposeConfig
 from maxwelld.env_description.env_types import Environments
 from maxwelld.helpers.jobs_result import JobResult
@@ -31,6 +33,10 @@ from maxwelld.vedro_plugin.logger import WaitVerbosity
 from maxwelld.vedro_plugin.scenario_ordering import EnvTagsOrderer
 from maxwelld.vedro_plugin.scenario_tag_processing import extract_scenario_config
 from maxwelld.vedro_plugin.scenario_tag_processing import extract_scenarios_configs_set
+from maxwelld.vedro_plugin.state_waiting import WaitAllServicesUp
+from maxwelld.vedro_plugin.state_waiting import log_service_transition
+from maxwelld.vedro_plugin.state_waiting import log_up_job_progress
+from maxwelld.vedro_plugin.state_waiting import report_services_wait_result
 from maxwelld.vedro_plugin.state_waiting import wait_all_services_up
 
 DEFAULT_COMPOSE = 'default'
@@ -86,7 +92,8 @@ class VedroMaxwellPlugin(Plugin):
             .listen(vedro.events.ArgParseEvent, self.handle_arg_parse) \
             .listen(vedro.events.ArgParsedEvent, self.handle_arg_parsed) \
             .listen(vedro.events.StartupEvent, self.handle_scenarios) \
-            .listen(vedro.events.ScenarioRunEvent, self.handle_setup_test_config)
+            .listen(vedro.events.ScenarioRunEvent, self.handle_setup_test_config) \
+            .listen(vedro.events.CleanupEvent, self.handle_cleanup)
 
     def on_config_loaded(self, event: ConfigLoadedEvent) -> None:
         self._global_config: ConfigType = event.config
@@ -96,6 +103,20 @@ class VedroMaxwellPlugin(Plugin):
         if not environment:
             raise ValueError(f'No such {env_id} environment somehow to wait for up!')
 
+        # custom waiters keep their own checks, default one is done by server in single request
+        if type(self._wait_all_service_func) is WaitAllServicesUp:
+            wait_result = await self._maxwell_demon.wait(
+                env_id,
+                services=list(environment.get_services()),
+                timeout=self._wait_all_service_func.timeout_s,
+                on_transition=log_service_transition if verbose == WaitVerbosity.FULL else None,
+            )
+            if wait_result is not None:
+                up_result = report_services_wait_result(*wait_result, verbose=verbose)
+                assert up_result != JobResult.BAD, f"Can't done up environment"
+                return
+
+        # custom waiter or server without wait endpoint
         checker = self._wait_all_service_func.make_checker()
 
         up_result = await checker(
@@ -105,7 +126,25 @@ class VedroMaxwellPlugin(Plugin):
         )
         assert up_result != JobResult.BAD, f"Can't done up environment"
 
+    async def _get_warm_env_id(self, env_name: str, env_config: Environment) -> str | None:
+        """
+        Env started for previous scenario with the same config if it is still ready: single request
+        """
+        if self._force_restart or self._lats_env_name_started != env_name or self._lats_env_id_started is None:
+            return None
+        env_state = await self._maxwell_demon.env_state(
+            self._lats_env_id_started,
+            services=list(env_config.get_services()),
+        )
+        if env_state is None or env_state.readiness != ReadinessResult.READY:
+            return None
+        return self._lats_env_id_started
+
     async def up_env(self, env_config: Environment, stage: Stage):
+        env_name = str(env_config) + self._chosen_config_name_postfix
+        if warm_env_id := await self._get_warm_env_id(env_name, env_config):
+            return warm_env_id
+
         if (self._verbose and not self._reported_full) or stage == Stage.INIT:
             CONSOLE.print(
                 Text('Starting ', style=Style.regular)
@@ -114,11 +153,13 @@ class VedroMaxwellPlugin(Plugin):
             )
 
         started_env_id = await self._maxwell_demon.up(
-            name=str(env_config) + self._chosen_config_name_postfix,
+            name=env_name,
             config_template=env_config,
             compose_files=self._compose_choice.compose_files,
             parallelism_limit=self._compose_choice.parallel_env_limit,
-            force_restart=self._force_restart
+            force_restart=self._force_restart,
+            as_job=True,
+            on_progress=log_up_job_progress if self._verbose else None,
         )
 
         verbose = WaitVerbosity.COMPACT
@@ -134,6 +175,7 @@ class VedroMaxwellPlugin(Plugin):
 
         self._force_restart = False
         self._reported_full = True
+        self._lats_env_name_started = env_name
         self._lats_env_id_started = started_env_id
         return started_env_id
 
@@ -181,6 +223,11 @@ class VedroMaxwellPlugin(Plugin):
         environment = await self._maxwell_demon.env(env_id)
         setup_env_for_tests(environment)
 
+    async def handle_cleanup(self, event: CleanupEvent) -> None:
+        if self._verbose:
+            CONSOLE.print(f'Maxwell demon client connections: {self._maxwell_demon.connections_stats.as_json()}')
+        await self._maxwell_demon.close()
+
     def handle_arg_parse(self, event: ArgParseEvent) -> None:
         group = event.arg_parser.add_argument_group("Maxwell Demon")
         group.add_argument("--md-list-envs",
@@ -10,6 +10,10 @@ from maxwelld.core.compose_data_types import ComposeHealth
 from maxwelld.core.compose_data_types import ComposeState
 from maxwelld.core.compose_data_types import ServiceComposeState
 from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.readiness import ReadinessResult
+from maxwelld.core.readiness import get_waited_service_name
+from maxwelld.core.state_diff import ServiceTransition
+from maxwelld.core.state_diff import is_service_ready
 from maxwelld.helpers.countdown_counter import CountdownCounterKeeper
 from maxwelld.helpers.jobs_result import JobResult
 from maxwelld.helpers.state_keeper import ServicesState
@@ -42,13 +46,9 @@ async def check_all_services_up(
 
     services_state = await get_services_state()
 
-    is_all_up = (all([
-        service.state == ComposeState.RUNNING or (service.state == ComposeState.EXITED and service.exit_code == 0)
-        for service in services_state if service.name in services
-    ]) and all([
-        service.health in (ComposeHealth.EMPTY, ComposeHealth.HEALTHY)
-        for service in services_state if service.name in services
-    ]))
+    is_all_up = all(
+        is_service_ready(service) for service in services_state if get_waited_service_name(service, services)
+    )
 
     if is_all_up:
         if verbose == WaitVerbosity.COMPACT:
@@ -67,23 +67,78 @@ async def check_all_services_up(
         logger.flush()
         return JobResult.BAD
 
-    if state_keeper.not_in_state(services_state):
-        logger.log(Text(f' ✗ Still not ready services:', style=output_style.bad))
-        logger.log(services_state.as_rich_text(
-            filter=is_service_not_running_or_not_healthy,
-            style=output_style
-        ))
+    if transitions := state_keeper.services_transitions(services_state):
+        if state_keeper.in_state(ServicesState.DEFAULT_STATE):
+            logger.log(Text(f' ✗ Still not ready services:', style=output_style.bad))
+            logger.log(services_state.as_rich_text(
+                filter=is_service_not_running_or_not_healthy,
+                style=output_style
+            ))
+        else:
+            logger.log(Text(f' ~ Services changes:', style=output_style.info))
+            for transition in transitions:
+                logger.log(transition.as_rich_text(style=output_style))
         logger.flush()
         state_keeper.update_state(services_state)
 
     return JobResult.BAD
 
 
+async def log_service_transition(transition: ServiceTransition) -> None:
+    logger = Logger(CONSOLE)
+    logger.log(transition.as_rich_text(style=Style()))
+    logger.flush()
+
+
+async def log_up_job_progress(job: dict) -> None:
+    progress = job['progress']
+    progress_string = Text(f' ~ {job["name"]}: {progress["percent"]}%', style=Style.info)
+    if progress['tier_services']:
+        progress_string.append(Text(
+            f' tier {progress["tier"]}/{progress["tiers_total"]} {progress["tier_services"]}', style=Style.regular
+        ))
+    if progress['migration']:
+        progress_string.append(Text(f' migration {progress["migration"]}', style=Style.regular))
+    logger = Logger(CONSOLE)
+    logger.log(progress_string)
+    logger.flush()
+
+
+def report_services_wait_result(result: ReadinessResult, services_state: ServicesComposeState,
+                                verbose: WaitVerbosity = WaitVerbosity.FULL) -> JobResult:
+    """
+    Reports server side wait outcome the same way as client side check_all_services_up
+    """
+    output_style = Style()
+    logger = Logger(CONSOLE)
+
+    if result == ReadinessResult.READY:
+        if verbose == WaitVerbosity.COMPACT:
+            logger.log(Text(f' ✔ All services up\n', style=output_style.mark_neutral))
+        if verbose == WaitVerbosity.FULL:
+            logger.log(Text(f' ✔ All services up:', style=output_style.mark_neutral))
+            logger.log(services_state.as_rich_text(style=output_style))
+        logger.flush()
+        return JobResult.GOOD
+
+    if result == ReadinessResult.FAILED:
+        logger.log(Text(' ✗ Services failed to start:', style=output_style.bad))
+    else:
+        logger.log(Text(' ✗ Stop waiting. Still not ready services:', style=output_style.bad))
+    logger.log(services_state.as_rich_text(style=output_style))
+    logger.flush()
+    return JobResult.BAD
+
+
 class WaitAllServicesUp:
     def __init__(self, attempts: int = 100, delay_s: int = 3):
         self._attempts = attempts
         self._delay_s = delay_s
 
+    @property
+    def timeout_s(self) -> int:
+        return self._attempts * self._delay_s
+
     def make_checker(self) -> Callable:
         return partial(
             retry(
@@ -28,6 +28,10 @@ setup(
     license="Apache-2.0",
     packages=find_packages(exclude=("tests",)),
     install_requires=find_required(),
+    extras_require={
+        # binary client-server wire format
+        'msgpack': ['msgpack>=1.0,<2.0'],
+    },
     entry_points={},
     classifiers=[
         "License :: OSI Approved :: Apache Software License",
@@ -0,0 +1,58 @@
+import json
+
+import vedro
+from aiohttp import web
+
+
+class FakeDockerEngine:
+    """
+    Docker Engine API stand-in: serves predefined containers and records incoming requests
+    """
+
+    def __init__(self, containers: list[dict]):
+        self.containers = containers
+        self.requests: list[web.Request] = []
+        self.url: str | None = None
+        self._runner: web.AppRunner | None = None
+
+    async def _containers_json(self, request: web.Request) -> web.Response:
+        self.requests.append(request)
+        labels = json.loads(request.query.get('filters', '{}')).get('label', [])
+        containers = [
+            container for container in self.containers
+            if all(
+                label in container['Labels'] or label in {f'{k}={v}' for k, v in container['Labels'].items()}
+                for label in labels
+            )
+        ]
+        return web.json_response(containers)
+
+    async def start(self) -> 'FakeDockerEngine':
+        app = web.Application()
+        app.add_routes([web.get('/containers/json', self._containers_json)])
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f'tcp://127.0.0.1:{port}'
+        return self
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+def make_engine_container(service: str, state: str, status: str, labels: dict[str, str] = None) -> dict:
+    return {
+        'Id': f'{service}-id',
+        'Names': [f'/{service}'],
+        'State': state,
+        'Status': status,
+        'Labels': {'com.docker.compose.service': service} | (labels or {}),
+    }
+
+
+async def fake_docker_engine_started(containers: list[dict]) -> FakeDockerEngine:
+    engine = await FakeDockerEngine(containers).start()
+    vedro.defer(engine.stop)
+    return engine
@@ -0,0 +1,39 @@
+import asyncio
+from typing import AsyncIterator
+
+from maxwelld.helpers.labels import Label
+
+
+class ScriptedEventsSource:
+    """
+    Container events source replaying scripted streams: each subscription gets next stream,
+    last stream stays open after its events
+    """
+
+    def __init__(self, streams: list[list[dict]]):
+        self._streams = streams
+        self.subscriptions = 0
+
+    async def events(self) -> AsyncIterator[dict]:
+        stream = self._streams[min(self.subscriptions, len(self._streams) - 1)]
+        self.subscriptions += 1
+        is_last = self.subscriptions >= len(self._streams)
+        for event in stream:
+            await asyncio.sleep(0)
+            yield event
+        if is_last:
+            await asyncio.Event().wait()
+
+
+def make_container_event(action: str, service: str, env_id: str, **attributes) -> dict:
+    return {
+        'Type': 'container',
+        'Action': action,
+        'Actor': {
+            'ID': f'{service}-id',
+            'Attributes': {
+                'com.docker.compose.service': service,
+                Label.ENV_ID: env_id,
+            } | attributes,
+        },
+    }
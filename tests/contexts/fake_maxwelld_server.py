@@ -0,0 +1,143 @@
+import asyncio
+from typing import AsyncIterator
+
+import vedro
+from aiohttp import web
+
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.service import MaxwellDemonService
+from maxwelld.core.service import MaxwellDemonServiceManager
+from maxwelld.core.state_versions import EnvStateVersions
+from maxwelld.core.up_jobs import UpJobsRegistry
+from maxwelld.core.utils.compose_logs import ComposeLogLine
+from maxwelld.core.utils.exec_output import ExecExit
+from maxwelld.core.utils.exec_output import ExecOutput
+from maxwelld.env_description.env_types import Environment
+from maxwelld.server.maxwelld_server import make_app
+
+
+class FakeMaxwellDemonService:
+    """
+    MaxwellDemonService stand-in with predefined envs and their states, records calls.
+    States sequences are returned one per status call, last one repeats
+    """
+    # real waiting and readiness logic over fake states
+    wait_services = MaxwellDemonService.wait_services
+    env_state = MaxwellDemonService.env_state
+
+    def __init__(self, environments: dict[str, Environment] = None, statuses: dict[str, ServicesComposeState] = None,
+                 states_sequences: dict[str, list[ServicesComposeState]] = None):
+        self.environments = environments or {}
+        self.statuses = statuses or {}
+        self.states_sequences = states_sequences or {}
+        self.calls: list[tuple[str, str]] = []
+        self._wait_poll_interval = 0.01
+        self._wait_max_timeout = 10
+        self.up_jobs = UpJobsRegistry()
+        self.state_versions = EnvStateVersions()
+        # env startup run by up jobs: (name, progress) -> (env_id, is_new)
+        self.up_run = None
+        # raised by start_up_job before job is started, like unresolvable compose files
+        self.up_job_start_error: BaseException | None = None
+        # logs_stream lines by env, followed streams wait for more lines till closed
+        self.log_lines: dict[str, list[ComposeLogLine]] = {}
+        self.logs_streams_closed = asyncio.Event()
+        # exec_stream events by command (env is unknown for others), stdin is echoed to stdout before them
+        self.exec_events: dict[str, list[ExecOutput | ExecExit]] = {}
+
+    def _get_synced_state_index(self) -> None:
+        return None
+
+    async def env(self, env_id: str) -> Environment | None:
+        self.calls.append(('env', env_id))
+        return self.environments.get(env_id)
+
+    async def status(self, env_id: str) -> ServicesComposeState:
+        self.calls.append(('status', env_id))
+        if env_id in self.states_sequences:
+            states_sequence = self.states_sequences[env_id]
+            return states_sequence.pop(0) if len(states_sequence) > 1 else states_sequence[0]
+        # like compose for unknown env: no containers
+        return self.statuses.get(env_id, ServicesComposeState(''))
+
+    async def versioned_status(self, env_id: str) -> tuple[ServicesComposeState, int]:
+        services_state = await self.status(env_id)
+        return services_state, self.state_versions.observe(env_id, services_state)
+
+    async def logs_stream(self, env_id: str, services: list[str], tail: int = None, since: str = None,
+                          until: str = None, follow: bool = False) -> AsyncIterator[ComposeLogLine] | None:
+        self.calls.append(('logs_stream', env_id))
+        if env_id not in self.log_lines:
+            return None
+        return self._iter_log_lines(env_id, services, tail, follow)
+
+    async def _iter_log_lines(self, env_id: str, services: list[str], tail: int | None,
+                              follow: bool) -> AsyncIterator[ComposeLogLine]:
+        log_lines = [log_line for log_line in self.log_lines[env_id] if not services or log_line.service in services]
+        try:
+            for log_line in log_lines[-tail:] if tail else log_lines:
+                yield log_line
+            if follow:
+                await asyncio.Event().wait()
+        finally:
+            self.logs_streams_closed.set()
+
+    async def exec_stream(self, env_id: str, container: str, command: str, stdin: bytes = None,
+                          timeout: float = None) -> AsyncIterator[ExecOutput | ExecExit] | None:
+        self.calls.append(('exec_stream', env_id))
+        if command not in self.exec_events:
+            return None
+        return self._iter_exec_events(command, stdin)
+
+    async def _iter_exec_events(self, command: str, stdin: bytes | None) -> AsyncIterator[ExecOutput | ExecExit]:
+        if stdin is not None:
+            yield ExecOutput('stdout', stdin)
+        for exec_event in self.exec_events[command]:
+            yield exec_event
+
+    def start_up_job(self, name: str, **kwargs):
+        self.calls.append(('start_up_job', name))
+        if self.up_job_start_error is not None:
+            raise self.up_job_start_error
+        return self.up_jobs.start(key=name, name=name, run=lambda progress: self.up_run(name, progress))
+
+    async def collect_env_configs_garbage(self) -> None:
+        ...
+
+    async def close(self) -> None:
+        await self.up_jobs.close()
+
+
+class FakeMaxwelldServer:
+    """
+    Real maxwelld http app on random port served by given service
+    """
+
+    def __init__(self, service: FakeMaxwellDemonService):
+        self.service = service
+        self.host: str | None = None
+        self.port: int | None = None
+        self._runner: web.AppRunner | None = None
+        self._replaced_service = None
+
+    async def start(self) -> 'FakeMaxwelldServer':
+        self._replaced_service = MaxwellDemonServiceManager.maxwell_demon_service
+        MaxwellDemonServiceManager.maxwell_demon_service = self.service
+
+        self._runner = web.AppRunner(make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.host = 'http://127.0.0.1'
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        await self._runner.cleanup()
+        MaxwellDemonServiceManager.maxwell_demon_service = self._replaced_service
+
+
+async def fake_maxwelld_server_started(service: FakeMaxwellDemonService) -> FakeMaxwelldServer:
+    server = await FakeMaxwelldServer(service).start()
+    vedro.defer(server.stop)
+    return server
@@ -0,0 +1,56 @@
+import asyncio
+import json
+
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.helpers.labels import Label
+
+
+class FakeStateBackend:
+    """
+    Services state backend answering with given state after delay, counts queries
+    """
+
+    def __init__(self, state: ServicesComposeState, delay_s: float = 0.05):
+        self.state = state
+        self.delay_s = delay_s
+        self.queries: list[dict | None] = []
+
+    async def get_services_state(self, labels: dict[str, str] = None) -> ServicesComposeState:
+        self.queries.append(labels)
+        await asyncio.sleep(self.delay_s)
+        if not labels:
+            return self.state
+        return self.state.get_all_for(
+            lambda service_state: all(service_state.check(label, value) for label, value in labels.items())
+        )
+
+    async def close(self) -> None:
+        ...
+
+
+def make_compose_ps_line(service: str, state: str, health: str = '', exit_code: int = 0,
+                         labels: dict[str, str] = None) -> str:
+    return json.dumps({
+        'Service': service,
+        'State': state,
+        'ExitCode': exit_code,
+        'Health': health,
+        'Status': state,
+        'Labels': ','.join(f'{k}={v}' for k, v in (labels or {}).items()),
+    })
+
+
+def make_isolated_env_ps_line(service: str, env_id: str, state: str, exit_code: int = 0) -> str:
+    """
+    Container of isolated env: named with env id suffix, labeled with its service template name
+    """
+    return make_compose_ps_line(f'{service}-{env_id}', state, exit_code=exit_code,
+                                labels={Label.ENV_ID: env_id, Label.SERVICE_TEMPLATE_NAME: service})
+
+
+def make_compose_state(services_json_lines: list[str]) -> ServicesComposeState:
+    return ServicesComposeState('\n'.join(services_json_lines))
+
+
+def fake_state_backend(services_json_lines: list[str] = (), delay_s: float = 0.05) -> FakeStateBackend:
+    return FakeStateBackend(make_compose_state(services_json_lines), delay_s=delay_s)
@@ -0,0 +1,41 @@
+import asyncio
+from asyncio import subprocess
+
+from maxwelld.core.exec_registry import ExecRegistry
+from maxwelld.core.service import MaxwellDemonService
+from maxwelld.core.utils.exec_output import ExecExit
+from maxwelld.core.utils.exec_output import ExecOutput
+from maxwelld.core.utils.process_command_output import iter_process_output
+
+
+class LocalShellExecutor:
+    """
+    Runs exec commands in local shell instead of env container, records them
+    """
+
+    def __init__(self):
+        self.commands = []
+
+    async def dc_exec_stream(self, container, command):
+        self.commands.append(command)
+        process = await asyncio.create_subprocess_exec(
+            'sh', '-c', command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        async for output_chunk in iter_process_output(process, chunk_size=1024):
+            yield ExecOutput(output_chunk.stream, output_chunk.line)
+        yield ExecExit(process.returncode)
+
+
+class LocalExecService:
+    """
+    Real MaxwellDemonService execs over local shell
+    """
+    exec = MaxwellDemonService.exec
+    get_exec_logs = MaxwellDemonService.get_exec_logs
+
+    def __init__(self):
+        self.execs = ExecRegistry()
+        self.executor = LocalShellExecutor()
+
+    async def _get_env_compose_interface(self, env_id):
+        return self.executor
@@ -0,0 +1,34 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_reusing_env_id_for_new_config(self):
+        self.first, self.second = Environment('first', Service('web')), Environment('second', Service('db'))
+        service = FakeMaxwellDemonService(environments={'a1b2': self.first})
+
+        async def up_run(name, progress):
+            # env was downed and its random id was given to another config
+            service.environments['a1b2'] = self.second
+            return 'a1b2', True
+
+        service.up_run = up_run
+        self.server = await fake_maxwelld_server_started(service)
+
+    async def given_client_with_cached_env_config(self):
+        self.client = MaxwellDemonClient(self.server.host, self.server.port)
+        vedro.defer(self.client.close)
+        self.cached_env = await self.client.env('a1b2')
+
+    async def when_up_returns_same_env_id(self):
+        env_id = await self.client.up('second', self.second, 'docker-compose.yml', as_job=True)
+        self.env = await self.client.env(env_id)
+
+    async def then_new_env_config_should_be_received(self):
+        assert (self.cached_env, self.env) == (self.first, self.second)
+        assert self.server.service.calls.count(('env', 'a1b2')) == 2
@@ -0,0 +1,39 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.core.sequence_run_types import EMPTY_ID
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_starting_envs_without_parallelism(self):
+        # without parallelism every config is started under the same env id
+        self.environments = {
+            'first': Environment('first', Service('web')),
+            'second': Environment('second', Service('db')),
+        }
+        service = FakeMaxwellDemonService()
+
+        async def up_run(name, progress):
+            service.environments[EMPTY_ID] = self.environments[name]
+            return EMPTY_ID, True
+
+        service.up_run = up_run
+        self.server = await fake_maxwelld_server_started(service)
+
+    async def when_client_runs_configs_in_sequence(self):
+        self.envs = []
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            for name, environment in self.environments.items():
+                env_id = await client.up(name, environment, 'docker-compose.yml', parallelism_limit=1, as_job=True)
+                self.envs.append(await client.env(env_id))
+                self.envs.append(await client.env(env_id))
+
+    async def then_each_config_should_be_received_for_its_run(self):
+        assert self.envs == [
+            self.environments['first'], self.environments['first'],
+            self.environments['second'], self.environments['second'],
+        ]
@@ -0,0 +1,39 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.core.readiness import ReadinessResult
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_ready_env(self):
+        self.environment = Environment('dev', Service('web', {'WEB_PORT': '80'}), Service('db'))
+        self.status = make_compose_state([
+            make_compose_ps_line('web', 'running'),
+            make_compose_ps_line('db', 'running', health='healthy'),
+        ])
+        self.server = await fake_maxwelld_server_started(FakeMaxwellDemonService(
+            environments={'env1': self.environment},
+            statuses={'env1': self.status},
+        ))
+
+    async def when_client_gets_env_state_and_env(self):
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            self.env_state = await client.env_state('env1')
+            self.env = await client.env('env1')
+            self.connections_stats = client.connections_stats.as_json()
+
+    async def then_env_state_should_be_received(self):
+        assert self.env_state.env == self.environment
+        assert self.env_state.status == self.status
+        assert self.env_state.readiness == ReadinessResult.READY
+
+    async def and_env_should_be_taken_from_cache(self):
+        assert self.env == self.environment
+        assert self.connections_stats['requests'] == 1
+        assert self.server.service.calls == [('env', 'env1'), ('status', 'env1')]
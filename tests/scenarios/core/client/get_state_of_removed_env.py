@@ -0,0 +1,34 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_partially_removed_env(self):
+        self.server = await fake_maxwelld_server_started(FakeMaxwellDemonService(
+            environments={'env1': Environment('dev', Service('db'), Service('web'))},
+            # web container was removed
+            statuses={'env1': make_compose_state([make_compose_ps_line('db', 'running', health='healthy')])},
+        ))
+
+    async def when_client_gets_states_of_removed_and_unknown_envs(self):
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            self.env_state = await client.env_state('env1')
+            self.unknown_env_state = await client.env_state('env2')
+            try:
+                await client.wait('env2', timeout=5)
+            except ValueError as e:
+                self.wait_error = e
+
+    async def then_env_with_missing_service_should_not_be_ready(self):
+        assert self.env_state.readiness is None
+
+    async def and_unknown_env_should_not_be_found(self):
+        assert self.unknown_env_state is None
+        assert str(self.wait_error) == 'No such env2 environment to wait for'
@@ -0,0 +1,32 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_env(self):
+        self.server = await fake_maxwelld_server_started(FakeMaxwellDemonService(statuses={
+            'env1': make_compose_state([make_compose_ps_line('web', 'running')]),
+        }))
+
+    async def when_client_makes_many_calls(self):
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            await client.healthcheck()
+            self.statuses = [await client.status('env1') for _ in range(10)]
+            self.connections_stats = client.connections_stats.as_json()
+
+    async def then_statuses_should_be_received(self):
+        assert all(status == make_compose_state([make_compose_ps_line('web', 'running')])
+                   for status in self.statuses)
+
+    async def and_one_keep_alive_connection_should_be_reused(self):
+        assert self.connections_stats == {
+            'requests': 11,
+            'connections_created': 1,
+            'connections_reused': 10,
+            'not_modified': 9,
+        }
@@ -0,0 +1,19 @@
+import vedro
+
+from maxwelld.core.compose_retry import RetryPolicy
+
+
+class Scenario(vedro.Scenario):
+    async def given_retry_policy(self):
+        self.policy = RetryPolicy(attempts=10, base_delay_s=0.5, max_delay_s=4)
+
+    async def when_delays_calculated(self):
+        self.delays = [self.policy.delay(attempt) for attempt in range(1, 8)]
+
+    async def then_delays_should_grow_exponentially_with_jitter(self):
+        for attempt, delay in enumerate(self.delays, start=1):
+            backoff = min(4, 0.5 * 2 ** (attempt - 1))
+            assert backoff / 2 <= delay <= backoff
+
+    async def and_delays_should_be_capped(self):
+        assert max(self.delays) <= 4
@@ -0,0 +1,26 @@
+import vedro
+
+from maxwelld.core.compose_retry import FailureKind
+from maxwelld.core.compose_retry import classify_failure
+
+
+class Scenario(vedro.Scenario):
+    subject = 'classify compose failure: {stderr}'
+
+    @vedro.params(1, b'Cannot connect to the Docker daemon at unix:///var/run/docker.sock', FailureKind.TRANSIENT)
+    @vedro.params(1, b'Error response from daemon: toomanyrequests: pull rate limit', FailureKind.TRANSIENT)
+    @vedro.params(1, b'net/http: TLS handshake timeout', FailureKind.TRANSIENT)
+    @vedro.params(-9, b'', FailureKind.TRANSIENT)
+    @vedro.params(1, b'service "unknown" is not running', FailureKind.PERMANENT)
+    @vedro.params(1, b'yaml: line 3: mapping values are not allowed in this context', FailureKind.PERMANENT)
+    @vedro.params(126, b'OCI runtime exec failed: exec: "migrate": executable file not found', FailureKind.PERMANENT)
+    def __init__(self, returncode, stderr, kind):
+        self.returncode = returncode
+        self.stderr = stderr
+        self.kind = kind
+
+    async def when_failure_classified(self):
+        self.result = classify_failure(self.returncode, self.stderr)
+
+    async def then_it_should_match_expected_kind(self):
+        assert self.result == self.kind
@@ -0,0 +1,29 @@
+import asyncio
+
+import vedro
+
+from maxwelld.core.compose_scheduler import CommandPriority
+from maxwelld.core.compose_scheduler import ComposeCommandsScheduler
+
+
+class Scenario(vedro.Scenario):
+    async def given_scheduler_with_per_env_limit(self):
+        self.scheduler = ComposeCommandsScheduler(concurrency_limit=10, per_env_concurrency_limit=2)
+        self.running = {'env1': 0, 'env2': 0}
+        self.max_running = {'env1': 0, 'env2': 0}
+
+    async def when_many_commands_run_for_envs(self):
+        async def command(env_key: str):
+            async with self.scheduler.slot(CommandPriority.LOGS, env_key=env_key):
+                self.running[env_key] += 1
+                self.max_running[env_key] = max(self.max_running[env_key], self.running[env_key])
+                await asyncio.sleep(0.01)
+                self.running[env_key] -= 1
+
+        await asyncio.gather(*[command(env_key) for env_key in ('env1', 'env2') for _ in range(5)])
+
+    async def then_each_env_should_run_within_its_limit_in_parallel(self):
+        assert self.max_running == {'env1': 2, 'env2': 2}
+
+    async def and_waits_should_be_recorded(self):
+        assert self.scheduler.stats()['wait']['logs']['count'] == 10
@@ -0,0 +1,73 @@
+import asyncio
+
+import vedro
+from d42 import schema
+
+from maxwelld.core.compose_scheduler import CommandPriority
+from maxwelld.core.compose_scheduler import ComposeCommandsScheduler
+
+
+class Scenario(vedro.Scenario):
+    async def given_scheduler_with_single_slot(self):
+        self.scheduler = ComposeCommandsScheduler(concurrency_limit=1, per_env_concurrency_limit=1)
+        self.started = []
+
+    async def given_slot_busy_with_logs_command(self):
+        self.release_busy = asyncio.Event()
+
+        async def busy():
+            async with self.scheduler.slot(CommandPriority.LOGS, env_key='env1'):
+                await self.release_busy.wait()
+
+        self.busy = asyncio.ensure_future(busy())
+        await asyncio.sleep(0)
+
+    async def given_queued_commands(self):
+        async def command(priority: CommandPriority, env_key: str):
+            async with self.scheduler.slot(priority, env_key=env_key):
+                self.started.append(priority)
+
+        self.commands = [
+            asyncio.ensure_future(command(priority, env_key))
+            for priority, env_key in [
+                (CommandPriority.LOGS, 'env1'),
+                (CommandPriority.EXEC, 'env2'),
+                (CommandPriority.STATE, 'env3'),
+                (CommandPriority.UP_DOWN, 'env1'),
+            ]
+        ]
+        await asyncio.sleep(0)
+        self.queued_stats = self.scheduler.stats()
+
+    async def when_busy_command_finished(self):
+        self.release_busy.set()
+        await asyncio.gather(self.busy, *self.commands)
+
+    async def then_queued_commands_should_start_by_priority(self):
+        assert self.started == [
+            CommandPriority.STATE, CommandPriority.UP_DOWN, CommandPriority.EXEC, CommandPriority.LOGS,
+        ]
+
+    async def and_queue_depth_should_be_reported(self):
+        assert self.queued_stats == schema.dict({
+            'running': schema.int(1),
+            'queue_depth': schema.dict({
+                'state': schema.int(1),
+                'up_down': schema.int(1),
+                'exec': schema.int(1),
+                'logs': schema.int(1),
+            }),
+            'wait': schema.dict,
+        })
+
+    async def and_all_slots_should_be_released(self):
+        assert self.scheduler.stats() == schema.dict({
+            'running': schema.int(0),
+            'queue_depth': schema.dict({
+                'state': schema.int(0),
+                'up_down': schema.int(0),
+                'exec': schema.int(0),
+                'logs': schema.int(0),
+            }),
+            'wait': schema.dict,
+        })
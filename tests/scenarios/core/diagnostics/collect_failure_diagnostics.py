@@ -0,0 +1,73 @@
+import shutil
+import tempfile
+from pathlib import Path
+
+import vedro
+
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.core.diagnostics import DiagnosticsCollector
+from maxwelld.core.diagnostics import bytes_tail
+from maxwelld.helpers.jobs_result import JobResult
+
+
+class FakeComposeExecutor:
+    def __init__(self, state, logs):
+        self.state = state
+        self.logs = logs
+        self.logs_requests = []
+
+    async def dc_state(self):
+        return self.state
+
+    async def dc_logs(self, services):
+        self.logs_requests += services
+        return JobResult.GOOD, self.logs[services[0]]
+
+    async def dc_logs_to_file(self, services, path, tail_bytes):
+        self.logs_requests += services
+        path.write_bytes(self.logs[services[0]])
+        return JobResult.GOOD, self.logs[services[0]][-tail_bytes:]
+
+
+class Scenario(vedro.Scenario):
+    async def given_env_with_failed_service_and_long_logs(self):
+        self.failed_log = b''.join(f'line {i}\n'.encode() for i in range(1000)) + b'error service exception log\n'
+        self.executor = FakeComposeExecutor(
+            state=make_compose_state([
+                make_compose_ps_line('db', 'running', health='healthy'),
+                make_compose_ps_line('web', 'exited', exit_code=1),
+            ]),
+            logs={'db': b'db is fine\n', 'web': self.failed_log},
+        )
+        self.directory = Path(tempfile.mkdtemp())
+        vedro.defer(shutil.rmtree, self.directory)
+        self.collector = DiagnosticsCollector(
+            compose_executor=self.executor,
+            logs_directory=self.directory / 'diagnostics',
+            host_logs_directory=Path('/host/env-tmp/env1/diagnostics'),
+            tail_lines=3,
+            tail_bytes=1024,
+            concurrency_limit=4,
+        )
+
+    async def when_diagnostics_collected(self):
+        self.report = await self.collector.collect(['db', 'web'])
+
+    async def then_only_failed_service_logs_should_be_fetched(self):
+        assert self.executor.logs_requests == ['web']
+
+    async def and_report_should_have_logs_tail(self):
+        assert self.report.logs_tails == {'web': b'line 998\nline 999\nerror service exception log\n'}
+        assert self.report.truncated == {'web'}
+        assert 'error service exception log' in str(self.report)
+        assert 'line 997' not in str(self.report)
+
+    async def and_full_logs_should_be_written_to_env_tmp_directory(self):
+        assert (self.directory / 'diagnostics' / 'web.log').read_bytes() == self.failed_log
+        assert 'full logs in /host/env-tmp/env1/diagnostics' in str(self.report)
+
+    async def and_tail_of_output_without_trailing_newline_should_have_max_lines(self):
+        assert bytes_tail(b'a\nb\nc', max_lines=1, max_bytes=100) == (b'c', True)
+        assert bytes_tail(b'a\nb\nc\n', max_lines=1, max_bytes=100) == (b'c\n', True)
+        assert bytes_tail(b'a\nb\nc', max_lines=3, max_bytes=100) == (b'a\nb\nc', False)
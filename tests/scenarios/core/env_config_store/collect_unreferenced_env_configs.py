@@ -0,0 +1,41 @@
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import vedro
+
+from maxwelld.core.env_config_store import EnvConfigStore
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class Scenario(vedro.Scenario):
+    async def given_store_with_configs_of_running_downed_and_starting_envs(self):
+        self.directory = Path(tempfile.mkdtemp())
+        vedro.defer(shutil.rmtree, self.directory)
+        self.store = EnvConfigStore(self.directory)
+        self.running_digest = self.store.put(Environment('RUNNING', Service('web')))
+        self.downed_digest = self.store.put(Environment('DOWNED', Service('web')))
+        self.restarted_digest = self.store.put(Environment('RESTARTED', Service('web')))
+        self.starting_digest = self.store.put(Environment('STARTING', Service('web')))
+
+        hour_ago = time.time() - 3600
+        for digest in (self.running_digest, self.downed_digest, self.restarted_digest):
+            os.utime(self.directory / f'{digest}.pickle', (hour_ago, hour_ago))
+        # same config stored again for new env
+        self.store.put(Environment('RESTARTED', Service('web')))
+
+    async def when_garbage_collected(self):
+        self.removed = self.store.collect_garbage(referenced={self.running_digest}, min_age_s=60)
+
+    async def then_only_old_unreferenced_config_should_be_removed(self):
+        assert self.removed == [self.downed_digest]
+        assert sorted(path.stem for path in self.directory.iterdir()) == sorted(
+            [self.running_digest, self.restarted_digest, self.starting_digest]
+        )
+
+    async def and_removed_config_should_not_be_resolved(self):
+        assert self.store.get(self.downed_digest) is None
+        assert self.store.get(self.running_digest).get_services() == {'web': Service('web')}
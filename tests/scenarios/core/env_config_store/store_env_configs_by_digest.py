@@ -0,0 +1,35 @@
+import tempfile
+from pathlib import Path
+
+import vedro
+
+from maxwelld.core.env_config_store import EnvConfigStore
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class Scenario(vedro.Scenario):
+    async def given_store(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.store = EnvConfigStore(self.directory, lru_size=1)
+        self.environment = Environment('DEFAULT', Service('web'), Service('db'))
+
+    async def when_configs_put(self):
+        self.digest = self.store.put(self.environment)
+        self.other_digest = self.store.put(Environment('OTHER', Service('web')))
+
+    async def then_digest_should_be_short_and_stable(self):
+        assert len(self.digest) == 32
+        assert self.digest == EnvConfigStore.digest(self.environment)
+        assert self.digest != self.other_digest
+
+    async def and_config_evicted_from_memory_should_be_read_from_file(self):
+        assert self.store.get(self.digest).get_services() == self.environment.get_services()
+
+    async def and_other_store_over_same_directory_should_resolve_config(self):
+        assert EnvConfigStore(self.directory).get(self.other_digest).get_services() == {
+            'web': Service('web'),
+        }
+
+    async def and_unknown_digest_should_resolve_to_none(self):
+        assert self.store.get('0' * 32) is None
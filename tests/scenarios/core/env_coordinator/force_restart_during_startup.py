@@ -0,0 +1,53 @@
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+
+import vedro
+
+from maxwelld.core.env_coordinator import EnvCoordinator
+from maxwelld.core.service import MaxwellDemonService
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class SlowStartupService:
+    """
+    Real up_or_get_existing over env startups taking a while, records their force_restart
+    """
+    up_or_get_existing = MaxwellDemonService.up_or_get_existing
+    _resolve_up_request = MaxwellDemonService._resolve_up_request
+
+    def __init__(self, project_root: Path):
+        self.in_docker_project_root_path = project_root
+        self._env_coordinator = EnvCoordinator()
+        self.startups = []
+
+    async def _up_or_get_existing(self, name, config_template, compose_files, fingerprint, parallelism_limit,
+                                  verbose, force_restart, release_id, progress):
+        self.startups.append(force_restart)
+        env_id = f'{name}-{len(self.startups)}'
+        await asyncio.sleep(0.05)
+        return env_id, True
+
+
+class Scenario(vedro.Scenario):
+    async def given_service_starting_env(self):
+        self.root = Path(tempfile.mkdtemp())
+        vedro.defer(shutil.rmtree, self.root)
+        (self.root / 'docker-compose.yml').write_text('services:\n  web:\n    image: busybox\n')
+        self.service = SlowStartupService(self.root)
+
+    async def when_force_restart_requested_during_startup(self):
+        environment = Environment('dev', Service('web'))
+        self.env_ids = await asyncio.gather(
+            self.service.up_or_get_existing('dev', environment, 'docker-compose.yml'),
+            self.service.up_or_get_existing('dev', environment, 'docker-compose.yml', force_restart=True),
+            self.service.up_or_get_existing('dev', environment, 'docker-compose.yml', force_restart=True),
+        )
+
+    async def then_force_restart_should_not_join_not_restarted_startup(self):
+        assert self.service.startups == [False, True]
+
+    async def and_force_restarts_should_share_restarted_env(self):
+        assert self.env_ids == [('dev-1', True), ('dev-2', True), ('dev-2', True)]
@@ -0,0 +1,35 @@
+import asyncio
+
+import vedro
+
+from maxwelld.core.env_coordinator import EnvCoordinator
+from maxwelld.errors.up import ServicesUpError
+
+
+class Scenario(vedro.Scenario):
+    async def given_failing_startup(self):
+        self.coordinator = EnvCoordinator()
+        self.startups = 0
+
+        async def start():
+            self.startups += 1
+            await asyncio.sleep(0.01)
+            raise ServicesUpError("Can't up services ['web']")
+
+        self.start = start
+
+    async def when_env_requested_concurrently(self):
+        self.results = await asyncio.gather(
+            self.coordinator.join_or_start(('dev', 'fp'), self.start),
+            self.coordinator.join_or_start(('dev', 'fp'), self.start),
+            return_exceptions=True,
+        )
+
+    async def then_all_requests_should_get_startup_error(self):
+        assert self.startups == 1
+        assert all(isinstance(result, ServicesUpError) for result in self.results)
+
+    async def and_next_request_should_start_again(self):
+        with vedro.catched(ServicesUpError):
+            await self.coordinator.join_or_start(('dev', 'fp'), self.start)
+        assert self.startups == 2
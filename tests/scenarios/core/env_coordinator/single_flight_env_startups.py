@@ -0,0 +1,51 @@
+import asyncio
+
+import vedro
+
+from maxwelld.core.env_coordinator import EnvCoordinator
+
+
+class Scenario(vedro.Scenario):
+    async def given_coordinator(self):
+        self.coordinator = EnvCoordinator()
+        self.startups = []
+        self.running = 0
+        self.max_running = 0
+
+    async def given_slow_startup(self):
+        async def start(name):
+            self.startups.append(name)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            await asyncio.sleep(0.05)
+            self.running -= 1
+            return f'{name}-env', True
+
+        self.start = start
+
+    async def when_same_and_different_envs_requested_concurrently(self):
+        self.results = await asyncio.gather(
+            self.coordinator.join_or_start(('dev', 'fp1'), lambda: self.start('dev')),
+            self.coordinator.join_or_start(('dev', 'fp1'), lambda: self.start('dev')),
+            self.coordinator.join_or_start(('qa', 'fp2'), lambda: self.start('qa')),
+        )
+
+    async def then_same_env_should_start_once(self):
+        assert sorted(self.startups) == ['dev', 'qa']
+
+    async def and_startup_result_should_be_shared(self):
+        assert self.results == [
+            (('dev-env', True), False),
+            (('dev-env', True), True),
+            (('qa-env', True), False),
+        ]
+
+    async def and_different_envs_should_start_in_parallel(self):
+        assert self.max_running == 2
+
+    async def and_join_wait_should_be_recorded(self):
+        stats = self.coordinator.stats()
+        assert stats['in_flight'] == 0
+        assert stats['started'] == 2
+        assert stats['joined']['count'] == 1
+        assert stats['joined']['max_wait_s'] >= 0.04
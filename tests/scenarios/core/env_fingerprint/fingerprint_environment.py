@@ -0,0 +1,60 @@
+import tempfile
+from pathlib import Path
+
+import vedro
+
+from maxwelld.core.utils.env_fingerprint import make_env_fingerprint
+from maxwelld.env_description.env_types import Env
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import EventStage
+from maxwelld.env_description.env_types import Handler
+from maxwelld.env_description.env_types import Service
+
+MIGRATION = Handler(EventStage.AFTER_SERVICE_HEALTHY, 'migrate')
+
+
+class Scenario(vedro.Scenario):
+    async def given_compose_file(self):
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / 'docker-compose.yml').write_text('services:\n  web:\n    image: busybox\n')
+
+    async def given_environments(self):
+        self.environment = Environment(
+            'DEFAULT',
+            Service('web', Env(A='1', B='2'), [MIGRATION]),
+            Service('db'),
+        )
+        self.reordered_environment = Environment(
+            'DEFAULT',
+            Service('db'),
+            Service('web', Env(B='2', A='1'), [MIGRATION]),
+        )
+        self.changed_environment = Environment(
+            'DEFAULT',
+            Service('web', Env(A='1', B='3'), [MIGRATION]),
+            Service('db'),
+        )
+
+    async def when_fingerprints_made(self):
+        self.fingerprint = make_env_fingerprint(self.environment, 'docker-compose.yml', self.root)
+        self.reordered_fingerprint = make_env_fingerprint(self.reordered_environment, 'docker-compose.yml', self.root)
+        self.changed_fingerprint = make_env_fingerprint(self.changed_environment, 'docker-compose.yml', self.root)
+
+    async def then_fingerprint_should_not_depend_on_order(self):
+        assert self.fingerprint == self.reordered_fingerprint
+
+    async def and_fingerprint_should_change_with_service_env(self):
+        assert self.fingerprint != self.changed_fingerprint
+
+    async def and_fingerprint_should_change_with_compose_file_content(self):
+        (self.root / 'docker-compose.yml').write_text('services:\n  web:\n    image: alpine\n')
+        assert make_env_fingerprint(self.environment, 'docker-compose.yml', self.root) != self.fingerprint
+
+    async def and_fingerprint_should_reject_unsupported_env_values(self):
+        environment = Environment('DEFAULT', Service('web', Env(A=object())))
+        error = None
+        try:
+            make_env_fingerprint(environment, 'docker-compose.yml', self.root)
+        except TypeError as e:
+            error = e
+        assert error is not None
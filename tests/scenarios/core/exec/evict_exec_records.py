@@ -0,0 +1,29 @@
+import asyncio
+
+import vedro
+
+from maxwelld.core.exec_registry import ExecRegistry
+from maxwelld.helpers.exec_record import ExecRecord
+
+
+class Scenario(vedro.Scenario):
+    async def given_registry_full_of_records(self):
+        self.registry = ExecRegistry(limit=2, ttl_s=0.2)
+        self.registry.add(ExecRecord('exec1', 'env1', 'web', 'true', detached=True))
+        self.registry.add(ExecRecord('exec2', 'env2', 'web', 'true', detached=True))
+
+    async def given_oldest_record_accessed(self):
+        self.registry.get('exec1')
+
+    async def when_more_records_added(self):
+        self.registry.add(ExecRecord('exec3', 'env1', 'db', 'true', detached=False))
+        self.kept_uids = [exec_record.uid for exec_record in self.registry.list()]
+        await asyncio.sleep(0.3)
+        self.registry.add(ExecRecord('exec4', 'env1', 'db', 'true', detached=False))
+
+    async def then_least_recently_used_record_should_be_evicted(self):
+        assert self.kept_uids == ['exec1', 'exec3']
+
+    async def and_expired_records_should_be_forgotten(self):
+        assert [exec_record.uid for exec_record in self.registry.list()] == ['exec4']
+        assert self.registry.get('exec1') is None
@@ -0,0 +1,42 @@
+from pathlib import Path
+from uuid import uuid4
+
+import vedro
+
+from contexts.local_shell_executor import LocalExecService
+from maxwelld.helpers.exec_record import ExecRecord
+from maxwelld.helpers.exec_record import ExecStatus
+
+
+class Scenario(vedro.Scenario):
+    async def given_running_detached_exec_with_output(self):
+        self.service = LocalExecService()
+        self.exec_record = ExecRecord(str(uuid4()), 'env1', 'web', './worker.sh', detached=True)
+        self.service.execs.add(self.exec_record)
+        self.log_file, self.exit_code_file = Path(self.exec_record.log_file), Path(self.exec_record.exit_code_file)
+        vedro.defer(self.log_file.unlink, missing_ok=True)
+        vedro.defer(self.exit_code_file.unlink, missing_ok=True)
+        self.log_file.write_bytes(b'started\n')
+
+    async def given_output_polled(self):
+        self.first_output, _ = await self.service.get_exec_logs(self.exec_record.uid)
+        self.first_status = self.exec_record.status
+
+    async def given_command_exited_with_more_output(self):
+        with self.log_file.open('ab') as log_file:
+            log_file.write(b'done\n')
+        self.exit_code_file.write_bytes(b'3\n')
+
+    async def when_output_polled_from_offsets(self):
+        self.second_output, _ = await self.service.get_exec_logs(self.exec_record.uid, offset=len(self.first_output))
+        self.last_output, _ = await self.service.get_exec_logs(self.exec_record.uid, offset=len(b'started\ndone\n'))
+
+    async def then_only_new_output_should_be_read(self):
+        assert (self.first_output, self.second_output, self.last_output) == (b'started\n', b'done\n', b'')
+
+    async def and_exec_should_be_done_with_exit_code(self):
+        assert (self.first_status, self.exec_record.status) == (ExecStatus.RUNNING, ExecStatus.DONE)
+        assert self.exec_record.exit_code == 3
+
+    async def and_exited_exec_output_end_should_not_be_read_again(self):
+        assert len(self.service.executor.commands) == 2
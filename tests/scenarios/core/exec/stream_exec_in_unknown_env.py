@@ -0,0 +1,39 @@
+import aiohttp
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.core.utils.exec_output import ExecExit
+from maxwelld.server.commands import DC_EXEC_STREAM_PATH
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_single_env_command(self):
+        service = FakeMaxwellDemonService()
+        service.exec_events['./migrate.sh'] = [ExecExit(exit_code=0)]
+        self.server = await fake_maxwelld_server_started(service)
+
+    async def when_client_executes_command_in_unknown_env(self):
+        self.error = None
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            try:
+                async for _ in client.exec_stream('env2', 'web', './seed.sh'):
+                    ...
+            except ValueError as e:
+                self.error = e
+
+    async def and_command_stdin_is_not_base64(self):
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f'{self.server.host}:{self.server.port}{DC_EXEC_STREAM_PATH}', json={
+                'env_id': 'env1', 'container': 'web', 'command': './migrate.sh', 'stdin': 'a',
+            }) as response:
+                self.bad_stdin_status, self.bad_stdin_body = response.status, await response.json()
+
+    async def then_env_should_not_be_found(self):
+        assert str(self.error) == 'No such env2 environment to exec in'
+
+    async def and_bad_stdin_should_be_rejected_before_streaming(self):
+        assert self.bad_stdin_status == 400
+        assert self.bad_stdin_body['error'].startswith('Bad base64 stdin')
+        assert ('exec_stream', 'env1') not in self.server.service.calls
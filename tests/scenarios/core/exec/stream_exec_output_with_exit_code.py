@@ -0,0 +1,38 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.core.utils.exec_output import ExecExit
+from maxwelld.core.utils.exec_output import ExecOutput
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_command_output(self):
+        service = FakeMaxwellDemonService()
+        service.exec_events['./migrate.sh'] = [
+            ExecOutput('stdout', b'applying 0001\n'),
+            ExecOutput('stderr', b'warning: \xff not utf-8\n'),
+            ExecOutput('stdout', b'done'),
+            ExecExit(exit_code=3),
+        ]
+        self.server = await fake_maxwelld_server_started(service)
+
+    async def when_client_executes_command_with_stdin(self):
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            self.exec_events = [
+                exec_event async for exec_event in client.exec_stream('env1', 'web', './migrate.sh', stdin=b'yes\n')
+            ]
+            self.result = await client.exec_till_complete('env1', 'web', './migrate.sh', timeout=5)
+
+    async def then_output_chunks_should_come_in_order_ending_with_exit(self):
+        assert self.exec_events == [
+            ExecOutput('stdout', b'yes\n'),
+            ExecOutput('stdout', b'applying 0001\n'),
+            ExecOutput('stderr', b'warning: \xff not utf-8\n'),
+            ExecOutput('stdout', b'done'),
+            ExecExit(exit_code=3),
+        ]
+
+    async def and_collected_output_should_be_split_by_streams(self):
+        assert self.result == (ExecExit(exit_code=3), b'applying 0001\ndone', b'warning: \xff not utf-8\n')
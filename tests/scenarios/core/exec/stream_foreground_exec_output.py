@@ -0,0 +1,28 @@
+import vedro
+
+from contexts.local_shell_executor import LocalExecService
+from maxwelld.helpers.exec_record import ExecStatus
+
+
+class Scenario(vedro.Scenario):
+    async def given_service(self):
+        self.service = LocalExecService()
+
+    async def when_foreground_command_executed(self):
+        self.uid, self.output = await self.service.exec(
+            'env1', 'web', 'echo migrating; sleep 0.05; echo "no table" >&2; exit 2'
+        )
+
+    async def then_output_of_both_streams_should_be_returned(self):
+        assert self.output == b'migrating\nno table\n'
+
+    async def and_exit_code_should_be_recorded(self):
+        exec_record = self.service.execs.get(self.uid)
+        assert (exec_record.status, exec_record.exit_code) == (ExecStatus.DONE, 2)
+
+    async def and_command_should_run_as_is_without_output_files(self):
+        assert self.service.executor.commands == ['echo migrating; sleep 0.05; echo "no table" >&2; exit 2']
+
+    async def and_output_should_not_be_polled_from_container(self):
+        assert await self.service.get_exec_logs(self.uid) == (b'', self.service.execs.get(self.uid))
+        assert len(self.service.executor.commands) == 1
@@ -0,0 +1,34 @@
+import asyncio
+from contextlib import aclosing
+
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.core.utils.compose_logs import ComposeLogLine
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_env_logs(self):
+        service = FakeMaxwellDemonService()
+        service.log_lines['env1'] = [
+            ComposeLogLine('web', '2024-05-01T10:00:00Z', 'starting'),
+            ComposeLogLine('db', '2024-05-01T10:00:01Z', 'ready'),
+            ComposeLogLine('web', '2024-05-01T10:00:02Z', 'listening'),
+        ]
+        self.server = await fake_maxwelld_server_started(service)
+
+    async def when_client_follows_logs_tail(self):
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            async with aclosing(client.logs_stream('env1', tail=2, follow=True)) as log_lines:
+                self.log_lines = [await anext(log_lines), await anext(log_lines)]
+
+    async def then_last_interleaved_lines_should_be_received(self):
+        assert self.log_lines == [
+            ComposeLogLine('db', '2024-05-01T10:00:01Z', 'ready'),
+            ComposeLogLine('web', '2024-05-01T10:00:02Z', 'listening'),
+        ]
+
+    async def and_server_should_stop_following_after_client_left(self):
+        await asyncio.wait_for(self.server.service.logs_streams_closed.wait(), timeout=3)
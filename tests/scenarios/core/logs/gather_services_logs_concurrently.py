@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+import vedro
+
+from maxwelld.core.services_logs import gather_services_logs
+from maxwelld.helpers.jobs_result import JobResult
+from maxwelld.helpers.jobs_result import OperationError
+
+
+class Scenario(vedro.Scenario):
+    async def given_slow_services_logs(self):
+        self.running = 0
+        self.max_running = 0
+
+        async def get_logs(service):
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            await asyncio.sleep(0.1)
+            self.running -= 1
+            if service == 'broken':
+                return OperationError('no such service'), None
+            return JobResult.GOOD, f'{service} log\n'.encode()
+
+        self.get_logs = get_logs
+
+    async def when_logs_of_many_services_gathered(self):
+        started_at = time.monotonic()
+        self.logs = await gather_services_logs(
+            self.get_logs, ['s1', 's2', 's3', 'broken', 's4', 's5'], concurrency_limit=3
+        )
+        self.elapsed = time.monotonic() - started_at
+
+    async def then_logs_should_be_by_service(self):
+        assert self.logs == {
+            's1': b's1 log\n',
+            's2': b's2 log\n',
+            's3': b's3 log\n',
+            'broken': None,
+            's4': b's4 log\n',
+            's5': b's5 log\n',
+        }
+
+    async def and_logs_should_be_fetched_concurrently_within_limit(self):
+        assert self.max_running == 3
+        assert self.elapsed < 0.3
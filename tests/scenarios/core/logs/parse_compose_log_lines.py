@@ -0,0 +1,25 @@
+import vedro
+
+from maxwelld.core.utils.compose_logs import ComposeLogLine
+from maxwelld.core.utils.compose_logs import parse_compose_log_line
+
+
+class Scenario(vedro.Scenario):
+    async def given_compose_logs_output(self):
+        self.raw_lines = [
+            b'web-1  | 2024-05-01T10:00:00.123456789Z listening on :80\n',
+            b'db-4f2a-1    | 2024-05-01T10:00:01.000000000Z ready | accepting connections\n',
+            b'web-1  | no timestamp\n',
+            b'unprefixed line\n',
+        ]
+
+    async def when_lines_parsed(self):
+        self.log_lines = [parse_compose_log_line(raw_line) for raw_line in self.raw_lines]
+
+    async def then_services_timestamps_and_messages_should_be_split(self):
+        assert self.log_lines == [
+            ComposeLogLine('web', '2024-05-01T10:00:00.123456789Z', 'listening on :80'),
+            ComposeLogLine('db-4f2a', '2024-05-01T10:00:01.000000000Z', 'ready | accepting connections'),
+            ComposeLogLine('web', None, 'no timestamp'),
+            ComposeLogLine('', None, 'unprefixed line'),
+        ]
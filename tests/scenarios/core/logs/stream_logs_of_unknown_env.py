@@ -0,0 +1,22 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_without_env(self):
+        self.server = await fake_maxwelld_server_started(FakeMaxwellDemonService())
+
+    async def when_client_streams_logs_of_unknown_env(self):
+        self.error = None
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            try:
+                async for _ in client.logs_stream('env1'):
+                    ...
+            except ValueError as e:
+                self.error = e
+
+    async def then_env_should_not_be_found(self):
+        assert str(self.error) == 'No such env1 environment to stream logs of'
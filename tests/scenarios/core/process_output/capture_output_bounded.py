@@ -0,0 +1,38 @@
+import asyncio
+from asyncio import subprocess
+
+import vedro
+
+from maxwelld.core.utils.process_command_output import RingBufferCapture
+from maxwelld.core.utils.process_command_output import process_output_till_done
+
+
+class Scenario(vedro.Scenario):
+    async def given_chatty_process(self):
+        self.process = await asyncio.create_subprocess_shell(
+            'for i in $(seq 1 1000); do echo "line $i"; done; echo "error" >&2',
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self.stdout_capture = RingBufferCapture(max_bytes=100)
+        self.stderr_capture = RingBufferCapture(max_bytes=100)
+
+    async def when_output_captured(self):
+        self.stdout, self.stderr = await process_output_till_done(
+            self.process, False, self.stdout_capture, self.stderr_capture
+        )
+
+    async def then_stdout_should_be_last_lines_within_limit(self):
+        self.marker, output = self.stdout.split(b'\n', 1)
+        assert len(output) <= 100
+        assert output.endswith(b'line 999\nline 1000\n')
+        assert self.stdout_capture.truncated
+
+    async def and_truncation_should_be_marked(self):
+        dropped_bytes = self.stdout_capture.dropped_bytes
+        assert self.marker == f'[... {dropped_bytes} bytes of output dropped ...]'.encode()
+
+    async def and_output_within_limit_should_be_kept_as_is(self):
+        assert self.stderr == b'error\n'
+        assert not self.stderr_capture.truncated
+
@@ -0,0 +1,31 @@
+import asyncio
+from asyncio import subprocess
+
+import vedro
+
+from maxwelld.core.utils.process_command_output import MAX_LINE_SIZE
+from maxwelld.core.utils.process_command_output import iter_process_output
+
+
+class Scenario(vedro.Scenario):
+    async def given_process_printing_lines_over_reader_limit(self):
+        # default StreamReader limit is 64KiB
+        self.process = await asyncio.create_subprocess_shell(
+            f'head -c 200000 /dev/zero | tr "\\0" a; echo; head -c {MAX_LINE_SIZE + 10} /dev/zero | tr "\\0" b; '
+            'echo; echo next',
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    async def when_output_iterated(self):
+        self.lines = [output_line.line async for output_line in iter_process_output(self.process)]
+
+    async def then_long_line_should_come_whole(self):
+        assert self.lines[0] == b'a' * 200000 + b'\n'
+
+    async def and_line_over_max_size_should_come_in_parts(self):
+        assert self.lines[1:3] == [b'b' * MAX_LINE_SIZE, b'b' * 10 + b'\n']
+
+    async def and_output_should_be_read_till_end(self):
+        assert self.lines[3:] == [b'next\n']
+        assert self.process.returncode == 0
@@ -0,0 +1,29 @@
+import asyncio
+from asyncio import subprocess
+
+import vedro
+
+from maxwelld.core.utils.process_command_output import OutputLine
+from maxwelld.core.utils.process_command_output import iter_process_output
+
+
+class Scenario(vedro.Scenario):
+    async def given_process(self):
+        self.process = await asyncio.create_subprocess_shell(
+            'echo "out 1"; sleep 0.05; echo "err 1" >&2; sleep 0.05; echo "out 2"; exit 3',
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    async def when_output_iterated(self):
+        self.lines = [line async for line in iter_process_output(self.process)]
+
+    async def then_lines_should_come_in_order_with_stream_names(self):
+        assert self.lines == [
+            OutputLine('stdout', b'out 1\n'),
+            OutputLine('stderr', b'err 1\n'),
+            OutputLine('stdout', b'out 2\n'),
+        ]
+
+    async def and_process_should_be_done(self):
+        assert self.process.returncode == 3
@@ -0,0 +1,42 @@
+import asyncio
+import shutil
+import tempfile
+from asyncio import subprocess
+from pathlib import Path
+
+import vedro
+
+from maxwelld.core.utils.process_command_output import SpillToDiskCapture
+from maxwelld.core.utils.process_command_output import capture_output_till_done
+
+
+class Scenario(vedro.Scenario):
+    async def given_chatty_process(self):
+        self.directory = Path(tempfile.mkdtemp())
+        vedro.defer(shutil.rmtree, self.directory)
+        self.process = await asyncio.create_subprocess_shell(
+            'for i in $(seq 1 1000); do echo "line $i"; done; echo "error" >&2',
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self.stdout_capture = SpillToDiskCapture(threshold_bytes=100, directory=self.directory)
+        self.stderr_capture = SpillToDiskCapture(threshold_bytes=100, directory=self.directory)
+
+    async def when_output_captured_and_copied_to_file(self):
+        await capture_output_till_done(self.process, False, self.stdout_capture, self.stderr_capture)
+        self.stdout_capture.copy_to_file(self.directory / 'web.log')
+
+    async def then_output_over_threshold_should_be_spilled_whole(self):
+        expected_output = b''.join(f'line {i}\n'.encode() for i in range(1, 1001))
+        assert self.stdout_capture.spilled
+        assert (self.directory / 'web.log').read_bytes() == expected_output
+        assert self.stdout_capture.tail(19) == b'line 999\nline 1000\n'
+
+    async def and_output_within_threshold_should_stay_in_memory(self):
+        assert not self.stderr_capture.spilled
+        assert self.stderr_capture.getvalue() == b'error\n'
+
+    async def and_spilled_file_should_be_removed_on_close(self):
+        self.stdout_capture.close()
+        self.stderr_capture.close()
+        assert [path.name for path in self.directory.iterdir()] == ['web.log']
@@ -0,0 +1,35 @@
+import vedro
+
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.helpers.labels import Label
+
+
+class Scenario(vedro.Scenario):
+    async def given_services_of_two_envs(self):
+        self.lines = [
+            make_compose_ps_line('web-1', 'running', 'healthy', labels={Label.ENV_ID: 'env1'}),
+            make_compose_ps_line('db-1', 'running', 'healthy', labels={Label.ENV_ID: 'env1'}),
+            make_compose_ps_line('web-2', 'exited', exit_code=1, labels={Label.ENV_ID: 'env2'}),
+        ]
+        self.state = make_compose_state(self.lines)
+
+    async def when_state_looked_up(self):
+        self.env1_services = self.state.get_all_for_label(Label.ENV_ID, 'env1')
+        self.env2_service = self.state.get_any_for(Label.ENV_ID, 'env2')
+        self.unknown_service = self.state.get_any_for(Label.ENV_ID, 'env3')
+        self.db = self.state.get_by_name('db-1')
+
+    async def then_lookups_should_find_services(self):
+        assert [service.name for service in self.env1_services] == ['web-1', 'db-1']
+        assert self.env2_service.name == 'web-2'
+        assert self.unknown_service is None
+        assert self.db.name == 'db-1'
+
+    async def and_state_should_equal_shuffled_state(self):
+        assert self.state == make_compose_state(list(reversed(self.lines)))
+
+    async def and_state_should_differ_by_exit_code(self):
+        assert self.state != make_compose_state(self.lines[:2] + [
+            make_compose_ps_line('web-2', 'exited', exit_code=2, labels={Label.ENV_ID: 'env2'}),
+        ])
@@ -0,0 +1,41 @@
+import vedro
+
+from contexts.fake_state_backend import make_compose_ps_line
+from maxwelld.core.compose_data_types import ComposeState
+from maxwelld.core.compose_data_types import ServiceComposeState
+from maxwelld.core.compose_data_types import parse_labels
+from maxwelld.helpers.labels import Label
+
+
+class Scenario(vedro.Scenario):
+    async def given_service_state_with_labels(self):
+        self.labels = {
+            'com.docker.compose.service': 'web',
+            Label.ENV_ID: 'env1',
+            Label.REQUEST_ENV_NAME: 'default',
+            Label.ENV_CONFIG: 'gASVBgAAAAAAAACMAmVudpQu',
+        }
+        self.service_state = ServiceComposeState.from_json(
+            make_compose_ps_line('web', 'running', 'healthy', labels=self.labels)
+        )
+
+    async def when_labels_read(self):
+        self.env_id = self.service_state.get_label(Label.ENV_ID)
+        self.first_label = self.service_state.get_label('com.docker.compose.service')
+        self.unknown_label = self.service_state.get_label('com.maxwelld.unknown', 'default')
+        self.exited_state = self.service_state.replace(state=ComposeState.EXITED, exit_code=1)
+
+    async def then_single_labels_should_be_parsed(self):
+        assert self.env_id == 'env1'
+        assert self.first_label == 'web'
+        assert self.unknown_label == 'default'
+
+    async def and_full_labels_should_match_eager_parsing(self):
+        assert self.service_state.labels == parse_labels(
+            ','.join(f'{label}={value}' for label, value in self.labels.items())
+        )
+
+    async def and_replaced_state_should_keep_labels(self):
+        assert self.exited_state.state == ComposeState.EXITED
+        assert self.exited_state.get_label(Label.ENV_CONFIG) == self.labels[Label.ENV_CONFIG]
+        assert self.service_state.state == ComposeState.RUNNING
@@ -0,0 +1,36 @@
+import vedro
+from d42 import schema
+
+from contexts.fake_docker_engine import fake_docker_engine_started
+from contexts.fake_docker_engine import make_engine_container
+from maxwelld.core.state_backends import DockerEngineStateBackend
+from maxwelld.helpers.labels import Label
+
+
+class Scenario(vedro.Scenario):
+    async def given_docker_engine_with_multiple_envs(self):
+        self.engine = await fake_docker_engine_started([
+            make_engine_container(f's{service}-{env_id}', 'running', 'Up 5 seconds', {
+                'com.docker.compose.project': 'test-project',
+                Label.ENV_ID: env_id,
+            })
+            for env_id in ('aaaa', 'bbbb', 'cccc')
+            for service in range(3)
+        ])
+
+    async def given_state_backend(self):
+        self.backend = DockerEngineStateBackend(docker_host=self.engine.url, project='test-project')
+        vedro.defer(self.backend.close)
+
+    async def when_user_gets_env_services_state(self):
+        self.state = await self.backend.get_services_state(labels={Label.ENV_ID: 'bbbb'})
+
+    async def then_it_should_return_only_env_services(self):
+        assert [service.name for service in self.state] == schema.list([
+            schema.str('s0-bbbb'), schema.str('s1-bbbb'), schema.str('s2-bbbb'),
+        ])
+
+    async def and_it_should_pass_env_label_to_docker(self):
+        assert self.engine.requests[-1].query['filters'] == (
+            '{"label": ["com.docker.compose.project=test-project", "com.maxwelld.env_id=bbbb"]}'
+        )
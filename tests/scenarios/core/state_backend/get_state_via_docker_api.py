@@ -0,0 +1,58 @@
+import vedro
+from d42 import schema
+
+from contexts.fake_docker_engine import fake_docker_engine_started
+from contexts.fake_docker_engine import make_engine_container
+from maxwelld.core.compose_data_types import ServicesComposeState
+from maxwelld.core.state_backends import DockerEngineStateBackend
+
+
+class Scenario(vedro.Scenario):
+    async def given_docker_engine_with_project_containers(self):
+        self.engine = await fake_docker_engine_started([
+            make_engine_container('s1', 'running', 'Up 5 seconds (healthy)', {
+                'com.docker.compose.project': 'test-project',
+            }),
+            make_engine_container('s2', 'exited', 'Exited (3) 2 minutes ago', {
+                'com.docker.compose.project': 'test-project',
+            }),
+            make_engine_container('other', 'running', 'Up 1 hour', {
+                'com.docker.compose.project': 'other-project',
+            }),
+        ])
+
+    async def given_state_backend(self):
+        self.backend = DockerEngineStateBackend(docker_host=self.engine.url, project='test-project')
+        vedro.defer(self.backend.close)
+
+    async def when_user_gets_services_state_twice(self):
+        self.state = await self.backend.get_services_state()
+        self.state_again = await self.backend.get_services_state()
+
+    async def then_it_should_return_compose_state(self):
+        assert isinstance(self.state, ServicesComposeState)
+
+    async def and_it_should_contain_only_project_services(self):
+        assert self.state.as_json() == schema.list([
+            schema.dict({
+                'name': schema.str('s1'),
+                'state': schema.str('running'),
+                'exit_code': schema.int(0),
+                'health': schema.str('healthy'),
+                'status': schema.str,
+                'labels': schema.dict,
+            }),
+            schema.dict({
+                'name': schema.str('s2'),
+                'state': schema.str('exited'),
+                'exit_code': schema.int(3),
+                'health': schema.str(''),
+                'status': schema.str,
+                'labels': schema.dict,
+            }),
+        ])
+
+    async def and_it_should_filter_containers_by_project_label(self):
+        assert [request.query['filters'] for request in self.engine.requests] == [
+            '{"label": ["com.docker.compose.project=test-project"]}',
+        ] * 2
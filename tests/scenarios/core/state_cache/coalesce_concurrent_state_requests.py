@@ -0,0 +1,37 @@
+import asyncio
+
+import vedro
+from d42 import schema
+
+from contexts.fake_state_backend import fake_state_backend
+from maxwelld.core.state_cache import ServicesStateCache
+from maxwelld.helpers.labels import Label
+
+
+class Scenario(vedro.Scenario):
+    async def given_slow_state_backend(self):
+        self.backend = fake_state_backend(delay_s=0.1)
+
+    async def given_state_cache(self):
+        self.cache = ServicesStateCache(self.backend, ttl=60)
+
+    async def when_many_clients_request_env_state_at_once(self):
+        self.states = await asyncio.gather(*[
+            self.cache.get_services_state(labels={Label.ENV_ID: 'aaaa'})
+            for _ in range(20)
+        ])
+
+    async def then_it_should_query_backend_once(self):
+        assert self.backend.queries == schema.list([schema.dict({Label.ENV_ID: schema.str('aaaa')})])
+
+    async def and_it_should_return_same_state_for_all_clients(self):
+        assert len({id(state) for state in self.states}) == 1
+
+    async def and_it_should_count_coalesced_requests(self):
+        assert self.cache.stats() == schema.dict({
+            'hits': schema.int(0),
+            'coalesced': schema.int(19),
+            'misses': schema.int(1),
+            'cached_queries': schema.int(1),
+            'inflight_queries': schema.int(0),
+        })
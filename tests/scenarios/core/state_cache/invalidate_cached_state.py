@@ -0,0 +1,29 @@
+import vedro
+from d42 import schema
+
+from contexts.fake_state_backend import fake_state_backend
+from maxwelld.core.state_cache import ServicesStateCache
+
+
+class Scenario(vedro.Scenario):
+    async def given_state_backend(self):
+        self.backend = fake_state_backend(delay_s=0)
+
+    async def given_state_cache_with_cached_state(self):
+        self.cache = ServicesStateCache(self.backend, ttl=60)
+        await self.cache.get_services_state()
+        await self.cache.get_services_state()
+
+    async def when_cache_invalidated_after_up(self):
+        self.cache.invalidate()
+        await self.cache.get_services_state()
+
+    async def then_it_should_query_backend_again(self):
+        assert len(self.backend.queries) == 2
+
+    async def and_it_should_count_hits_and_misses(self):
+        assert self.cache.stats() == schema.dict({
+            'hits': schema.int(1),
+            'misses': schema.int(2),
+            ...: ...,
+        })
@@ -0,0 +1,45 @@
+import vedro
+
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.core.state_diff import TransitionKind
+from maxwelld.helpers.state_keeper import StateKeeper
+
+
+class Scenario(vedro.Scenario):
+    async def given_kept_services_state(self):
+        self.state_keeper = StateKeeper()
+        self.state_keeper.update_state(make_compose_state([
+            make_compose_ps_line('web', 'created'),
+            make_compose_ps_line('db', 'running', 'starting'),
+            make_compose_ps_line('worker', 'running'),
+            make_compose_ps_line('cache', 'running'),
+            make_compose_ps_line('old', 'running'),
+        ]))
+
+    async def when_next_state_diffed(self):
+        self.transitions = self.state_keeper.services_transitions(make_compose_state([
+            make_compose_ps_line('web', 'running'),
+            make_compose_ps_line('db', 'running', 'healthy'),
+            make_compose_ps_line('worker', 'exited', exit_code=1),
+            make_compose_ps_line('cache', 'running'),
+            make_compose_ps_line('new', 'created'),
+        ]))
+
+    async def then_only_changed_services_should_be_reported(self):
+        assert [str(transition) for transition in self.transitions] == [
+            'web: created → running',
+            'db: running(starting) → running(healthy)',
+            'worker: running → exited(1)',
+            'new: - → created',
+            'old: running → -',
+        ]
+
+    async def and_transitions_should_be_typed(self):
+        assert [transition.kind for transition in self.transitions] == [
+            TransitionKind.CHANGED,
+            TransitionKind.CHANGED,
+            TransitionKind.CHANGED,
+            TransitionKind.APPEARED,
+            TransitionKind.DISAPPEARED,
+        ]
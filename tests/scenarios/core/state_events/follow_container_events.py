@@ -0,0 +1,48 @@
+import vedro
+from d42 import schema
+
+from contexts.fake_events_source import ScriptedEventsSource
+from contexts.fake_events_source import make_container_event
+from contexts.fake_state_backend import fake_state_backend
+from contexts.fake_state_backend import make_compose_ps_line
+from maxwelld.core.state_events import ContainersStateIndex
+from maxwelld.core.state_events import ContainersStateWatcher
+from maxwelld.helpers.labels import Label
+
+
+class Scenario(vedro.Scenario):
+    async def given_env_services_starting(self):
+        self.backend = fake_state_backend([
+            make_compose_ps_line('s1', 'running', health='starting', labels={Label.ENV_ID: 'aaaa'}),
+            make_compose_ps_line('s2', 'running', labels={Label.ENV_ID: 'aaaa'}),
+        ], delay_s=0)
+
+    async def given_scripted_container_events(self):
+        self.events_source = ScriptedEventsSource([[
+            make_container_event('health_status: healthy', 's1', 'aaaa'),
+            make_container_event('die', 's2', 'aaaa', exitCode='1'),
+        ]])
+
+    async def given_watcher_started(self):
+        self.watcher = ContainersStateWatcher(ContainersStateIndex(), self.backend, self.events_source)
+        self.watcher.start()
+        vedro.defer(self.watcher.close)
+
+    async def when_events_applied(self):
+        while self.watcher.index.version < 3:
+            assert await self.watcher.index.wait_changed(timeout=1)
+
+    async def then_index_should_be_synced(self):
+        assert self.watcher.index.is_synced()
+
+    async def and_it_should_reflect_transitions_without_polling(self):
+        assert [
+            (service.name, service.state, service.health, service.exit_code)
+            for service in self.watcher.index.get_env_state('aaaa')
+        ] == [
+            ('s1', 'running', 'healthy', 0),
+            ('s2', 'exited', '', 1),
+        ]
+
+    async def and_it_should_query_full_state_once(self):
+        assert self.backend.queries == schema.list([schema.none])
@@ -0,0 +1,48 @@
+import vedro
+
+from contexts.fake_events_source import ScriptedEventsSource
+from contexts.fake_events_source import make_container_event
+from contexts.fake_state_backend import fake_state_backend
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.core.state_events import ContainersStateIndex
+from maxwelld.core.state_events import ContainersStateWatcher
+from maxwelld.helpers.labels import Label
+
+
+class Scenario(vedro.Scenario):
+    async def given_env_service_running(self):
+        self.backend = fake_state_backend([
+            make_compose_ps_line('s1', 'running', labels={Label.ENV_ID: 'aaaa'}),
+        ], delay_s=0)
+
+    async def given_events_stream_broken_after_first_event(self):
+        self.events_source = ScriptedEventsSource([
+            [make_container_event('health_status: unhealthy', 's1', 'aaaa')],
+            [],
+        ])
+
+    async def given_watcher_started(self):
+        self.watcher = ContainersStateWatcher(
+            ContainersStateIndex(), self.backend, self.events_source, reconnect_delay_s=0.01
+        )
+        self.watcher.start()
+        vedro.defer(self.watcher.close)
+        while self.watcher.index.version < 2:
+            assert await self.watcher.index.wait_changed(timeout=1)
+
+    async def when_service_exited_while_stream_was_down(self):
+        self.backend.state = make_compose_state([
+            make_compose_ps_line('s1', 'exited', exit_code=137, labels={Label.ENV_ID: 'aaaa'}),
+        ])
+        while self.watcher.index.version < 3:
+            assert await self.watcher.index.wait_changed(timeout=1)
+
+    async def then_it_should_resubscribe(self):
+        assert self.events_source.subscriptions == 2
+
+    async def and_it_should_resync_full_state(self):
+        assert [
+            (service.name, service.state, service.exit_code)
+            for service in self.watcher.index.get_env_state('aaaa')
+        ] == [('s1', 'exited', 137)]
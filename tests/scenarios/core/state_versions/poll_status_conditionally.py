@@ -0,0 +1,41 @@
+import aiohttp
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.server.commands import STATUS_PATH
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_changing_env_state(self):
+        self.starting_state = make_compose_state([make_compose_ps_line('web', 'created')])
+        self.running_state = make_compose_state([make_compose_ps_line('web', 'running')])
+        self.server = await fake_maxwelld_server_started(FakeMaxwellDemonService(states_sequences={
+            'env1': [self.starting_state, self.starting_state, self.starting_state, self.running_state],
+        }))
+
+    async def when_status_polled_with_etag(self):
+        url = f'{self.server.host}:{self.server.port}{STATUS_PATH}'
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, json={'id': 'env1'}) as response:
+                etag = response.headers['ETag']
+                self.first_version = response.headers['X-State-Version']
+            async with session.get(url, json={'id': 'env1'}, headers={'If-None-Match': etag}) as response:
+                self.not_modified = response.status
+            async with session.get(url, json={'id': 'env1', 'since_version': 1}) as response:
+                self.since_version_not_modified = response.status
+            async with session.get(url, json={'id': 'env1'}, headers={'If-None-Match': etag}) as response:
+                self.changed = response.status
+                self.changed_version = response.headers['X-State-Version']
+
+    async def then_unchanged_state_should_not_be_sent(self):
+        assert self.first_version == '1'
+        assert self.not_modified == 304
+        assert self.since_version_not_modified == 304
+
+    async def and_changed_state_should_be_sent_with_new_version(self):
+        assert self.changed == 200
+        assert self.changed_version == '2'
+
@@ -0,0 +1,25 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_unchanged_env_state(self):
+        self.state = make_compose_state([make_compose_ps_line('web', 'running')])
+        self.server = await fake_maxwelld_server_started(FakeMaxwellDemonService(statuses={'env1': self.state}))
+
+    async def when_client_polls_status(self):
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            self.statuses = [await client.status('env1') for _ in range(3)]
+            self.connections_stats = client.connections_stats.as_json()
+
+    async def then_statuses_should_be_same(self):
+        assert self.statuses == [self.state] * 3
+
+    async def and_unchanged_state_should_not_be_transferred_again(self):
+        assert self.connections_stats['requests'] == 3
+        assert self.connections_stats['not_modified'] == 2
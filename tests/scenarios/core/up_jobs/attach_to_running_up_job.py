@@ -0,0 +1,67 @@
+import asyncio
+
+import vedro
+
+from maxwelld.core.up_jobs import UpJobStatus
+from maxwelld.core.up_jobs import UpJobsRegistry
+
+
+class Scenario(vedro.Scenario):
+    async def given_running_up_job(self):
+        self.registry = UpJobsRegistry(finished_jobs_limit=1)
+        self.release = asyncio.Event()
+        self.runs = 0
+
+        async def run(progress):
+            self.runs += 1
+            progress.tiers_planned(2)
+            progress.tier_started(['db'])
+            progress.tier_done()
+            progress.tier_started(['web'])
+            progress.migration_started('web', 'migrate')
+            await self.release.wait()
+            progress.migration_done()
+            progress.tier_done()
+            return 'env1', True
+
+        self.job, self.attached = self.registry.start(key=('dev', 'fp'), name='dev', run=run)
+        await asyncio.sleep(0)
+
+    async def when_same_env_requested_again(self):
+        self.same_job, self.same_attached = self.registry.start(key=('dev', 'fp'), name='dev', run=None)
+        self.progress = self.job.as_json()['progress']
+
+    async def then_request_should_attach_to_running_job(self):
+        assert self.same_job is self.job
+        assert (self.attached, self.same_attached) == (False, True)
+
+    async def and_progress_should_be_reported(self):
+        assert self.progress == {
+            'tier': 2,
+            'tiers_total': 2,
+            'tier_services': ['web'],
+            'migration': 'web: migrate',
+            'percent': 50,
+        }
+
+    async def and_finished_job_should_be_kept_with_result(self):
+        version = self.job.version
+        self.release.set()
+        assert await self.job.wait_changed(version, timeout=1)
+        await self.job.task
+
+        assert self.registry.get(self.job.job_id) is self.job
+        assert self.job.status == UpJobStatus.DONE
+        assert (self.job.env_id, self.job.is_new, self.runs) == ('env1', True, 1)
+        assert self.job.as_json()['timings']['duration_s'] >= 0
+
+    async def and_history_should_be_limited(self):
+        async def run(progress):
+            raise AssertionError('no compose files')
+
+        failed_job, _ = self.registry.start(key=('qa', 'fp'), name='qa', run=run)
+        await failed_job.task
+
+        assert failed_job.status == UpJobStatus.FAILED
+        assert 'no compose files' in failed_job.error
+        assert self.registry.list() == [failed_job]
@@ -0,0 +1,49 @@
+import asyncio
+
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_starting_env_in_tiers(self):
+        async def up_run(name, progress):
+            progress.tiers_planned(2)
+            for tier in (['db'], ['web']):
+                progress.tier_started(tier)
+                await asyncio.sleep(0.05)
+                progress.tier_done()
+            return f'{name}-env', True
+
+        service = FakeMaxwellDemonService()
+        service.up_run = up_run
+        self.server = await fake_maxwelld_server_started(service)
+
+    async def when_two_clients_up_same_env_as_job(self):
+        self.progress = []
+
+        async def on_progress(job):
+            self.progress.append(job['progress']['percent'])
+
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            self.env_ids = await asyncio.gather(
+                client.up('dev', Environment('dev', Service('web')), 'docker-compose.yml',
+                          as_job=True, on_progress=on_progress),
+                client.up('dev', Environment('dev', Service('web')), 'docker-compose.yml', as_job=True),
+            )
+
+    async def then_both_should_get_env(self):
+        assert self.env_ids == ['dev-env', 'dev-env']
+
+    async def and_env_should_be_started_once(self):
+        jobs = self.server.service.up_jobs.list()
+        assert len(jobs) == 1
+        assert jobs[0].attached == 1
+
+    async def and_progress_should_be_followed_till_done(self):
+        assert self.progress[-1] == 100
+        assert self.progress == sorted(self.progress)
@@ -0,0 +1,59 @@
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+
+import vedro
+
+from maxwelld.core.service import MaxwellDemonService
+from maxwelld.core.up_jobs import UpJobsRegistry
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class SlowUpJobsService:
+    """
+    Real start_up_job over env startups waiting for release
+    """
+    start_up_job = MaxwellDemonService.start_up_job
+    _resolve_up_request = MaxwellDemonService._resolve_up_request
+
+    def __init__(self, project_root: Path):
+        self.in_docker_project_root_path = project_root
+        self.up_jobs = UpJobsRegistry()
+        self.released = asyncio.Event()
+
+    async def up_or_get_existing(self, name, *args, **kwargs):
+        await self.released.wait()
+        return name, True
+
+
+class Scenario(vedro.Scenario):
+    async def given_service_running_up_job(self):
+        self.root = Path(tempfile.mkdtemp())
+        vedro.defer(shutil.rmtree, self.root)
+        (self.root / 'docker-compose.yml').write_text('services:\n  web:\n    image: busybox\n')
+        self.service = SlowUpJobsService(self.root)
+        self.environment = Environment('dev', Service('web'))
+        self.job, _ = self.service.start_up_job('dev', self.environment, 'docker-compose.yml')
+
+    async def when_force_restart_jobs_requested(self):
+        self.restart_job, self.restart_attached = self.service.start_up_job(
+            'dev', self.environment, 'docker-compose.yml', force_restart=True
+        )
+        self.same_restart_job, self.same_restart_attached = self.service.start_up_job(
+            'dev', self.environment, 'docker-compose.yml', force_restart=True
+        )
+
+    async def then_force_restart_should_not_attach_to_running_job(self):
+        assert self.restart_job is not self.job
+        assert not self.restart_attached
+
+    async def and_force_restarts_should_share_job(self):
+        assert self.same_restart_job is self.restart_job
+        assert self.same_restart_attached
+
+    async def and_jobs_should_finish(self):
+        self.service.released.set()
+        await asyncio.gather(self.job.task, self.restart_job.task)
+        await self.service.up_jobs.close()
@@ -0,0 +1,30 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+from maxwelld.errors.up import ServicesUpError
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_failing_to_start_up_job(self):
+        service = FakeMaxwellDemonService()
+        service.up_job_start_error = AssertionError('no compose files')
+        self.server = await fake_maxwelld_server_started(service)
+
+    async def when_client_ups_env_as_job(self):
+        self.error = None
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            try:
+                await client.up('dev', Environment('dev', Service('web')), 'docker-compose.yml', as_job=True)
+            except ServicesUpError as e:
+                self.error = e
+
+    async def then_client_should_get_up_error(self):
+        assert self.error is not None
+        assert 'no compose files' in str(self.error)
+
+    async def and_no_job_should_be_started(self):
+        assert self.server.service.up_jobs.list() == []
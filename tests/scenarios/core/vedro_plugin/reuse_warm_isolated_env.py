@@ -0,0 +1,47 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from contexts.fake_state_backend import make_compose_state
+from contexts.fake_state_backend import make_isolated_env_ps_line
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.core.sequence_run_types import ComposeConfig
+from maxwelld.core.utils.compose_instance_cfg import make_env_instance_config
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+from maxwelld.vedro_plugin.plugin import VedroMaxwell
+from maxwelld.vedro_plugin.plugin import VedroMaxwellPlugin
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_ready_isolated_env(self):
+        self.template = Environment('dev', Service('db'), Service('web'))
+        self.server = await fake_maxwelld_server_started(FakeMaxwellDemonService(
+            environments={'a1b2': make_env_instance_config(self.template, 'a1b2').env},
+            statuses={'a1b2': make_compose_state([
+                make_isolated_env_ps_line('db', 'a1b2', 'running'),
+                make_isolated_env_ps_line('web', 'a1b2', 'running'),
+            ])},
+        ))
+
+    async def given_plugin_started_env_for_previous_scenario(self):
+        self.client = MaxwellDemonClient(self.server.host, self.server.port)
+
+        class Config(VedroMaxwell):
+            enabled = True
+            maxwell_demon_client = self.client
+            compose_cfgs = {'default': ComposeConfig('docker-compose.yml')}
+
+        self.plugin = VedroMaxwellPlugin(Config)
+        self.plugin._lats_env_name_started = 'dev'
+        self.plugin._lats_env_id_started = 'a1b2'
+
+    async def when_next_scenario_needs_same_env(self):
+        self.env_id = await self.plugin._get_warm_env_id('dev', self.template)
+        await self.client.close()
+
+    async def then_warm_env_should_be_reused(self):
+        assert self.env_id == 'a1b2'
+
+    async def and_env_state_should_be_got_with_single_request(self):
+        assert self.server.service.calls == [('env', 'a1b2'), ('status', 'a1b2')]
@@ -0,0 +1,53 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from contexts.fake_state_backend import make_compose_state
+from contexts.fake_state_backend import make_isolated_env_ps_line
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.core.sequence_run_types import ComposeConfig
+from maxwelld.core.utils.compose_instance_cfg import make_env_instance_config
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+from maxwelld.helpers.jobs_result import JobResult
+from maxwelld.vedro_plugin.logger import WaitVerbosity
+from maxwelld.vedro_plugin.plugin import VedroMaxwell
+from maxwelld.vedro_plugin.plugin import VedroMaxwellPlugin
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_started_env(self):
+        self.server = await fake_maxwelld_server_started(FakeMaxwellDemonService(
+            environments={'a1b2': make_env_instance_config(Environment('dev', Service('web')), 'a1b2').env},
+            statuses={'a1b2': make_compose_state([make_isolated_env_ps_line('web', 'a1b2', 'running')])},
+        ))
+
+    async def given_plugin_with_custom_waiter(self):
+        self.checked_services = checked_services = []
+
+        class CustomWaiter:
+            # no timeout_s: only make_checker is required from waiter
+            def make_checker(self):
+                async def check(get_services_state, services, verbose):
+                    await get_services_state()
+                    checked_services.append(list(services))
+                    return JobResult.GOOD
+                return check
+
+        self.client = MaxwellDemonClient(self.server.host, self.server.port)
+
+        class Config(VedroMaxwell):
+            enabled = True
+            maxwell_demon_client = self.client
+            compose_cfgs = {'default': ComposeConfig('docker-compose.yml')}
+            wait_all_service_func = CustomWaiter()
+
+        self.plugin = VedroMaxwellPlugin(Config)
+
+    async def when_plugin_waits_for_env(self):
+        await self.plugin.wait_env_ready('a1b2', WaitVerbosity.ON_ERROR)
+        await self.client.close()
+
+    async def then_custom_waiter_should_check_env_services(self):
+        assert self.checked_services == [['web']]
+        assert ('status', 'a1b2') in self.server.service.calls
@@ -0,0 +1,51 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.core.readiness import ReadinessResult
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_failing_env(self):
+        self.server = await fake_maxwelld_server_started(FakeMaxwellDemonService(
+            environments={'env1': Environment('dev', Service('db'), Service('web'))},
+            states_sequences={
+                'env1': [
+                    make_compose_state([
+                        make_compose_ps_line('db', 'running'),
+                        make_compose_ps_line('web', 'created'),
+                    ]),
+                    make_compose_state([
+                        make_compose_ps_line('db', 'running'),
+                        make_compose_ps_line('web', 'exited', exit_code=1),
+                    ]),
+                ],
+            },
+        ))
+
+    async def when_client_waits_with_transitions_stream(self):
+        self.transitions = []
+
+        async def on_transition(transition):
+            self.transitions.append(str(transition))
+
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            self.result, self.status = await client.wait(
+                'env1', services=['db', 'web'], timeout=5, on_transition=on_transition
+            )
+
+    async def then_services_should_be_failed(self):
+        assert self.result == ReadinessResult.FAILED
+        assert self.status.get_by_name('web').exit_code == 1
+
+    async def and_transitions_should_be_streamed(self):
+        assert self.transitions == [
+            'db: - → running',
+            'web: - → created',
+            'web: created → exited(1)',
+        ]
@@ -0,0 +1,45 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from contexts.fake_state_backend import make_compose_state
+from contexts.fake_state_backend import make_isolated_env_ps_line
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.core.readiness import ReadinessResult
+from maxwelld.core.utils.compose_instance_cfg import make_env_instance_config
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_isolated_envs(self):
+        template = Environment('dev', Service('db'), Service('web'))
+        self.server = await fake_maxwelld_server_started(FakeMaxwellDemonService(
+            environments={
+                'a1b2': make_env_instance_config(template, 'a1b2').env,
+                'c3d4': make_env_instance_config(template, 'c3d4').env,
+            },
+            statuses={
+                'a1b2': make_compose_state([
+                    make_isolated_env_ps_line('db', 'a1b2', 'running'),
+                    make_isolated_env_ps_line('web', 'a1b2', 'running'),
+                ]),
+                'c3d4': make_compose_state([
+                    make_isolated_env_ps_line('db', 'c3d4', 'running'),
+                    make_isolated_env_ps_line('web', 'c3d4', 'exited', exit_code=1),
+                ]),
+            },
+        ))
+
+    async def when_client_waits_for_envs_services_by_template_names(self):
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            self.ready_result, _ = await client.wait('a1b2', timeout=5)
+            self.failed_result, _ = await client.wait('c3d4', services=['db', 'web'], timeout=5)
+            self.env_state = await client.env_state('a1b2')
+
+    async def then_suffixed_containers_should_be_matched_to_services(self):
+        assert self.ready_result == ReadinessResult.READY
+        assert self.env_state.readiness == ReadinessResult.READY
+
+    async def and_failed_service_should_be_reported(self):
+        assert self.failed_result == ReadinessResult.FAILED
@@ -0,0 +1,46 @@
+import vedro
+
+from contexts.fake_maxwelld_server import FakeMaxwellDemonService
+from contexts.fake_maxwelld_server import fake_maxwelld_server_started
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.client.maxwell_client import MaxwellDemonClient
+from maxwelld.core.readiness import ReadinessResult
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import Service
+
+
+class Scenario(vedro.Scenario):
+    async def given_server_with_starting_env(self):
+        self.ready_state = make_compose_state([
+            make_compose_ps_line('db', 'running', health='healthy'),
+            make_compose_ps_line('web', 'running'),
+        ])
+        self.server = await fake_maxwelld_server_started(FakeMaxwellDemonService(
+            environments={'env1': Environment('dev', Service('db'), Service('web'))},
+            states_sequences={
+                'env1': [
+                    make_compose_state([make_compose_ps_line('db', 'created')]),
+                    make_compose_state([
+                        make_compose_ps_line('db', 'running', health='starting'),
+                        make_compose_ps_line('web', 'created'),
+                    ]),
+                    self.ready_state,
+                ],
+            },
+        ))
+
+    async def when_client_waits_for_services(self):
+        async with MaxwellDemonClient(self.server.host, self.server.port) as client:
+            self.result, self.status = await client.wait('env1', services=['db', 'web'], timeout=5)
+            self.connections_stats = client.connections_stats.as_json()
+
+    async def then_services_should_be_ready(self):
+        assert self.result == ReadinessResult.READY
+        assert self.status == self.ready_state
+
+    async def and_client_should_make_single_request(self):
+        assert self.connections_stats['requests'] == 1
+
+    async def and_server_should_check_state_till_ready(self):
+        assert self.server.service.calls == [('env', 'env1')] + [('status', 'env1')] * 3
@@ -0,0 +1,23 @@
+import vedro
+
+from maxwelld.helpers.wire_format import JSON_WIRE_CONTENT_TYPE
+from maxwelld.helpers.wire_format import negotiate_wire_content_type
+
+
+class Scenario(vedro.Scenario):
+    subject = 'negotiate wire content type for Accept: {accept}'
+
+    @vedro.params(None, None)
+    @vedro.params('application/json', None)
+    @vedro.params('*/*', None)
+    @vedro.params(f'{JSON_WIRE_CONTENT_TYPE}, application/json', JSON_WIRE_CONTENT_TYPE)
+    @vedro.params(f'application/vnd.maxwelld.v999+json, {JSON_WIRE_CONTENT_TYPE};q=0.5', JSON_WIRE_CONTENT_TYPE)
+    def __init__(self, accept, content_type):
+        self.accept = accept
+        self.content_type = content_type
+
+    async def when_content_type_negotiated(self):
+        self.result = negotiate_wire_content_type(self.accept)
+
+    async def then_it_should_be_first_supported_or_legacy(self):
+        assert self.result == self.content_type
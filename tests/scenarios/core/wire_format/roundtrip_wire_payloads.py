@@ -0,0 +1,59 @@
+import vedro
+
+from contexts.fake_state_backend import make_compose_ps_line
+from contexts.fake_state_backend import make_compose_state
+from maxwelld.env_description.env_types import AsIs
+from maxwelld.env_description.env_types import Env
+from maxwelld.env_description.env_types import Environment
+from maxwelld.env_description.env_types import EventStage
+from maxwelld.env_description.env_types import Handler
+from maxwelld.env_description.env_types import Service
+from maxwelld.env_description.env_types import ServiceMode
+from maxwelld.helpers.labels import Label
+from maxwelld.helpers.wire_format import JSON_WIRE_CONTENT_TYPE
+from maxwelld.helpers.wire_format import decode_wire
+from maxwelld.helpers.wire_format import encode_wire
+from maxwelld.helpers.wire_format import environment_as_wire
+from maxwelld.helpers.wire_format import environment_from_wire
+from maxwelld.helpers.wire_format import services_state_as_wire
+from maxwelld.helpers.wire_format import services_state_from_wire
+
+
+class Scenario(vedro.Scenario):
+    async def given_payload(self):
+        self.environment = Environment(
+            'DEFAULT',
+            Service('web', Env(DB_HOST='[[db]]', RAW=AsIs('{{not_template}}')), [
+                Handler(EventStage.AFTER_SERVICE_HEALTHY, 'migrate', executor='db'),
+            ]),
+            Service('db', mode=ServiceMode.SINGLETON),
+        )
+        self.status = make_compose_state([
+            make_compose_ps_line('web', 'running', 'healthy', labels={Label.ENV_ID: 'env1'}),
+        ])
+        self.logs = {'web': b'\x00\xffbinary log\n'}
+
+    async def when_payload_sent_over_json_wire_format(self):
+        body = encode_wire({
+            'env': environment_as_wire(self.environment),
+            'status': services_state_as_wire(self.status),
+            'logs': self.logs,
+        }, JSON_WIRE_CONTENT_TYPE)
+        self.received = decode_wire(body, JSON_WIRE_CONTENT_TYPE)
+
+    async def then_environment_should_be_restored(self):
+        environment = environment_from_wire(self.received['env'])
+        assert str(environment) == 'DEFAULT'
+        web = environment['web']
+        assert web.env['DB_HOST'] == '[[db]]'
+        assert isinstance(web.env['RAW'], AsIs) and web.env['RAW'].value == '{{not_template}}'
+        assert web.events_handlers == [Handler(EventStage.AFTER_SERVICE_HEALTHY, 'migrate', executor='db')]
+        assert environment['db'].mode == ServiceMode.SINGLETON
+
+    async def and_status_should_be_restored(self):
+        status = services_state_from_wire(self.received['status'])
+        assert status == self.status
+        assert status.get_any_for(Label.ENV_ID, 'env1').name == 'web'
+
+    async def and_logs_bytes_should_be_restored(self):
+        assert self.received['logs'] == self.logs
@@ -18,7 +18,8 @@ LabelsSchema = schema.dict({
     Label.COMPOSE_FILES: schema.str,
     Label.COMPOSE_FILES_INSTANCE: schema.str,
 
-    Label.ENV_CONFIG_TEMPLATE: schema.str,
-    Label.ENV_CONFIG: schema.str,
+    Label.ENV_CONFIG_TEMPLATE_DIGEST: schema.str.len(32),
+    Label.ENV_CONFIG_DIGEST: schema.str.len(32),
+    Label.ENV_FINGERPRINT: schema.str.len(32),
     ...: ...,
 })